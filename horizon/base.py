@@ -44,6 +44,7 @@ from horizon.decorators import _current_component  # noqa
 from horizon.decorators import require_auth  # noqa
 from horizon.decorators import require_perms  # noqa
 from horizon import loaders
+from horizon.utils import startup
 
 
 # Name of the panel group for panels to be displayed without a group.
@@ -528,13 +529,16 @@ class Dashboard(Registry, HorizonComponent):
                 default_panel = panel
                 continue
             url_slug = panel.slug.replace('.', '/')
-            urlpatterns.append(url(r'^%s/' % url_slug,
-                                   include(panel._decorated_urls)))
+            with startup.timed('URLs of %s' % panel.slug):
+                urlpatterns.append(url(r'^%s/' % url_slug,
+                                       include(panel._decorated_urls)))
         # Now the default view, which should come last
         if not default_panel:
             raise NotRegistered('The default panel "%s" is not registered.'
                                 % self.default_panel)
-        urlpatterns.append(url(r'', include(default_panel._decorated_urls)))
+        with startup.timed('URLs of %s' % default_panel.slug):
+            urlpatterns.append(url(r'',
+                                   include(default_panel._decorated_urls)))
 
         # Require login if not public.
         if not self.public:
@@ -825,14 +829,17 @@ class Site(Registry, HorizonComponent):
     def _urls(self):
         """Constructs the URLconf for Horizon from registered Dashboards."""
         urlpatterns = self._get_default_urlpatterns()
-        self._autodiscover()
+        with startup.timed('dashboards autodiscovery'):
+            self._autodiscover()
 
         # Discover each dashboard's panels.
         for dash in self._registry.values():
-            dash._autodiscover()
+            with startup.timed('panels autodiscovery of %s' % dash.slug):
+                dash._autodiscover()
 
         # Load the plugin-based panel configuration
-        self._load_panel_customization()
+        with startup.timed('panel customization'):
+            self._load_panel_customization()
 
         # Allow for override modules
         if self._conf.get("customization_module", None):
@@ -851,8 +858,9 @@ class Site(Registry, HorizonComponent):
 
         # Compile the dynamic urlconf.
         for dash in self._registry.values():
-            urlpatterns.append(url(r'^%s/' % dash.slug,
-                                   include(dash._decorated_urls)))
+            with startup.timed('URLs of %s' % dash.slug):
+                urlpatterns.append(url(r'^%s/' % dash.slug,
+                                       include(dash._decorated_urls)))
 
         # Return the three arguments to django.conf.urls.include
         return urlpatterns, self.namespace, self.slug
@@ -873,7 +881,8 @@ class Site(Registry, HorizonComponent):
                 mod = import_module(app)
                 try:
                     before_import_registry = copy.copy(self._registry)
-                    import_module('%s.%s' % (app, mod_name))
+                    with startup.timed('import %s.%s' % (app, mod_name)):
+                        import_module('%s.%s' % (app, mod_name))
                 except Exception:
                     self._registry = before_import_registry
                     if module_has_submodule(mod, mod_name):
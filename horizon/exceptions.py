@@ -145,6 +145,17 @@ class GetFileError(HorizonException):
         return self.msg % self.attrs
 
 
+@six.python_2_unicode_compatible
+class TemplateCycleError(HorizonException):
+    """Exception to be raised when nested templates include each other."""
+    def __init__(self, urls):
+        self.urls = urls
+
+    def __str__(self):
+        return _('The nested templates %s include each other.') % \
+            ' -> '.join(self.urls)
+
+
 class ConfigurationError(HorizonException):
     """Exception to be raised when invalid settings have been provided."""
     pass
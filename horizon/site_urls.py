@@ -31,6 +31,10 @@ urlpatterns = [
 
 # Client-side i18n URLconf.
 urlpatterns.extend([
+    url(r'^i18n/js/(?P<packages>\S+?)/(?P<language>[\w-]+)\.'
+        r'(?P<digest>[0-9a-f]+)\.js$',
+        views.javascript_catalog,
+        name='jsi18n_versioned'),
     url(r'^i18n/js/(?P<packages>\S+?)/$',
         i18n.javascript_catalog,
         name='jsi18n'),
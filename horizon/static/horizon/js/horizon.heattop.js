@@ -176,17 +176,29 @@ function build_reverse_links(node){
 
 function ajax_poll(poll_time){
   setTimeout(function() {
-    $.getJSON(ajax_url, function(json) {
-      //update d3 data element
-      $("#d3_data").attr("data-d3_data", JSON.stringify(json));
+    //Ask only for the nodes changed since the last version we have seen,
+    //an unchanged topology is answered with 304 Not Modified.
+    $.ajax({
+      url: ajax_url,
+      data: {since: version},
+      dataType: 'json',
+      ifModified: true
+    }).done(function(json, textStatus) {
+      if (textStatus === 'notmodified' || !json) { return; }
+      version = json.version;
 
       //update stack
       $("#stack_box").html(json.stack.info_box);
-      set_in_progress(json.stack, json.nodes);
       needs_update = false;
 
       //Check Remove nodes
-      remove_nodes(nodes, json.nodes);
+      if (json.delta === true) {
+        json.removed.forEach(function(name) {
+          if (findNode(name)) { removeNode(name); }
+        });
+      } else {
+        remove_nodes(nodes, json.nodes);
+      }
 
       //Check for updates and new nodes
       json.nodes.forEach(function(d){
@@ -223,6 +235,7 @@ function ajax_poll(poll_time){
 
           //Status has changed, update info_box
           current_node.info_box = d.info_box;
+          current_node.in_progress = d.in_progress;
 
         } else {
           addNode(d);
@@ -230,6 +243,9 @@ function ajax_poll(poll_time){
         }
       });
 
+      in_progress = false;
+      set_in_progress(json.stack, nodes);
+
       //if any updates needed, do update now
       if (needs_update === true){
         update();
@@ -248,6 +264,7 @@ if ($(container).length){
     stack_id = $("#stack_id").data("stack_id"),
     ajax_url = '/project/stacks/get_d3_data/' + stack_id + '/',
     graph = $("#d3_data").data("d3_data"),
+    version = graph.version,
     force = d3.layout.force()
       .nodes(graph.nodes)
       .links([])
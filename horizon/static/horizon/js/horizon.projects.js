@@ -0,0 +1,71 @@
+/* Project list of the context selection menu.
+ *
+ * Only the current and the recent projects are rendered with the page; the
+ * other projects of the user are searched for and loaded page by page from
+ * the REST API when the search box is used or "More projects" clicked.
+ */
+horizon.projects = {
+  SEARCH_DELAY: 300,
+
+  load: function ($list, search, page) {
+    var request_id = ($list.data('request_id') || 0) + 1;
+    $list.data('request_id', request_id);
+    $.getJSON($list.data('search-url'), {search: search, page: page})
+      .done(function (data) {
+        // Ignore responses to outdated searches.
+        if ($list.data('request_id') !== request_id) {
+          return;
+        }
+        if (page === 1) {
+          $list.find('.project-list-result').remove();
+        }
+        horizon.projects.render($list, data.items);
+        $list.find('.project-list-more')
+          .toggle(data.has_more)
+          .data({search: search, page: page + 1});
+      });
+  },
+
+  render: function ($list, projects) {
+    var $more = $list.find('.project-list-more');
+    var current = String($list.data('project-id'));
+    var switch_url = $list.data('switch-url');
+    $.each(projects, function (index, project) {
+      var $link = $('<a target="_self"></a>')
+        .attr('href', switch_url.replace('__project_id__',
+                                         encodeURIComponent(project.id)))
+        .append('<span class="fa fa-check dropdown-selected-icon"></span>')
+        .append($('<span class="dropdown-title"></span>').text(project.name));
+      if (project.id === current) {
+        $link.addClass('dropdown-selected');
+      }
+      $('<li class="project-list-result"></li>').append($link).insertBefore($more);
+    });
+  }
+};
+
+horizon.addInitFunction(horizon.projects.init = function () {
+  var $document = $(document);
+  var timer = null;
+
+  // Keep the menu open while searching.
+  $document.on('click', '.project-list-search', function (evt) {
+    evt.stopPropagation();
+  });
+
+  $document.on('input', '.project-list-search input', function () {
+    var $input = $(this);
+    clearTimeout(timer);
+    timer = setTimeout(function () {
+      horizon.projects.load($input.closest('.project-list'), $input.val(), 1);
+    }, horizon.projects.SEARCH_DELAY);
+  });
+
+  $document.on('click', '.project-list-more a', function (evt) {
+    var $more = $(this).parent();
+    evt.preventDefault();
+    evt.stopPropagation();
+    horizon.projects.load($more.closest('.project-list'),
+                          $more.data('search') || '', $more.data('page') || 1);
+  });
+});
@@ -27,11 +27,15 @@ from django import template
 from django.template.defaultfilters import slugify  # noqa
 from django.template.defaultfilters import truncatechars  # noqa
 from django.template.loader import render_to_string
+from django.utils.encoding import force_text
+from django.utils import formats
+from django.utils.html import conditional_escape
 from django.utils.html import escape
 from django.utils import http
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
 from django.utils import termcolors
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 import six
 
@@ -49,6 +53,23 @@ PALETTE = termcolors.PALETTES[termcolors.DEFAULT_PALETTE]
 STRING_SEPARATOR = "__"
 
 
+def _choices_map(choices):
+    """Returns a dict of the ``(value, choice)`` pairs by lowercase value.
+
+    The first pair wins when several values only differ by their case.
+    """
+    mapping = {}
+    for value, choice in choices or ():
+        mapping.setdefault(six.text_type(value).lower(), choice)
+    return mapping
+
+
+def _render_value(value):
+    """Renders ``value`` the way a ``{{ value }}`` template variable is."""
+    value = formats.localize(timezone.template_localtime(value))
+    return conditional_escape(force_text(value))
+
+
 @six.python_2_unicode_compatible
 class Column(html.HTMLElement):
     """A class which represents a single column in a :class:`.DataTable`.
@@ -316,6 +337,9 @@ class Column(html.HTMLElement):
         if link_classes:
             self.link_attrs['class'] = ' '.join(link_classes)
         self.cell_attributes_getter = cell_attributes_getter
+        # What is compiled out of the choices and link attributes, shared by
+        # the copies of the column made for every table instance.
+        self._compiled = {}
 
         if status_choices:
             self.status_choices = status_choices
@@ -343,6 +367,33 @@ class Column(html.HTMLElement):
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.name)
 
+    def get_choices_map(self, attr):
+        """Returns the ``status_choices`` or ``display_choices`` of this
+        column by their lowercase value.
+
+        The mapping is built once and shared by the copies of the column,
+        until the choices are replaced.
+        """
+        choices = getattr(self, attr)
+        compiled = self._compiled.get(attr)
+        if compiled is None or compiled[0] is not choices:
+            compiled = (choices, _choices_map(choices))
+            self._compiled[attr] = compiled
+        return compiled[1]
+
+    def get_link_attr_string(self):
+        """Returns the ``link_attrs`` of this column as HTML attributes.
+
+        The string is built again only when ``link_attrs`` changed.
+        """
+        compiled = self._compiled.get('link_attrs')
+        if compiled is None or compiled[0] != self.link_attrs:
+            attr_string = ' '.join(['%s="%s"' % (k, v) for (k, v) in
+                                    self.link_attrs.items()])
+            compiled = (dict(self.link_attrs), attr_string)
+            self._compiled['link_attrs'] = compiled
+        return compiled[1]
+
     def get_raw_data(self, datum):
         """Returns the raw data for this column, before any filters or
         formatting are applied to it. This is useful when doing calculations
@@ -379,15 +430,13 @@ class Column(html.HTMLElement):
             return self.table._data_cache[self][datum_id]
 
         data = self.get_raw_data(datum)
-        display_value = None
+        display_choices = None
 
-        if self.display_choices:
-            display_value = [display for (value, display) in
-                             self.display_choices
-                             if value.lower() == (data or '').lower()]
+        if self.display_choices and isinstance(data or '', six.string_types):
+            display_choices = self.get_choices_map('display_choices')
 
-        if display_value:
-            data = display_value[0]
+        if display_choices and (data or '').lower() in display_choices:
+            data = display_choices[(data or '').lower()]
         else:
             for filter_func in self.filters:
                 try:
@@ -749,8 +798,7 @@ class Cell(html.HTMLElement):
                               exc_info[2])
 
         if self.url and not self.column.auto == "form_field":
-            link_attrs = ' '.join(['%s="%s"' % (k, v) for (k, v) in
-                                  self.column.link_attrs.items()])
+            link_attrs = self.column.get_link_attr_string()
             # Escape the data inside while allowing our HTML to render
             data = mark_safe('<a href="%s" %s>%s</a>' % (
                              (escape(self.url),
@@ -760,12 +808,11 @@ class Cell(html.HTMLElement):
 
     @property
     def url(self):
-        if self.column.link:
-            url = self.column.get_link_url(self.datum)
-            if url:
-                return url
-        else:
-            return None
+        if not hasattr(self, '_url'):
+            self._url = None
+            if self.column.link:
+                self._url = self.column.get_link_url(self.datum) or None
+        return self._url
 
     @property
     def status(self):
@@ -779,10 +826,9 @@ class Cell(html.HTMLElement):
             # returns the first matching status found
             data_status_lower = six.text_type(
                 self.column.get_raw_data(self.datum)).lower()
-            for status_name, status_value in self.column.status_choices:
-                if six.text_type(status_name).lower() == data_status_lower:
-                    self._status = status_value
-                    return self._status
+            status_choices = self.column.get_choices_map('status_choices')
+            self._status = status_choices.get(data_status_lower)
+            return self._status
         self._status = None
         return self._status
 
@@ -833,8 +879,15 @@ class Cell(html.HTMLElement):
                                           self)
 
     def render(self):
-        return render_to_string("horizon/common/_data_table_cell.html",
-                                {"cell": self})
+        # Only the inline editable cells need the template, the others are
+        # rendered directly as they make up most of the cells of a table.
+        if self.inline_edit_available:
+            return render_to_string("horizon/common/_data_table_cell.html",
+                                    {"cell": self})
+        value = _render_value(self.value)
+        if self.wrap_list:
+            value = '<ul>%s</ul>' % value
+        return mark_safe('<td%s>%s</td>' % (self.attr_string, value))
 
 
 class DataTableOptions(object):
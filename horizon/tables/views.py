@@ -13,36 +13,135 @@
 #    under the License.
 
 from collections import defaultdict
+import logging
+import time
 
 from django import shortcuts
+from django.utils.translation import ugettext_lazy as _
+import six
 
+from horizon import messages
+from horizon.utils import parallel
 from horizon import views
 
 from horizon.templatetags.horizon import has_permissions  # noqa
 
 
+LOG = logging.getLogger(__name__)
+
+
+def _timed(func):
+    def call():
+        start = time.time()
+        return func(), time.time() - start
+    return call
+
+
+def fetch_table_data(data_funcs, concurrent=False, timeout=None):
+    """Call the data methods of tables.
+
+    ``data_funcs`` is a list of ``(table, func)`` pairs. Returns a list of
+    ``(result, exc_info, seconds)`` in the same order, ``exc_info`` being
+    ``None`` when the call succeeded.
+
+    Without ``concurrent`` the methods are called one after the other on the
+    calling thread, and errors are raised as they happen. With
+    ``concurrent`` they are all called on a bounded pool of threads (see
+    :mod:`horizon.utils.parallel`), each one within ``timeout`` seconds.
+    """
+    funcs = [_timed(func) for table, func in data_funcs]
+    results = []
+    if not concurrent:
+        for func in funcs:
+            result, seconds = func()
+            results.append((result, None, seconds))
+        return results
+    for timed_result, exc_info in parallel.run_parallel(funcs,
+                                                        timeout=timeout):
+        if exc_info is None:
+            result, seconds = timed_result
+            results.append((result, None, seconds))
+        else:
+            results.append((None, exc_info, timeout))
+    return results
+
+
+def collect_table_data(request, data_funcs, results):
+    """Return the data and the load timings of the tables by table name.
+
+    ``results`` are those of :func:`fetch_table_data` for ``data_funcs``.
+    The data of a table with several methods are concatenated into a list.
+    The first error, in ``data_funcs`` order, is re-raised on the calling
+    thread, so it is handled as if the methods had been called there. A
+    method which timed out leaves its table empty, with an error message.
+    """
+    data = {}
+    timings = {}
+    for (table, func), (result, exc_info, seconds) in zip(data_funcs,
+                                                          results):
+        name = table._meta.name
+        if exc_info is not None:
+            if not issubclass(exc_info[0], parallel.ParallelTimeout):
+                six.reraise(*exc_info)
+            LOG.warning("Timed out retrieving the data of table %s.", name)
+            messages.error(request,
+                           _('Unable to retrieve the %s in time.')
+                           % table._meta.verbose_name)
+            result = []
+        if name in data:
+            data[name] = list(data[name]) + list(result)
+        else:
+            data[name] = result
+        timings[name] = timings.get(name, 0) + (seconds or 0)
+    for name, seconds in timings.items():
+        LOG.debug("Retrieved the data of table %s in %.3fs.", name, seconds)
+    return data, timings
+
+
 class MultiTableMixin(object):
-    """A generic mixin which provides methods for handling DataTables."""
+    """A generic mixin which provides methods for handling DataTables.
+
+    .. attribute:: concurrent_data_loading
+
+        Whether to call the data methods of the tables concurrently, on a
+        bounded pool of threads, instead of one after the other. Only
+        enable it when the data methods do not depend on each other.
+        Defaults to ``False``.
+
+    .. attribute:: data_loading_timeout
+
+        With ``concurrent_data_loading``, the number of seconds every data
+        method may take, after which its table is left empty. Defaults to
+        ``None``, no timeout.
+    """
     data_method_pattern = "get_%s_data"
+    concurrent_data_loading = False
+    data_loading_timeout = None
 
     def __init__(self, *args, **kwargs):
         super(MultiTableMixin, self).__init__(*args, **kwargs)
         self.table_classes = getattr(self, "table_classes", [])
         self._data = {}
         self._tables = {}
+        # Seconds taken by the data methods of each table.
+        self.data_timings = {}
 
         self._data_methods = defaultdict(list)
         self.get_data_methods(self.table_classes, self._data_methods)
 
     def _get_data_dict(self):
         if not self._data:
+            data_funcs = [(table, func) for table in self.table_classes
+                          for func in self._data_methods.get(
+                              table._meta.name, [])]
+            results = fetch_table_data(data_funcs,
+                                       self.concurrent_data_loading,
+                                       self.data_loading_timeout)
+            data, self.data_timings = collect_table_data(
+                self.request, data_funcs, results)
             for table in self.table_classes:
-                data = []
-                name = table._meta.name
-                func_list = self._data_methods.get(name, [])
-                for func in func_list:
-                    data.extend(func())
-                self._data[name] = data
+                self._data[table._meta.name] = list(
+                    data.get(table._meta.name, []))
         return self._data
 
     def get_data_methods(self, table_classes, methods):
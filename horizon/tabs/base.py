@@ -21,6 +21,7 @@ from django.template.loader import render_to_string
 from django.template import TemplateSyntaxError  # noqa
 
 from horizon import exceptions
+from horizon.tables import views as table_views
 from horizon.utils import html
 
 SEPARATOR = "__"
@@ -415,8 +416,21 @@ class TableTab(Tab):
         :class:`~horizon.tables.MultiTableView`. For each table class you
         need to define a corresponding ``get_{{ table_name }}_data`` method
         as with :class:`~horizon.tables.MultiTableView`.
+
+    .. attribute:: concurrent_data_loading
+
+        Whether to call the data methods of the tables concurrently, as with
+        :attr:`~horizon.tables.MultiTableView.concurrent_data_loading`.
+        Defaults to ``False``.
+
+    .. attribute:: data_loading_timeout
+
+        The number of seconds every data method may take when they are
+        called concurrently. Defaults to ``None``, no timeout.
     """
     table_classes = None
+    concurrent_data_loading = False
+    data_loading_timeout = None
 
     def __init__(self, tab_group, request):
         super(TableTab, self).__init__(tab_group, request)
@@ -430,6 +444,25 @@ class TableTab(Tab):
                            for table in self.table_classes]
         self._tables = OrderedDict(table_instances)
         self._table_data_loaded = False
+        # Results of the data methods fetched by the view, see
+        # TabView.prefetch_table_data().
+        self._prefetched = None
+        # Seconds taken by the data methods of each table.
+        self.data_timings = {}
+
+    def get_data_funcs(self):
+        """Returns the ``(table, data method)`` pairs of the tables."""
+        data_funcs = []
+        for table_name, table in self._tables.items():
+            # Fetch the data function.
+            func_name = "get_%s_data" % table_name
+            data_func = getattr(self, func_name, None)
+            if data_func is None:
+                cls_name = self.__class__.__name__
+                raise NotImplementedError("You must define a %s method "
+                                          "on %s." % (func_name, cls_name))
+            data_funcs.append((table, data_func))
+        return data_funcs
 
     def load_table_data(self):
         """Calls the ``get_{{ table_name }}_data`` methods for each table class
@@ -437,16 +470,17 @@ class TableTab(Tab):
         """
         # We only want the data to be loaded once, so we track if we have...
         if not self._table_data_loaded:
+            data_funcs = self.get_data_funcs()
+            results = self._prefetched
+            if results is None:
+                results = table_views.fetch_table_data(
+                    data_funcs, self.concurrent_data_loading,
+                    self.data_loading_timeout)
+            self._prefetched = None
+            data, self.data_timings = table_views.collect_table_data(
+                self.request, data_funcs, results)
             for table_name, table in self._tables.items():
-                # Fetch the data function.
-                func_name = "get_%s_data" % table_name
-                data_func = getattr(self, func_name, None)
-                if data_func is None:
-                    cls_name = self.__class__.__name__
-                    raise NotImplementedError("You must define a %s method "
-                                              "on %s." % (func_name, cls_name))
-                # Load the data.
-                table.data = data_func()
+                table.data = data.get(table_name, [])
                 table._meta.has_prev_data = self.has_prev_data(table)
                 table._meta.has_more_data = self.has_more_data(table)
             # Mark our data as loaded so we don't run the loaders again.
@@ -14,6 +14,7 @@ from django import http
 
 from horizon import exceptions
 from horizon import tables
+from horizon.tables import views as table_views
 from horizon.tabs.base import TableTab  # noqa
 from horizon import views
 
@@ -29,9 +30,22 @@ class TabView(views.HorizonTemplateView):
 
         The only required attribute for ``TabView``. It should be a class which
         inherits from :class:`horizon.tabs.TabGroup`.
+
+    .. attribute:: concurrent_data_loading
+
+        Whether to call the data methods of the tables of all the
+        :class:`horizon.tabs.TableTab` tabs to be displayed concurrently,
+        instead of one tab after the other. Defaults to ``False``.
+
+    .. attribute:: data_loading_timeout
+
+        The number of seconds every data method may take when they are
+        called concurrently. Defaults to ``None``, no timeout.
     """
     tab_group_class = None
     _tab_group = None
+    concurrent_data_loading = False
+    data_loading_timeout = None
 
     def __init__(self):
         if not self.tab_group_class:
@@ -50,12 +64,33 @@ class TabView(views.HorizonTemplateView):
         try:
             tab_group = self.get_tabs(self.request, **kwargs)
             context["tab_group"] = tab_group
+            if self.concurrent_data_loading:
+                self.prefetch_table_data(tab_group)
             # Make sure our data is pre-loaded to capture errors.
             context["tab_group"].load_tab_data()
         except Exception:
             exceptions.handle(self.request)
         return context
 
+    def prefetch_table_data(self, tab_group):
+        """Fetches the data of the tables of all the tabs to be displayed.
+
+        The data methods of the tables of every :class:`horizon.tabs.TableTab`
+        to be loaded are called concurrently. Each tab only gets their
+        results, and their errors, when it loads its data, so errors are
+        still handled tab by tab.
+        """
+        tabs = [tab for tab in tab_group.get_tabs()
+                if isinstance(tab, TableTab) and tab.load and
+                not tab._table_data_loaded and tab._prefetched is None]
+        data_funcs = [tab.get_data_funcs() for tab in tabs]
+        results = table_views.fetch_table_data(
+            [data_func for funcs in data_funcs for data_func in funcs],
+            concurrent=True, timeout=self.data_loading_timeout)
+        for tab, funcs in zip(tabs, data_funcs):
+            tab._prefetched = results[:len(funcs)]
+            results = results[len(funcs):]
+
     def handle_tabbed_response(self, tab_group, context):
         """Sends back an AJAX-appropriate response for the tab group if
         required, otherwise renders the response as normal.
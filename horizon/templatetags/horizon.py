@@ -26,6 +26,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from horizon.base import Horizon  # noqa
 from horizon import conf
+from horizon.utils import js_catalog
 
 
 register = template.Library()
@@ -204,6 +205,12 @@ def load_config():
     return conf
 
 
+@register.simple_tag
+def jsi18n_url(packages):
+    """Return the URL of the compiled JavaScript translation catalog."""
+    return js_catalog.catalog_url(packages)
+
+
 @register.assignment_tag
 def datepicker_locale():
     locale_mapping = getattr(settings, 'DATEPICKER_LOCALES',
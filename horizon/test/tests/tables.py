@@ -15,6 +15,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
@@ -1409,6 +1411,52 @@ class DataTableTests(test.TestCase):
         resp = http.HttpResponse(table.render())
         self.assertContains(resp, value)
 
+    def test_display_choices(self):
+        class MyTableDisplayChoices(MyTable):
+            value = tables.Column('value',
+                                  display_choices=(('Foo', 'First'),
+                                                   ('foo', 'Second'),
+                                                   ('', 'Empty')),
+                                  filters=(lambda data: 'filtered',))
+
+        table = MyTableDisplayChoices(self.request, TEST_DATA)
+        column = table.columns['value']
+        self.assertEqual('First', column.get_data(FakeObject('1', 'n', 'FOO',
+                                                             'up')))
+        self.assertEqual('Empty', column.get_data(FakeObject('2', 'n', None,
+                                                             'up')))
+        self.assertEqual('filtered',
+                         column.get_data(FakeObject('3', 'n', 'bar', 'up')))
+        self.assertEqual('filtered',
+                         column.get_data(FakeObject('4', 'n', 42, 'up')))
+        # The choices are compiled once for all the tables of the class.
+        other = MyTableDisplayChoices(self.request, TEST_DATA)
+        self.assertIs(column.get_choices_map('display_choices'),
+                      other.columns['value'].get_choices_map(
+                          'display_choices'))
+
+    def test_link_attr_string(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        column = self.table.columns['value']
+        self.assertEqual(column.get_link_attr_string(),
+                         column.get_link_attr_string())
+        column.link_attrs = dict(column.link_attrs, **{'data-tip': 'changed'})
+        self.assertIn('data-tip="changed"', column.get_link_attr_string())
+        row = self.table.get_rows()[0]
+        self.assertIn('data-tip="changed"', row.cells['value'].value)
+
+    def test_cell_rendering_without_template(self):
+        self.table = MyTable(self.request, TEST_DATA)
+        row = self.table.get_rows()[0]
+        with self.assertTemplateNotUsed(
+                'horizon/common/_data_table_cell.html'):
+            rendered = row.cells['value'].render()
+        cell = row.cells['value']
+        self.assertEqual('<td%s>%s</td>' % (cell.attr_string, cell.value),
+                         rendered)
+        with self.assertTemplateUsed('horizon/common/_data_table_cell.html'):
+            row.cells['name'].render()
+
 
 class SingleTableView(table_views.DataTableView):
     table_class = MyTable
@@ -1446,6 +1494,19 @@ class MultiTableView(tables.MultiTableView):
         return TEST_DATA
 
 
+class ConcurrentMultiTableView(MultiTableView):
+    concurrent_data_loading = True
+    data_loading_timeout = 0.1
+
+    def __init__(self, *args, **kwargs):
+        self.done = threading.Event()
+        super(ConcurrentMultiTableView, self).__init__(*args, **kwargs)
+
+    def get_table_with_permissions_data(self):
+        self.done.wait(5)
+        return TEST_DATA
+
+
 class DataTableViewTests(test.TestCase):
     def _prepare_view(self, cls, *args, **kwargs):
         req = self.factory.get('/my_url/')
@@ -1489,6 +1550,29 @@ class DataTableViewTests(test.TestCase):
         self.assertEqual(TableWithPermissions,
                          context['table_with_permissions_table'].__class__)
 
+    def test_multi_table_view_concurrent(self):
+        view = self._prepare_view(ConcurrentMultiTableView)
+        view.done.set()
+        data = view._get_data_dict()
+        self.assertEqual(list(TEST_DATA), data['my_table'])
+        self.assertEqual(list(TEST_DATA), data['table_with_permissions'])
+        self.assertEqual(set(['my_table', 'table_with_permissions']),
+                         set(view.data_timings))
+
+    def test_multi_table_view_concurrent_timeout(self):
+        view = self._prepare_view(ConcurrentMultiTableView)
+        self.addCleanup(view.done.set)
+        data = view._get_data_dict()
+        self.assertEqual(list(TEST_DATA), data['my_table'])
+        self.assertEqual([], data['table_with_permissions'])
+        self.assertEqual(1, len(list(view.request._messages)))
+
+    def test_multi_table_view_concurrent_error(self):
+        view = self._prepare_view(ConcurrentMultiTableView)
+        view.done.set()
+        view._data_methods['my_table'] = [lambda: 1 / 0]
+        self.assertRaises(ZeroDivisionError, view._get_data_dict)
+
     fil_value_param = "my_table__filter__q"
     fil_field_param = '%s_field' % fil_value_param
 
@@ -105,6 +105,10 @@ class TabWithTableView(horizon_tabs.TabbedTableView):
     template_name = "tab_group.html"
 
 
+class ConcurrentTabWithTableView(TabWithTableView):
+    concurrent_data_loading = True
+
+
 class TabTests(test.TestCase):
     def test_tab_group_basics(self):
         tg = Group(self.request)
@@ -299,6 +303,32 @@ class TabTests(test.TestCase):
         req = self.factory.post('/', {'action': action_string})
         self.assertRaises(exceptions.Http302, view, req)
 
+    def test_table_tab_concurrent(self):
+        tab_group = TableTabGroup(self.request)
+        tab = tab_group.get_tabs()[0]
+        tab.concurrent_data_loading = True
+        tab.load_table_data()
+        self.assertEqual(TEST_DATA, tab._tables['my_table'].data)
+        self.assertEqual(['my_table'], list(tab.data_timings))
+
+    def test_tabbed_table_view_concurrent(self):
+        view = ConcurrentTabWithTableView.as_view()
+        req = self.factory.get("/")
+        res = view(req)
+        self.assertContains(res, "<table", 1)
+        self.assertContains(res, "Displaying 4 items", 1)
+
+    def test_prefetch_table_data(self):
+        tab_group = TableTabGroup(self.request)
+        tab = tab_group.get_tabs()[0]
+        view = ConcurrentTabWithTableView()
+        view.prefetch_table_data(tab_group)
+        self.assertEqual(1, len(tab._prefetched))
+        self.assertFalse(tab._table_data_loaded)
+        tab.load_table_data()
+        self.assertIsNone(tab._prefetched)
+        self.assertEqual(TEST_DATA, tab._tables['my_table'].data)
+
 
 class TabExceptionTests(test.TestCase):
     def setUp(self):
@@ -10,9 +10,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from horizon.utils import file_discovery as fd
+import os
+import shutil
+import tempfile
 import unittest
 
+from horizon.utils import file_discovery as fd
+
 base_path = 'some_root/fake_static_files/'
 
 test_structure = [
@@ -259,3 +263,68 @@ class FinderTests(unittest.TestCase):
 
         self.assertTrue(templates[0].endswith('.html'))
         self.assertTrue(templates[1].endswith('.html'))
+
+
+class ManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.base_path = os.path.join(self.root, 'static') + '/'
+        for name in ('a/a.module.js', 'a/a.spec.js', 'b/b.html'):
+            self._write(name)
+        self.filename = os.path.join(self.root, 'manifest.json')
+        self.old_state = list(fd._discovered), dict(fd._manifest)
+        del fd._discovered[:]
+        fd._manifest.clear()
+
+    def tearDown(self):
+        fd._discovered[:], manifest = self.old_state
+        fd._manifest.clear()
+        fd._manifest.update(manifest)
+
+    def _write(self, name):
+        filename = os.path.join(self.base_path, name)
+        if not os.path.isdir(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename))
+        open(filename, 'w').close()
+
+    def _save_and_load(self):
+        discovered = fd.discover_static_files(self.base_path)
+        fd.save_manifest(self.filename, dashboards=['project'])
+        manifest = fd.load_manifest(self.filename)
+        self.assertEqual(['project'], manifest['dashboards'])
+        return discovered
+
+    def test_manifest_used(self):
+        discovered = self._save_and_load()
+        self.assertEqual((['a/a.module.js'], [], ['a/a.spec.js'],
+                          ['b/b.html']), discovered)
+        old_walk = fd.walk
+        fd.walk = None
+        try:
+            self.assertEqual(discovered,
+                             fd.discover_static_files(self.base_path))
+        finally:
+            fd.walk = old_walk
+
+    def test_manifest_outdated(self):
+        self._save_and_load()
+        self._write('a/c.js')
+        # Make sure the directory mtime differs on coarse file systems.
+        a_dir = os.path.join(self.base_path, 'a')
+        os.utime(a_dir, (0, 0))
+        sources = fd.discover_static_files(self.base_path)[0]
+        self.assertEqual(['a/a.module.js', 'a/c.js'], sources)
+
+    def test_manifest_new_directory(self):
+        self._save_and_load()
+        self._write('c/c/c.html')
+        os.utime(self.base_path, (0, 0))
+        templates = fd.discover_static_files(self.base_path)[3]
+        self.assertEqual(['b/b.html', 'c/c/c.html'], templates)
+
+    def test_manifest_invalid(self):
+        with open(self.filename, 'w') as f:
+            f.write('{"version": 0, "static": {}}')
+        self.assertEqual({}, fd.load_manifest(self.filename))
+        self.assertEqual({}, fd.load_manifest(self.filename + '.missing'))
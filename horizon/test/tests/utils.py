@@ -14,10 +14,15 @@
 
 import datetime
 import os
+import shutil
+import tempfile
+import threading
+import time
 
 from django.core.exceptions import ValidationError  # noqa
 import django.template
 from django.template import defaultfilters
+import mock
 
 from horizon import forms
 from horizon.test import helpers as test
@@ -26,7 +31,10 @@ from horizon.utils import filters
 from horizon.utils.filters import parse_isotime  # noqa
 from horizon.utils import functions
 from horizon.utils import memoized
+from horizon.utils import parallel
 from horizon.utils import secret_key
+from horizon.utils import startup
+from horizon.utils import theme_bundles
 from horizon.utils import units
 from horizon.utils import validators
 
@@ -374,6 +382,121 @@ class MemoizedTests(test.TestCase):
         self.assertEqual(1, len(values_list))
 
 
+class ParallelTests(test.TestCase):
+    def test_map_parallel_keeps_order(self):
+        def slow_square(x):
+            time.sleep(0.01 * (5 - x))
+            return x * x
+
+        self.assertEqual([0, 1, 4, 9, 16],
+                         parallel.map_parallel(slow_square, range(5),
+                                               max_workers=3))
+
+    def test_map_parallel_reraises_first_error(self):
+        def fail_on_odd(x):
+            if x % 2:
+                raise ValueError(x)
+            return x
+
+        with self.assertRaises(ValueError) as cm:
+            parallel.map_parallel(fail_on_odd, [0, 1, 2, 3])
+        self.assertEqual((1,), cm.exception.args)
+
+    def test_run_parallel_timeout(self):
+        event = threading.Event()
+
+        results = parallel.run_parallel([event.wait, lambda: 'done'],
+                                        max_workers=1, timeout=0.05)
+        event.set()
+        self.assertIsNone(results[0][0])
+        self.assertIs(parallel.ParallelTimeout, results[0][1][0])
+        self.assertEqual(('done', None), results[1])
+
+    def test_run_parallel_carries_context(self):
+        local = threading.local()
+        local.value = 'caller'
+        hooks = (lambda: local.value,
+                 lambda value: setattr(local, 'value', value),
+                 lambda value: delattr(local, 'value'))
+        parallel.register_context(*hooks)
+        try:
+            results = parallel.run_parallel(
+                [lambda: local.value, lambda: local.value], max_workers=2)
+        finally:
+            parallel._contexts.remove(hooks)
+        self.assertEqual([('caller', None), ('caller', None)], results)
+
+
+class StartupTests(test.TestCase):
+    def setUp(self):
+        super(StartupTests, self).setUp()
+        self.old_timings = startup.timings()
+        startup.reset()
+
+    def tearDown(self):
+        startup.reset()
+        startup._timings.extend(list(record) for record in self.old_timings)
+        super(StartupTests, self).tearDown()
+
+    def test_timed(self):
+        with startup.timed('outer'):
+            with startup.timed('inner'):
+                time.sleep(0.01)
+            with startup.timed('fast'):
+                pass
+        (depth, step, seconds), inner, fast = startup.timings()
+        self.assertEqual((0, 'outer'), (depth, step))
+        self.assertEqual((1, 'inner'), inner[:2])
+        self.assertGreaterEqual(seconds, inner[2])
+        self.assertGreaterEqual(inner[2], 0.01)
+
+        report = startup.report(threshold=0.005).splitlines()
+        self.assertEqual(3, len(report))
+        self.assertTrue(report[1].startswith('outer '))
+        self.assertTrue(report[2].startswith('  inner '))
+
+
+class ThemeBundlesTests(test.TestCase):
+    def setUp(self):
+        super(ThemeBundlesTests, self).setUp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.addCleanup(theme_bundles.reset)
+        self.digests = {'a.scss': 'digest-a'}
+        mock.patch.object(theme_bundles, 'render',
+                          side_effect=lambda theme: '$theme: %s;' % theme
+                          ).start()
+        mock.patch.object(theme_bundles, '_file_digest',
+                          side_effect=self.digests.get).start()
+        self.compile_scss = mock.patch.object(
+            theme_bundles, 'compile_scss',
+            side_effect=lambda source: ('/* %s */' % source, ['a.scss'])
+        ).start()
+
+    def test_compile_themes(self):
+        manifest = theme_bundles.compile_themes(['default', 'material'],
+                                                root=self.root)
+        self.assertEqual(['default', 'material'], sorted(manifest))
+        self.assertNotEqual(manifest['default'], manifest['material'])
+        with open(os.path.join(self.root, manifest['default'])) as f:
+            self.assertEqual('/* $theme: default; */', f.read())
+
+        with self.settings(STATIC_ROOT=self.root):
+            self.assertEqual('/static/' + manifest['material'],
+                             theme_bundles.stylesheet_url('material'))
+            self.assertIsNone(theme_bundles.stylesheet_url('other'))
+
+    def test_compile_themes_cached(self):
+        theme_bundles.compile_themes(['default'], root=self.root)
+        theme_bundles.compile_themes(['default'], root=self.root)
+        self.assertEqual(1, self.compile_scss.call_count)
+
+        # A change of an imported file compiles the theme again.
+        self.digests['a.scss'] = 'digest-b'
+        theme_bundles.compile_themes(['default'], root=self.root)
+        self.assertEqual(2, self.compile_scss.call_count)
+
+
 class GetPageSizeTests(test.TestCase):
     def test_bad_session_value(self):
         requested_url = '/project/instances/'
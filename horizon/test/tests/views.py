@@ -12,12 +12,20 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
+import shutil
+import struct
+import sys
+import tempfile
 
 from horizon.test import helpers as test
+from horizon.utils import js_catalog
 from horizon import views
 
+from django.conf import settings
 from django import forms
 from django.test import client
+from django.test.utils import override_settings
 from django.utils.translation import ugettext_lazy as _
 from django.views import generic
 
@@ -100,3 +108,122 @@ class PageTitleTests(test.TestCase):
     def test_form_with_title(self):
         res = self._dispatch(FormWithTitle)
         self.assertEqual("A Title: myName", res.context_data['page_title'])
+
+
+def _write_catalog(root, package, messages):
+    """Create ``package`` in ``root`` with a German djangojs catalog."""
+    locale = os.path.join(root, package, 'locale', 'de', 'LC_MESSAGES')
+    os.makedirs(locale)
+    open(os.path.join(root, package, '__init__.py'), 'w').close()
+    messages = dict(messages)
+    messages[''] = 'Content-Type: text/plain; charset=UTF-8\n'
+    keys = sorted(messages)
+    ids = b''.join(k.encode('utf-8') + b'\0' for k in keys)
+    strs = b''.join(messages[k].encode('utf-8') + b'\0' for k in keys)
+    start = 28 + 16 * len(keys)
+    table = []
+    offset = start
+    for k in keys:
+        table.append((len(k.encode('utf-8')), offset))
+        offset += len(k.encode('utf-8')) + 1
+    for k in keys:
+        table.append((len(messages[k].encode('utf-8')), offset))
+        offset += len(messages[k].encode('utf-8')) + 1
+    with open(os.path.join(locale, 'djangojs.mo'), 'wb') as f:
+        f.write(struct.pack('<7I', 0x950412de, 0, len(keys), 28,
+                            28 + 8 * len(keys), 0, start))
+        for length, position in table:
+            f.write(struct.pack('<2I', length, position))
+        f.write(ids + strs)
+
+
+class JavascriptCatalogTests(test.TestCase):
+
+    def setUp(self):
+        super(JavascriptCatalogTests, self).setUp()
+        self.addCleanup(js_catalog.reset)
+
+    def test_catalog_compiled_once(self):
+        self.mox.StubOutWithMock(js_catalog, 'render')
+        js_catalog.render('de', 'horizon').AndReturn(b'catalog')
+        self.mox.ReplayAll()
+
+        content, digest = js_catalog.get_catalog('de', 'horizon')
+        self.assertEqual((content, digest),
+                         js_catalog.get_catalog('de', 'horizon'))
+        self.assertEqual(b'catalog', content)
+        self.assertEqual(16, len(digest))
+
+    def test_catalog_url(self):
+        digest = js_catalog.get_catalog('en', 'horizon')[1]
+        self.assertEqual('/i18n/js/horizon/en.%s.js' % digest,
+                         js_catalog.catalog_url('horizon+unknown', 'en'))
+
+    def test_catalog_packages_canonical(self):
+        js_catalog.get_catalog('en', 'horizon')
+        js_catalog.get_catalog('en', 'horizon+horizon+unknown')
+        self.assertEqual(1, len(js_catalog._catalogs))
+
+    def test_plugin_translations_override(self):
+        # The plugin sorts before the dashboard it overrides, the order of
+        # the packages decides which translation wins.
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        _write_catalog(root, 'zz_dashboard', {'Cancel': 'Abbrechen'})
+        _write_catalog(root, 'aa_plugin', {'Cancel': 'Verwerfen'})
+        sys.path.insert(0, root)
+        self.addCleanup(sys.path.remove, root)
+        with self.modify_settings(INSTALLED_APPS={
+                'append': ['zz_dashboard', 'aa_plugin']}):
+            self.assertEqual(
+                'zz_dashboard+aa_plugin',
+                js_catalog.clean_packages('zz_dashboard+aa_plugin+'
+                                          'zz_dashboard'))
+            content = js_catalog.get_catalog('de',
+                                             'zz_dashboard+aa_plugin')[0]
+        self.assertIn(b'Verwerfen', content)
+        self.assertNotIn(b'Abbrechen', content)
+
+    def test_non_canonical_catalog_redirected(self):
+        response = self.client.get(
+            '/i18n/js/horizon+horizon/en.0123456789abcdef.js')
+        self.assertEqual(301, response.status_code)
+        self.assertTrue(response['Location'].endswith(
+            '/i18n/js/horizon/en.0123456789abcdef.js'))
+        self.assertEqual(0, len(js_catalog._catalogs))
+
+    def test_unknown_packages(self):
+        response = self.client.get('/i18n/js/unknown/en.0123456789abcdef.js')
+        self.assertEqual(404, response.status_code)
+
+    def test_versioned_catalog(self):
+        url = js_catalog.catalog_url('horizon', 'en')
+        response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+        self.assertIn(b'django.gettext', response.content)
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(304, response.status_code)
+
+    def test_outdated_catalog_not_cached(self):
+        response = self.client.get('/i18n/js/horizon/en.0123456789abcdef.js')
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn('ETag', response)
+        self.assertIn('max-age=0', response['Cache-Control'])
+
+    def test_unknown_language(self):
+        response = self.client.get('/i18n/js/horizon/xx.0123456789abcdef.js')
+        self.assertEqual(404, response.status_code)
+
+    def test_compile_static(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        with override_settings(STATIC_ROOT=root):
+            manifest = js_catalog.compile_static(['en'], ['horizon'])
+            path = manifest['en']['horizon']
+            self.assertEqual(settings.STATIC_URL + path,
+                             js_catalog.catalog_url('horizon', 'en'))
+        with open(os.path.join(root, path), 'rb') as f:
+            self.assertEqual(js_catalog.get_catalog('en', 'horizon')[0],
+                             f.read())
@@ -10,7 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
 import logging
+import os
 
 from os import path
 from os import walk
@@ -21,6 +23,13 @@ MODULE_EXT = '.module.js'
 MOCK_EXT = '.mock.js'
 SPEC_EXT = '.spec.js'
 
+MANIFEST_VERSION = 1
+
+# Discovery results loaded from a startup manifest, by base and sub path.
+_manifest = {}
+# Base and sub paths discovered by this process, in order.
+_discovered = []
+
 
 def discover_files(base_path, sub_path='', ext='', trim_base_path=False):
     """Discovers all files with certain extension in given paths.
@@ -74,12 +83,26 @@ def sort_js_files(js_files):
 def discover_static_files(base_path, sub_path=''):
     """Discovers static files in given paths, returning JavaScript sources,
     mocks, specs and HTML templates, all grouped in lists.
+
+    The results of a startup manifest loaded by :func:`load_manifest` are
+    used instead of walking the directory tree again when none of its
+    directories changed since the manifest was written.
     """
-    js_files = discover_files(base_path, sub_path=sub_path,
-                              ext='.js', trim_base_path=True)
-    sources, mocks, specs = sort_js_files(js_files)
-    html_files = discover_files(base_path, sub_path=sub_path,
-                                ext='.html', trim_base_path=True)
+    if (base_path, sub_path) not in _discovered:
+        _discovered.append((base_path, sub_path))
+    cached = _manifest.get(base_path, {}).get(sub_path)
+    if cached and _unchanged(cached['dirs']):
+        return tuple(list(files) for files in cached['files'])
+    return _discover_static_files(base_path, sub_path)
+
+
+def _discover_static_files(base_path, sub_path):
+    # A single walk of the tree for both the JavaScript and HTML files.
+    files = discover_files(base_path, sub_path=sub_path,
+                           ext=('.js', '.html'), trim_base_path=True)
+    sources, mocks, specs = sort_js_files([f for f in files
+                                           if f.endswith('.js')])
+    html_files = [f for f in files if f.endswith('.html')]
 
     p = path.join(base_path, sub_path)
     _log(sources, 'JavaScript source', p)
@@ -104,6 +127,66 @@ def populate_horizon_config(horizon_config, base_path,
         horizon_config.setdefault('external_templates', []).extend(template)
 
 
+def _unchanged(dirs):
+    """Return whether the directories still have the same mtime.
+
+    Adding, removing or renaming a file or directory changes the mtime of
+    the directory it is in, so this tells whether a discovery is still
+    current with one ``stat`` per directory instead of listing them all.
+    """
+    try:
+        return all(path.getmtime(d) == mtime for d, mtime in dirs.items())
+    except OSError:
+        return False
+
+
+def load_manifest(filename):
+    """Use the discovery results of the startup manifest ``filename``.
+
+    Returns the manifest, or an empty dict when it can't be read.
+    """
+    try:
+        with open(filename) as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError) as e:
+        LOG.warning("Could not load the startup manifest %s: %s",
+                    filename, e)
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        LOG.warning("Ignoring the startup manifest %s of version %s.",
+                    filename, manifest.get('version'))
+        return {}
+    _manifest.clear()
+    _manifest.update(manifest['static'])
+    return manifest
+
+
+def save_manifest(filename, **extra):
+    """Write the static files discovered by this process to ``filename``.
+
+    Every discovery is made again and recorded with the mtime of its
+    directories. ``extra`` is added to the manifest as is; it must be
+    serializable as JSON.
+    """
+    static = {}
+    for base_path, sub_path in _discovered:
+        root = path.join(base_path, sub_path)
+        # A missing directory is recorded too, and never considered current.
+        dirs = (dict((d, path.getmtime(d)) for d, _dirs, _files in walk(root))
+                or {root: None})
+        static.setdefault(base_path, {})[sub_path] = {
+            'dirs': dirs,
+            'files': _discover_static_files(base_path, sub_path),
+        }
+    manifest = dict(extra, version=MANIFEST_VERSION, static=static)
+    # Write then rename, so that starting processes never read half of it.
+    tmp_filename = filename + '.tmp'
+    with open(tmp_filename, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.rename(tmp_filename, filename)
+    return manifest
+
+
 def _log(file_list, list_name, in_path):
     """Logs result at debug level
     """
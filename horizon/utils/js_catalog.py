@@ -0,0 +1,144 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Compiled, content-hashed JavaScript translation catalogs.
+
+Django's ``javascript_catalog`` view reads and merges the gettext catalogs
+of every package on each request. Here a catalog is built once per
+language and set of packages, and identified by a digest of its content,
+so its URL changes whenever the catalog does and browsers may cache it
+forever.
+
+Catalogs are compiled in process on first use and served by the
+``horizon:jsi18n_versioned`` view. The ``compilejsi18n`` management
+command writes them to ``STATIC_ROOT`` instead, together with a manifest;
+the URLs then point to those static files.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.staticfiles.templatetags import staticfiles
+from django.core.urlresolvers import reverse
+from django.utils import translation
+from django.views import i18n
+
+
+# Where the compiled catalogs are written, relative to STATIC_ROOT.
+STATIC_DIR = 'horizon/jsi18n'
+MANIFEST = STATIC_DIR + '/manifest.json'
+
+_lock = threading.Lock()
+_catalogs = {}
+_manifest = []
+
+
+def clean_packages(packages):
+    """Return the canonical form of the ``+`` separated ``packages``.
+
+    Packages Django would ignore are dropped and the others deduplicated,
+    keeping their first occurrence. Their order is kept, as the
+    translations of later packages override those of earlier ones.
+    """
+    installed = set(config.name for config in apps.get_app_configs())
+    installed.add('django.conf')
+    return '+'.join(collections.OrderedDict.fromkeys(
+        package for package in packages.split('+') if package in installed))
+
+
+def render(language, packages):
+    """Return the JavaScript catalog of ``packages`` in ``language``."""
+    with translation.override(language):
+        catalog, plural = i18n.get_javascript_catalog(
+            translation.to_locale(language), 'djangojs', packages.split('+'))
+        return i18n.render_javascript_catalog(catalog, plural).content
+
+
+def get_catalog(language, packages):
+    """Return the catalog and its digest, compiled once per process."""
+    packages = clean_packages(packages)
+    key = (language, packages)
+    try:
+        return _catalogs[key]
+    except KeyError:
+        content = render(language, packages)
+        digest = hashlib.sha1(content).hexdigest()[:16]
+        with _lock:
+            return _catalogs.setdefault(key, (content, digest))
+
+
+def compile_static(languages, packages_list, root=None):
+    """Write the catalogs to ``STATIC_ROOT`` and return the manifest.
+
+    Catalogs are written for every language of ``languages`` and every
+    ``+`` separated package list of ``packages_list``.
+    """
+    root = root or settings.STATIC_ROOT
+    manifest = {}
+    for language in languages:
+        for packages in packages_list:
+            content, digest = get_catalog(language, packages)
+            path = '%s/%s/%s.js' % (STATIC_DIR, language, digest)
+            filename = os.path.join(root, *path.split('/'))
+            if not os.path.isdir(os.path.dirname(filename)):
+                os.makedirs(os.path.dirname(filename))
+            with open(filename, 'wb') as f:
+                f.write(content)
+            manifest.setdefault(language, {})[packages] = path
+    with open(os.path.join(root, *MANIFEST.split('/')), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    reset()
+    return manifest
+
+
+def _load_manifest():
+    if not _manifest:
+        manifest = {}
+        if settings.STATIC_ROOT:
+            try:
+                with open(os.path.join(settings.STATIC_ROOT,
+                                       *MANIFEST.split('/'))) as f:
+                    manifest = json.load(f)
+            except (IOError, OSError, ValueError):
+                pass
+        with _lock:
+            if not _manifest:
+                _manifest.append(manifest)
+    return _manifest[0]
+
+
+def catalog_url(packages, language=None):
+    """Return the URL of the catalog of ``packages`` in ``language``.
+
+    ``language`` defaults to the active language.
+    """
+    language = (language or translation.get_language() or
+                settings.LANGUAGE_CODE)
+    path = _load_manifest().get(language, {}).get(packages)
+    if path:
+        return staticfiles.static(path)
+    packages = clean_packages(packages)
+    digest = get_catalog(language, packages)[1]
+    return reverse('horizon:jsi18n_versioned',
+                   args=[packages, language, digest])
+
+
+def reset():
+    """Forget the compiled catalogs and the manifest."""
+    with _lock:
+        _catalogs.clear()
+        del _manifest[:]
@@ -0,0 +1,178 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Helpers for running independent, I/O bound calls on a bounded pool
+of threads.
+
+These are meant for fanning out API calls which do not depend on each
+other, e.g. fetching the details of several resources. Results are always
+handed back to the calling thread, so error handling (``exceptions.handle``,
+messages, redirects) keeps happening on the request thread.
+"""
+
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.utils import translation
+import six
+from six.moves import queue
+
+
+class ParallelTimeout(Exception):
+    """Raised when a call did not finish within the allowed time."""
+
+
+# (capture, activate, deactivate) hooks, see register_context().
+_contexts = []
+
+
+def register_context(capture, activate, deactivate):
+    """Carry thread-local state of the calling thread over to the workers.
+
+    ``capture()`` is called on the calling thread when the calls are
+    submitted. Its result is passed to ``activate()`` in the worker thread
+    before every call and to ``deactivate()`` after it.
+    """
+    hooks = (capture, activate, deactivate)
+    if hooks not in _contexts:
+        _contexts.append(hooks)
+
+
+def get_max_workers(max_workers=None):
+    """Return the size of the thread pool to use for parallel calls.
+
+    Falls back to the ``API_PARALLEL_MAX_WORKERS`` setting.
+    """
+    if max_workers is None:
+        max_workers = getattr(settings, 'API_PARALLEL_MAX_WORKERS', 10)
+    return max(1, int(max_workers))
+
+
+def _call(func, language=None, contexts=()):
+    if language:
+        translation.activate(language)
+    for (capture, activate, deactivate), state in contexts:
+        activate(state)
+    try:
+        return func(), None
+    except Exception:
+        return None, sys.exc_info()
+    finally:
+        for (capture, activate, deactivate), state in reversed(contexts):
+            deactivate(state)
+        if language:
+            translation.deactivate()
+
+
+def _timed_out(func, timeout):
+    try:
+        raise ParallelTimeout("%r did not finish within %s seconds."
+                              % (func, timeout))
+    except ParallelTimeout:
+        return None, sys.exc_info()
+
+
+def run_parallel(funcs, max_workers=None, timeout=None):
+    """Call every callable in ``funcs`` on a bounded pool of threads.
+
+    Returns a list of ``(result, exc_info)`` tuples in the same order as
+    ``funcs``; ``exc_info`` is ``None`` when the call succeeded. Nothing is
+    raised from here, callers decide how errors are surfaced.
+
+    ``timeout`` is applied to every call separately, counted from the
+    moment it starts running. A call exceeding it is reported as a
+    :class:`ParallelTimeout`, its thread is abandoned and a replacement
+    worker is started so the remaining calls are not starved.
+    """
+    funcs = list(funcs)
+    results = [None] * len(funcs)
+    if not funcs:
+        return results
+
+    language = translation.get_language()
+    contexts = [(hooks, hooks[0]()) for hooks in _contexts]
+    max_workers = get_max_workers(max_workers)
+    if timeout is None and (max_workers == 1 or len(funcs) == 1):
+        # Nothing to gain from spawning threads.
+        return [_call(func) for func in funcs]
+
+    pending = queue.Queue()
+    for index, func in enumerate(funcs):
+        pending.put((index, func))
+    condition = threading.Condition()
+    running = {}
+    finished = set()
+
+    def worker():
+        while True:
+            try:
+                index, func = pending.get_nowait()
+            except queue.Empty:
+                return
+            with condition:
+                running[index] = time.time()
+            outcome = _call(func, language, contexts)
+            with condition:
+                running.pop(index, None)
+                if index not in finished:
+                    results[index] = outcome
+                    finished.add(index)
+                condition.notify_all()
+
+    def start_worker():
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+
+    for _i in range(min(max_workers, len(funcs))):
+        start_worker()
+
+    with condition:
+        while len(finished) < len(funcs):
+            wait = None
+            if timeout is not None:
+                now = time.time()
+                for index, started in list(running.items()):
+                    if now - started >= timeout:
+                        del running[index]
+                        results[index] = _timed_out(funcs[index], timeout)
+                        finished.add(index)
+                        if not pending.empty():
+                            start_worker()
+                deadlines = [started + timeout
+                             for started in running.values()]
+                wait = max(min(deadlines) - now, 0.01) if deadlines \
+                    else timeout
+            condition.wait(wait)
+    return results
+
+
+def map_parallel(func, items, max_workers=None, timeout=None):
+    """Parallel version of ``[func(item) for item in items]``.
+
+    The first error (in ``items`` order) is re-raised on the calling thread
+    with its original traceback.
+    """
+    results = run_parallel([_bind(func, item) for item in items],
+                           max_workers=max_workers, timeout=timeout)
+    values = []
+    for value, exc_info in results:
+        if exc_info is not None:
+            six.reraise(*exc_info)
+        values.append(value)
+    return values
+
+
+def _bind(func, item):
+    return lambda: func(item)
@@ -23,17 +23,23 @@ from scss.types import String
 import six
 
 
+def get_namespace():
+    """Return the SCSS global namespace of Horizon."""
+    namespace = Namespace()
+
+    # Add variables to the SCSS Global Namespace Here
+    namespace.set_variable(
+        '$static_url',
+        String(six.text_type(getattr(settings, 'STATIC_URL', '/static/')))
+    )
+    return namespace
+
+
 class HorizonScssFilter(DjangoScssFilter):
     def __init__(self, *args, **kwargs):
         super(HorizonScssFilter, self).__init__(*args, **kwargs)
 
-        self.namespace = Namespace()
-
-        # Add variables to the SCSS Global Namespace Here
-        self.namespace.set_variable(
-            '$static_url',
-            String(six.text_type(getattr(settings, 'STATIC_URL', '/static/')))
-        )
+        self.namespace = get_namespace()
 
     # Create a compiler with the right namespace
     @property
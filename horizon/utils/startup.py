@@ -0,0 +1,72 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Timings of the steps of the dashboard startup.
+
+Settings loading, the static files discovery, the import of the pluggable
+dashboard configuration and the dashboard and panel autodiscovery record
+how long they take, so where the startup time of a process goes can be
+reported, e.g. by the ``startup_manifest`` management command.
+"""
+
+import contextlib
+import time
+
+
+_timings = []
+_depth = [0]
+
+
+@contextlib.contextmanager
+def timed(step):
+    """Record the time the block takes as ``step``.
+
+    Steps may be nested, the report then indents the inner ones.
+    """
+    record = [_depth[0], step, 0.0]
+    _timings.append(record)
+    _depth[0] += 1
+    start = time.time()
+    try:
+        yield
+    finally:
+        record[2] = time.time() - start
+        _depth[0] -= 1
+
+
+def timings():
+    """Return the recorded ``(depth, step, seconds)``, in start order."""
+    return [tuple(record) for record in _timings]
+
+
+def report(threshold=0.001):
+    """Return the timings as text, skipping steps faster than ``threshold``.
+
+    The steps nested into a skipped step are skipped too.
+    """
+    lines = ["%-60s %10s" % ("step", "ms")]
+    skipped = None
+    for depth, step, seconds in timings():
+        if skipped is not None and depth > skipped:
+            continue
+        if seconds < threshold:
+            skipped = depth
+            continue
+        skipped = None
+        lines.append("%-60s %10.1f" % ("  " * depth + step, seconds * 1000))
+    return "\n".join(lines)
+
+
+def reset():
+    """Forget the recorded timings."""
+    del _timings[:]
+    _depth[0] = 0
@@ -0,0 +1,177 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Precompiled, content-hashed stylesheets of the themes.
+
+The SCSS of the themes is otherwise compiled by the compressor when a page
+of a theme is first rendered by a process, which takes pyScss many seconds.
+The ``compilethemes`` management command compiles the stylesheet of every
+theme of ``AVAILABLE_THEMES`` ahead of time into ``STATIC_ROOT``, under a
+name that is a digest of its content, and writes a manifest that pages use
+to link to the stylesheet of their theme.
+
+Compiled stylesheets are cached by the digest of their SCSS source, along
+with the digests of all the files it imported, so themes whose SCSS did not
+change are not compiled again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from django.conf import settings
+from django.contrib.staticfiles.templatetags import staticfiles
+from django.template import loader
+from django_pyscss import DjangoScssCompiler
+from django_pyscss import utils as pyscss_utils
+from scss import source as scss_source
+
+from horizon import themes
+from horizon.utils import scss_filter
+
+
+# Where the compiled stylesheets are written, relative to STATIC_ROOT.
+STATIC_DIR = 'dashboard/themes'
+MANIFEST = STATIC_DIR + '/manifest.json'
+CACHE = STATIC_DIR + '/cache.json'
+
+# The SCSS template including the stylesheets of a theme.
+TEMPLATE = 'themes/themes.scss'
+
+_lock = threading.Lock()
+_manifest = []
+
+
+def _digest(content):
+    if not isinstance(content, bytes):
+        content = content.encode('utf-8')
+    return hashlib.sha1(content).hexdigest()[:16]
+
+
+def _static_path(root, path):
+    return os.path.join(root, *path.split('/'))
+
+
+def render(theme):
+    """Return the SCSS source of the stylesheet of ``theme``."""
+    context = dict(getattr(settings, 'HORIZON_COMPRESS_OFFLINE_CONTEXT_BASE',
+                           {}))
+    context.setdefault('HORIZON_CONFIG', settings.HORIZON_CONFIG)
+    context.update(THEME=theme, THEME_DIR=themes.get_theme_dir())
+    # Themes may override templates, the SCSS template included.
+    themes._local.theme = theme
+    try:
+        return loader.render_to_string(TEMPLATE, context)
+    finally:
+        del themes._local.theme
+
+
+def compile_scss(source):
+    """Compile ``source`` and return the CSS and the files it imported.
+
+    Imported files are given by their path relative to the static files
+    root.
+    """
+    compiler = DjangoScssCompiler(namespace=scss_filter.get_namespace())
+    compilation = compiler.make_compilation()
+    compilation.add_source(scss_source.SourceFile.from_string(source))
+    css = compiler.call_and_catch_errors(compilation.run)
+    imports = sorted(set(imported.path for imported in compilation.sources
+                         if imported.origin))
+    return css, imports
+
+
+def _file_digest(path):
+    filename, storage = pyscss_utils.get_file_and_storage(path)
+    if not filename:
+        return None
+    with storage.open(filename) as f:
+        return _digest(f.read())
+
+
+def _load_json(filename):
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def _write_json(filename, data):
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def compile_themes(theme_names=None, root=None):
+    """Compile the stylesheets of the themes and return the manifest.
+
+    ``theme_names`` defaults to all the themes of ``AVAILABLE_THEMES``. The
+    manifest maps the names of the themes to the path of their stylesheet,
+    relative to ``root``, which defaults to ``STATIC_ROOT``. A theme is
+    only compiled again when its SCSS source or one of the files it imports
+    changed.
+    """
+    root = root or settings.STATIC_ROOT
+    directory = _static_path(root, STATIC_DIR)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if theme_names is None:
+        theme_names = [theme[0] for theme in themes.get_themes()]
+    cache = _load_json(_static_path(root, CACHE))
+    manifest = _load_json(_static_path(root, MANIFEST))
+    for theme in theme_names:
+        source = render(theme)
+        key = _digest(source)
+        cached = cache.get(key)
+        if (cached and
+                os.path.exists(_static_path(root, cached['path'])) and
+                all(_file_digest(path) == digest
+                    for path, digest in cached['imports'].items())):
+            manifest[theme] = cached['path']
+            continue
+        css, imports = compile_scss(source)
+        path = '%s/%s.css' % (STATIC_DIR, _digest(css))
+        with open(_static_path(root, path), 'wb') as f:
+            f.write(css.encode('utf-8'))
+        cache[key] = {'path': path,
+                      'imports': dict((imported, _file_digest(imported))
+                                      for imported in imports)}
+        manifest[theme] = path
+    _write_json(_static_path(root, CACHE), cache)
+    _write_json(_static_path(root, MANIFEST), manifest)
+    reset()
+    return manifest
+
+
+def _load_manifest():
+    if not _manifest:
+        manifest = {}
+        if settings.STATIC_ROOT:
+            manifest = _load_json(_static_path(settings.STATIC_ROOT,
+                                               MANIFEST))
+        with _lock:
+            if not _manifest:
+                _manifest.append(manifest)
+    return _manifest[0]
+
+
+def stylesheet_url(theme):
+    """Return the URL of the compiled stylesheet of ``theme``, if any."""
+    path = _load_manifest().get(theme)
+    return staticfiles.static(path) if path else None
+
+
+def reset():
+    """Forget the manifest."""
+    with _lock:
+        del _manifest[:]
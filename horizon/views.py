@@ -12,13 +12,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from django.conf import settings
+from django import http
 from django import shortcuts
 from django import template
+from django.utils import cache
 from django.utils import encoding
 from django.views import generic
 
 import horizon
 from horizon import exceptions
+from horizon.utils import js_catalog
+
+
+# Seconds a content-hashed response may be cached for.
+FAR_FUTURE = 365 * 24 * 3600
 
 
 class PageTitleMixin(object):
@@ -78,6 +86,40 @@ def user_home(request):
     return shortcuts.redirect(horizon.get_user_home(request.user))
 
 
+def javascript_catalog(request, packages, language, digest):
+    """Serve a compiled JavaScript translation catalog.
+
+    Its URL contains the digest of its content, so the response is
+    cacheable forever; requests for an outdated digest get the current
+    catalog without being cached. Other spellings of the packages are
+    redirected to their canonical form.
+    """
+    languages = dict(settings.LANGUAGES)
+    if language not in languages and language != settings.LANGUAGE_CODE:
+        raise http.Http404
+    cleaned = js_catalog.clean_packages(packages)
+    if not cleaned:
+        raise http.Http404
+    if cleaned != packages:
+        return shortcuts.redirect('horizon:jsi18n_versioned',
+                                  cleaned, language, digest,
+                                  permanent=True)
+    content, current = js_catalog.get_catalog(language, packages)
+    etag = '"%s"' % current
+    if digest == current and request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        response = http.HttpResponseNotModified()
+    else:
+        response = http.HttpResponse(content,
+                                     content_type='text/javascript')
+    if digest == current:
+        response['ETag'] = etag
+        cache.patch_cache_control(response, public=True,
+                                  max_age=FAR_FUTURE)
+    else:
+        cache.add_never_cache_headers(response)
+    return response
+
+
 class APIView(HorizonTemplateView):
     """A quick class-based view for putting API data into a template.
 
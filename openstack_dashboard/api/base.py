@@ -16,14 +16,20 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from collections import OrderedDict
 from collections import Sequence  # noqa
+import functools
 
 from django.conf import settings
 
 from horizon import exceptions
+from horizon.utils import memoized
+from horizon.utils import parallel
 
 import six
 
+from openstack_dashboard import exceptions as os_exceptions
+
 
 __all__ = ('APIResourceWrapper', 'APIDictWrapper',
            'get_service_from_catalog', 'url_for',)
@@ -86,26 +92,73 @@ class APIVersionManager(object):
         self._active = None
 
 
+_MISSING = object()
+
+
+class APIWrapperMeta(type):
+    """Metaclass keeping API wrapper instances small.
+
+    Every wrapper class gets an empty ``__slots__`` unless it declares its
+    own, so instances only allocate a ``__dict__`` once an attribute outside
+    of the slots is set on them. It also builds ``_attr_index``, the
+    position of every name of ``_attrs`` in the compact value tuple.
+    """
+    def __new__(mcs, name, bases, namespace):
+        namespace.setdefault('__slots__', ())
+        cls = super(APIWrapperMeta, mcs).__new__(mcs, name, bases, namespace)
+        cls._attr_index = dict(
+            (attr, index)
+            for index, attr in enumerate(getattr(cls, '_attrs', ())))
+        return cls
+
+
+@six.add_metaclass(APIWrapperMeta)
 class APIResourceWrapper(object):
     """Simple wrapper for api objects.
 
     Define _attrs on the child class and pass in the
-    api object as the only argument to the constructor
+    api object as the only argument to the constructor.
+
+    Set ``compact = True`` on a child class (see :func:`compact`) to copy
+    the values of ``_attrs`` out of the api object and drop the object
+    itself. Such wrappers only expose ``_attrs``, so properties of the child
+    class must not rely on ``_apiresource``.
     """
+    __slots__ = ('_apiresource', '_values', '__dict__', '__weakref__')
     _attrs = []
-    _apiresource = None  # Make sure _apiresource is there even in __init__.
+    compact = False
 
     def __init__(self, apiresource):
-        self._apiresource = apiresource
-
-    def __getattribute__(self, attr):
-        try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            if attr not in self._attrs:
-                raise
-            # __getattr__ won't find properties
-            return getattr(self._apiresource, attr)
+        if self.compact:
+            self._values = tuple(getattr(apiresource, attr, _MISSING)
+                                 for attr in self._attrs)
+        else:
+            self._apiresource = apiresource
+
+    def __getattr__(self, attr):
+        # Only called when the regular lookup failed, i.e. for values
+        # living on the wrapped object. __getattr__ won't find properties.
+        if attr not in self._attr_index:
+            raise AttributeError(attr)
+        if self.compact:
+            value = self._values[self._attr_index[attr]]
+            if value is _MISSING:
+                raise AttributeError(attr)
+            return value
+        return getattr(self._apiresource, attr)
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', None) or {})
+        for slot in ('_apiresource', '_values'):
+            try:
+                state[slot] = object.__getattribute__(self, slot)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
 
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__,
@@ -116,10 +169,37 @@ class APIResourceWrapper(object):
     def to_dict(self):
         obj = {}
         for key in self._attrs:
-            obj[key] = getattr(self._apiresource, key, None)
+            if self.compact:
+                value = self._values[self._attr_index[key]]
+                obj[key] = None if value is _MISSING else value
+            else:
+                obj[key] = getattr(self._apiresource, key, None)
         return obj
 
 
+_compact_classes = {}
+
+
+def compact(wrapper_class):
+    """Return the compact variant of an :class:`APIResourceWrapper` class.
+
+    Instances of the returned subclass keep only the values of ``_attrs``
+    instead of a reference to the whole client object, which considerably
+    reduces the memory held by large listings.
+    """
+    if wrapper_class.compact:
+        return wrapper_class
+    try:
+        return _compact_classes[wrapper_class]
+    except KeyError:
+        name = 'Compact%s' % wrapper_class.__name__
+        klass = type(wrapper_class)(name, (wrapper_class,),
+                                    {'compact': True,
+                                     '__module__': wrapper_class.__module__})
+        return _compact_classes.setdefault(wrapper_class, klass)
+
+
+@six.add_metaclass(APIWrapperMeta)
 class APIDictWrapper(object):
     """Simple wrapper for api dictionaries
 
@@ -130,19 +210,28 @@ class APIDictWrapper(object):
     Attribute access is the preferred method of access, to be
     consistent with api resource objects from novaclient.
     """
-
-    _apidict = {}  # Make sure _apidict is there even in __init__.
+    __slots__ = ('_apidict', '__dict__', '__weakref__')
 
     def __init__(self, apidict):
         self._apidict = apidict
 
-    def __getattribute__(self, attr):
+    def __getattr__(self, attr):
+        if attr == '_apidict':
+            # Not set yet, e.g. while unpickling.
+            raise AttributeError(attr)
         try:
-            return object.__getattribute__(self, attr)
-        except AttributeError:
-            if attr not in self._apidict:
-                raise
             return self._apidict[attr]
+        except KeyError:
+            raise AttributeError(attr)
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', None) or {})
+        state['_apidict'] = self._apidict
+        return state
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
 
     def __getitem__(self, item):
         try:
@@ -188,9 +277,12 @@ class QuotaSet(Sequence):
     the bracket notation (`qs["my_quota"] = 0`) to add new quota values, and
     use the `get` method to retrieve a specific quota, but otherwise it
     behaves much like a list or tuple, particularly in supporting iteration.
+
+    Quotas are kept in an ordered mapping by name, so lookups, merges and
+    removals don't need to scan the whole set.
     """
     def __init__(self, apiresource=None):
-        self.items = []
+        self._quotas = OrderedDict()
         if apiresource:
             if hasattr(apiresource, '_info'):
                 items = apiresource._info.items()
@@ -202,14 +294,23 @@ class QuotaSet(Sequence):
                     continue
                 self[k] = v
 
+    @property
+    def items(self):
+        return list(self._quotas.values())
+
     def __setitem__(self, k, v):
-            v = int(v) if v is not None else v
-            q = Quota(k, v)
-            self.items.append(q)
+        v = int(v) if v is not None else v
+        self._quotas[k] = Quota(k, v)
 
     def __getitem__(self, index):
         return self.items[index]
 
+    def __iter__(self):
+        return six.itervalues(self._quotas)
+
+    def __reversed__(self):
+        return reversed(self.items)
+
     def __add__(self, other):
         """Merge another QuotaSet into this one. Existing quotas are
         not overridden.
@@ -220,23 +321,29 @@ class QuotaSet(Sequence):
             raise ValueError(msg)
 
         for item in other:
-            if self.get(item.name).limit is None:
-                self.items.append(item)
+            current = self._quotas.get(item.name)
+            if current is None or current.limit is None:
+                self._quotas[item.name] = item
         return self
 
     def __len__(self):
-        return len(self.items)
+        return len(self._quotas)
 
     def __repr__(self):
         return repr(self.items)
 
     def get(self, key, default=None):
-        match = [quota for quota in self.items if quota.name == key]
-        return match.pop() if len(match) else Quota(key, default)
+        quota = self._quotas.get(key)
+        return quota if quota is not None else Quota(key, default)
 
     def add(self, other):
         return self.__add__(other)
 
+    def remove(self, *keys):
+        """Remove the quotas with the given names, ignoring unknown ones."""
+        for key in keys:
+            self._quotas.pop(key, None)
+
 
 def get_service_from_catalog(catalog, service_type):
     if catalog:
@@ -346,3 +453,43 @@ def _get_endpoint_region(endpoint):
     both Keystone V2 and V3.
     """
     return endpoint.get('region_id') or endpoint.get('region')
+
+
+@memoized.memoized
+def _resolved(request, kind):
+    return {}
+
+
+def get_many(request, kind, ids, get, list_all, max_lookups=None):
+    """Return an OrderedDict of the resources with the given ``ids``.
+
+    Meant for resolving the few resources referenced from a page of other
+    resources, e.g. the servers volumes are attached to. ``kind`` names
+    the resource type; resources resolved before while serving the same
+    request are reused. The others are fetched by calling ``get(id)`` on
+    a bounded pool of threads or, when there are more than
+    ``max_lookups`` of them (the ``API_RESOLVE_MAX_LOOKUPS`` setting by
+    default), by calling ``list_all()`` once.
+
+    Resources which do not exist are left out. Any other error is raised.
+    """
+    if max_lookups is None:
+        max_lookups = getattr(settings, 'API_RESOLVE_MAX_LOOKUPS', 20)
+    resolved = _resolved(request, kind)
+    ids = list(OrderedDict.fromkeys(i for i in ids if i))
+    missing = [i for i in ids if i not in resolved]
+    if len(missing) > max_lookups:
+        resources = dict((r.id, r) for r in list_all())
+        for resource_id in missing:
+            resolved[resource_id] = resources.get(resource_id)
+    elif missing:
+        results = parallel.run_parallel(
+            [functools.partial(get, resource_id) for resource_id in missing])
+        for resource_id, (resource, exc_info) in zip(missing, results):
+            if exc_info is not None:
+                if not isinstance(exc_info[1], os_exceptions.NOT_FOUND):
+                    six.reraise(*exc_info)
+                resource = None
+            resolved[resource_id] = resource
+    return OrderedDict((i, resolved[i]) for i in ids
+                       if resolved[i] is not None)
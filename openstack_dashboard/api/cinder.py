@@ -268,9 +268,12 @@ def volume_list_paged(request, search_opts=None, marker=None, paginate=False,
 def volume_get(request, volume_id):
     volume_data = cinderclient(request).volumes.get(volume_id)
 
+    instances = nova.server_get_many(
+        request, [attachment.get('server_id')
+                  for attachment in volume_data.attachments])
     for attachment in volume_data.attachments:
-        if "server_id" in attachment:
-            instance = nova.server_get(request, attachment['server_id'])
+        if attachment.get('server_id') in instances:
+            instance = instances[attachment['server_id']]
             attachment['instance_name'] = instance.name
         else:
             # Nova volume can occasionally send back error'd attachments
@@ -288,6 +291,19 @@ def volume_get(request, volume_id):
     return Volume(volume_data)
 
 
+def volume_get_many(request, volume_ids, search_opts=None):
+    """Return an OrderedDict of the existing volumes among volume_ids.
+
+    Volumes are fetched one by one unless there are too many of them, then
+    they are listed with ``search_opts``. See
+    :func:`openstack_dashboard.api.base.get_many`.
+    """
+    return base.get_many(
+        request, 'volumes', volume_ids,
+        lambda volume_id: Volume(cinderclient(request).volumes.get(volume_id)),
+        lambda: volume_list(request, search_opts=search_opts))
+
+
 def volume_create(request, size, name, description, volume_type,
                   snapshot_id=None, metadata=None, image_id=None,
                   availability_zone=None, source_volid=None):
@@ -55,6 +55,94 @@ class Firewall(neutron.NeutronAPIDictWrapper):
         return firewall_dict
 
 
+def _get_by_ids(request, collection, ids):
+    """Return the API dicts of a firewall collection with the given IDs.
+
+    All of them are fetched with a single call filtered on ``id`` (or as
+    few as the URI length limit of Neutron allows), the result is an
+    OrderedDict indexed by ID.
+    """
+    ids = list(OrderedDict.fromkeys(i for i in ids if i))
+    if not ids:
+        return OrderedDict()
+    list_method = getattr(neutronclient(request), 'list_%s' % collection)
+    resources = neutron.list_resources_with_long_filters(
+        lambda request, **params: list_method(**params).get(collection),
+        'id', ids, request=request)
+    return OrderedDict((r['id'], r) for r in resources)
+
+
+def _wrap(wrapper_class, apidict):
+    if apidict is None:
+        return None
+    return wrapper_class(dict(apidict))
+
+
+class ResourceGraph(object):
+    """Firewall rules, policies and firewalls available to a tenant.
+
+    Each collection is loaded from Neutron at most once, when it is first
+    needed, and relations are joined through dictionaries indexed by ID,
+    so showing rules, policies and firewalls together costs one list call
+    per collection and ownership. Wrapper objects are built from copies
+    of the API dicts, so callers may change them freely.
+
+    Use :func:`resource_graph` to get the graph of the current request.
+    """
+
+    def __init__(self, request, tenant_id):
+        self.request = request
+        self.tenant_id = tenant_id
+        self._loaded = {}
+
+    def _load(self, collection, shared=True):
+        if collection not in self._loaded:
+            list_method = getattr(neutronclient(self.request),
+                                  'list_%s' % collection)
+            if shared:
+                resources = list_method(tenant_id=self.tenant_id,
+                                        shared=False).get(collection)
+                resources += list_method(shared=True).get(collection)
+            else:
+                # NOTE(amotoki): 'shared' is not visible for firewalls.
+                resources = list_method(
+                    tenant_id=self.tenant_id).get(collection)
+            self._loaded[collection] = OrderedDict((r['id'], r)
+                                                   for r in resources)
+        return self._loaded[collection]
+
+    def _policies_of(self, resources):
+        index = self._load('firewall_policies')
+        return dict((r['id'],
+                     _wrap(Policy, index.get(r['firewall_policy_id'])))
+                    for r in resources)
+
+    def rule_list(self):
+        rules = list(self._load('firewall_rules').values())
+        policies = self._policies_of(rules)
+        return [Rule(dict(r, policy=policies[r['id']])) for r in rules]
+
+    def policy_list(self):
+        policies = list(self._load('firewall_policies').values())
+        index = self._load('firewall_rules')
+        return [Policy(dict(p, rules=[_wrap(Rule, index.get(rule_id))
+                                      for rule_id in p['firewall_rules']]))
+                for p in policies]
+
+    def firewall_list(self):
+        firewalls = list(self._load('firewalls', shared=False).values())
+        policies = self._policies_of(firewalls)
+        return [Firewall(dict(f, policy=policies[f['id']]))
+                for f in firewalls]
+
+
+@memoized.memoized
+def resource_graph(request, tenant_id):
+    """Return the :class:`ResourceGraph` of ``tenant_id`` for this request.
+    """
+    return ResourceGraph(request, tenant_id)
+
+
 def rule_create(request, **kwargs):
     """Create a firewall rule
 
@@ -88,6 +176,8 @@ def rule_list_for_tenant(request, tenant_id, **kwargs):
     This is required because Neutron returns all resources including
     all tenants if a user has admin role.
     """
+    if not kwargs:
+        return resource_graph(request, tenant_id).rule_list()
     rules = rule_list(request, tenant_id=tenant_id, shared=False, **kwargs)
     shared_rules = rule_list(request, shared=True, **kwargs)
     return rules + shared_rules
@@ -97,10 +187,11 @@ def _rule_list(request, expand_policy, **kwargs):
     rules = neutronclient(request).list_firewall_rules(
         **kwargs).get('firewall_rules')
     if expand_policy and rules:
-        policies = _policy_list(request, expand_rule=False)
-        policy_dict = OrderedDict((p.id, p) for p in policies)
+        policy_dict = _get_by_ids(request, 'firewall_policies',
+                                  [r['firewall_policy_id'] for r in rules])
         for rule in rules:
-            rule['policy'] = policy_dict.get(rule['firewall_policy_id'])
+            rule['policy'] = _wrap(Policy, policy_dict.get(
+                rule['firewall_policy_id']))
     return [Rule(r) for r in rules]
 
 
@@ -159,6 +250,8 @@ def policy_list_for_tenant(request, tenant_id, **kwargs):
     This is required because Neutron returns all resources including
     all tenants if a user has admin role.
     """
+    if not kwargs:
+        return resource_graph(request, tenant_id).policy_list()
     policies = policy_list(request, tenant_id=tenant_id,
                            shared=False, **kwargs)
     shared_policies = policy_list(request, shared=True, **kwargs)
@@ -169,10 +262,12 @@ def _policy_list(request, expand_rule, **kwargs):
     policies = neutronclient(request).list_firewall_policies(
         **kwargs).get('firewall_policies')
     if expand_rule and policies:
-        rules = _rule_list(request, expand_policy=False)
-        rule_dict = OrderedDict((rule.id, rule) for rule in rules)
+        rule_dict = _get_by_ids(request, 'firewall_rules',
+                                [rule for p in policies
+                                 for rule in p['firewall_rules']])
         for p in policies:
-            p['rules'] = [rule_dict.get(rule) for rule in p['firewall_rules']]
+            p['rules'] = [_wrap(Rule, rule_dict.get(rule))
+                          for rule in p['firewall_rules']]
     return [Policy(p) for p in policies]
 
 
@@ -250,6 +345,8 @@ def firewall_list_for_tenant(request, tenant_id, **kwargs):
     # Thus this method returns the same as when tenant_id is specified,
     # but I would like to have this method for symmetry to firewall
     # rules and policies to avoid unnecessary confusion.
+    if not kwargs:
+        return resource_graph(request, tenant_id).firewall_list()
     return firewall_list(request, tenant_id=tenant_id, **kwargs)
 
 
@@ -257,10 +354,11 @@ def _firewall_list(request, expand_policy, **kwargs):
     firewalls = neutronclient(request).list_firewalls(
         **kwargs).get('firewalls')
     if expand_policy and firewalls:
-        policies = _policy_list(request, expand_rule=False)
-        policy_dict = OrderedDict((p.id, p) for p in policies)
+        policy_dict = _get_by_ids(request, 'firewall_policies',
+                                  [f['firewall_policy_id'] for f in firewalls])
         for fw in firewalls:
-            fw['policy'] = policy_dict.get(fw['firewall_policy_id'])
+            fw['policy'] = _wrap(Policy, policy_dict.get(
+                fw['firewall_policy_id']))
     return [Firewall(f) for f in firewalls]
 
 
@@ -19,21 +19,28 @@
 from __future__ import absolute_import
 
 import collections
+import hashlib
 import itertools
 import json
 import logging
 import os
+import threading
+import time
 
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.utils.translation import ugettext_lazy as _
 
 
 import glanceclient as glance_client
-from six.moves import _thread as thread
+from glanceclient.v1 import images as v1_images
+from six.moves import queue
 
+from horizon import exceptions
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from openstack_dashboard.api import base
@@ -67,7 +74,9 @@ def glanceclient(request, version='1'):
 
 
 def image_delete(request, image_id):
-    return glanceclient(request).images.delete(image_id)
+    result = glanceclient(request).images.delete(image_id)
+    _invalidate_image_catalog(request)
+    return result
 
 
 def image_get(request, image_id):
@@ -187,10 +196,82 @@ def image_list_detailed(request, marker=None, sort_dir='desc',
     return images, has_more_data, has_prev_data
 
 
+def _image_catalog_key(request, project_id=None):
+    key = '%s|%s' % (base.url_for(request, 'image'), project_id or '')
+    return 'horizon:glance:image_catalog:%s' % \
+        hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _invalidate_image_catalog(request, owner=None):
+    keys = [_image_catalog_key(request),
+            _image_catalog_key(request, request.user.project_id)]
+    if owner:
+        keys.append(_image_catalog_key(request, owner))
+    cache.delete_many(keys)
+
+
+def _catalog_since(images):
+    stamps = [image['updated_at'] for image in images.values()
+              if image.get('updated_at')]
+    return max(stamps) if stamps else None
+
+
+def image_catalog(request, project_id=None):
+    """Returns the active images owned by ``project_id``, or the active
+    public images if no project is given.
+
+    The catalog is shared between requests through the Django cache, keyed
+    by Glance endpoint and project, and dropped after
+    ``OPENSTACK_IMAGE_CATALOG_TTL`` seconds. Every tenth of that time it is
+    brought up to date by asking Glance only for the images changed since
+    the most recent ``updated_at`` it holds. Creating, updating or deleting
+    an image through Horizon drops the affected catalogs.
+    """
+    if project_id is None:
+        filters = {"is_public": True}
+    else:
+        filters = {"property-owner_id": project_id}
+    key = _image_catalog_key(request, project_id)
+    ttl = getattr(settings, 'OPENSTACK_IMAGE_CATALOG_TTL', 300)
+    now = time.time()
+    catalog = cache.get(key)
+
+    if catalog is not None and now - catalog['checked'] < ttl / 10.0:
+        return [v1_images.Image(None, info, loaded=True)
+                for info in catalog['images'].values()]
+
+    if catalog is None or catalog['since'] is None:
+        filters['status'] = 'active'
+        images, _more, _prev = image_list_detailed(request, filters=filters)
+        catalog = {'images': collections.OrderedDict(
+            (image.id, image.to_dict()) for image in images),
+            'created': now}
+    else:
+        # Deleted and deactivated images are listed as well once
+        # changes-since is given, they are dropped from the catalog.
+        filters['changes-since'] = catalog['since']
+        changed, _more, _prev = image_list_detailed(
+            request, sort_key='updated_at', sort_dir='asc', filters=filters)
+        for image in changed:
+            catalog['images'].pop(image.id, None)
+            if image.status == 'active' and \
+                    not getattr(image, 'deleted', False):
+                catalog['images'][image.id] = image.to_dict()
+        images = [v1_images.Image(None, info, loaded=True)
+                  for info in catalog['images'].values()]
+    catalog['since'] = _catalog_since(catalog['images'])
+    catalog['checked'] = now
+    # Incremental updates do not extend the lifetime of the catalog.
+    cache.set(key, catalog, max(1, int(catalog['created'] + ttl - now)))
+    return images
+
+
 def image_update(request, image_id, **kwargs):
     image_data = kwargs.get('data', None)
     try:
-        return glanceclient(request).images.update(image_id, **kwargs)
+        image = glanceclient(request).images.update(image_id, **kwargs)
+        _invalidate_image_catalog(request, getattr(image, 'owner', None))
+        return image
     finally:
         if image_data:
             try:
@@ -205,6 +286,182 @@ def image_update(request, image_id, **kwargs):
                 LOG.warning(msg)
 
 
+def _upload_progress_key(image_id):
+    return 'horizon:glance:image_upload:%s' % image_id
+
+
+def image_upload_progress(image_id):
+    """Returns the progress of an image upload handled by Horizon.
+
+    The result is a dict with the ``uploaded`` and total ``size`` in bytes,
+    or ``None`` if no upload of that image is in progress.
+    """
+    return cache.get(_upload_progress_key(image_id))
+
+
+class _UploadReader(object):
+    """File-like wrapper recording how much of an image was read."""
+
+    # Progress is published at most once per interval.
+    interval = 1.0
+
+    def __init__(self, data, image_id):
+        self._data = data
+        self.file = getattr(data, 'file', data)
+        self.image_id = image_id
+        self.size = getattr(data, 'size', None)
+        self.uploaded = 0
+        self._published = 0
+
+    def read(self, size=-1):
+        chunk = self._data.read(size)
+        self.uploaded += len(chunk)
+        now = time.time()
+        if not chunk or now - self._published >= self.interval:
+            self._published = now
+            cache.set(_upload_progress_key(self.image_id),
+                      {'uploaded': self.uploaded, 'size': self.size}, 3600)
+        return chunk
+
+    def seek(self, *args):
+        return self._data.seek(*args)
+
+    def tell(self):
+        return self._data.tell()
+
+
+class ImageUploadExecutor(object):
+    """Bounded pool of threads uploading image data to Glance.
+
+    At most ``max_workers`` uploads run at the same time and at most
+    ``max_queued`` wait for a free worker; further uploads are refused
+    instead of piling up threads holding image data. Workers are started
+    on demand and exit once the queue is drained.
+    """
+
+    busy_message = _("Too many image uploads are in progress. "
+                     "Please try again later.")
+
+    def __init__(self, max_workers, max_queued):
+        self.max_workers = max_workers
+        self._queue = queue.Queue()
+        # Queue slots, taken before an upload is queued and given back
+        # once a worker picked it up.
+        self._slots = threading.BoundedSemaphore(max_queued)
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._stats = collections.Counter()
+
+    def reserve(self):
+        """Takes a queue slot for an upload.
+
+        Raises NotAvailable if no further upload can be queued. The slot
+        is used by :meth:`submit` with ``reserved=True``, or given back
+        with :meth:`release`.
+        """
+        if not self._slots.acquire(False):
+            raise exceptions.NotAvailable(self.busy_message)
+
+    def release(self):
+        """Gives back a slot taken with :meth:`reserve` and not used."""
+        self._slots.release()
+
+    def submit(self, request, image_id, data, reserved=False):
+        if not reserved:
+            self.reserve()
+        self._queue.put((request, image_id, data))
+        cache.set(_upload_progress_key(image_id),
+                  {'uploaded': 0, 'size': getattr(data, 'size', None)}, 3600)
+        with self._lock:
+            if self._workers < self.max_workers:
+                self._workers += 1
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+
+    def _work(self):
+        while True:
+            with self._lock:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    self._workers -= 1
+                    return
+                self._stats['active'] += 1
+            self._slots.release()
+            self._upload(*item)
+
+    def _upload(self, request, image_id, data):
+        reader = _UploadReader(data, image_id)
+        started = time.time()
+        try:
+            image_update(request, image_id, data=reader, purge_props=False)
+        except Exception:
+            LOG.exception("Upload of image %s failed." % image_id)
+            outcome = 'failed'
+        else:
+            outcome = 'completed'
+        finally:
+            cache.delete(_upload_progress_key(image_id))
+        elapsed = time.time() - started
+        with self._lock:
+            self._stats['active'] -= 1
+            self._stats[outcome] += 1
+            self._stats['bytes'] += reader.uploaded
+            self._stats['seconds'] += elapsed
+        LOG.info("Upload of image %s %s: %d bytes in %.1f seconds."
+                 % (image_id, outcome, reader.uploaded, elapsed))
+
+    def metrics(self):
+        """Returns queue depth and throughput counters of this process."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        seconds = stats.get('seconds', 0)
+        stats['bytes_per_second'] = (stats.get('bytes', 0) / seconds
+                                     if seconds else 0)
+        return stats
+
+
+_upload_executor = None
+_upload_executor_lock = threading.Lock()
+
+
+def get_upload_executor():
+    """Returns the image upload executor of this process."""
+    global _upload_executor
+    with _upload_executor_lock:
+        if _upload_executor is None:
+            _upload_executor = ImageUploadExecutor(
+                getattr(settings, 'IMAGE_UPLOAD_MAX_WORKERS', 4),
+                getattr(settings, 'IMAGE_UPLOAD_MAX_QUEUED', 8))
+    return _upload_executor
+
+
+def _spool_upload(data):
+    if isinstance(data, TemporaryUploadedFile):
+        # Hack to fool Django, so we can keep file open in the new thread.
+        data.file.close_called = True
+    elif isinstance(data, InMemoryUploadedFile):
+        # The file will be closed by Django once the request is done, so
+        # its content is either written to a temporary file or cloned.
+        threshold = getattr(settings, 'IMAGE_UPLOAD_SPOOL_THRESHOLD',
+                            1024 * 1024)
+        if data.size > threshold:
+            spooled = TemporaryUploadedFile(data.name, data.content_type,
+                                            data.size, data.charset)
+            for chunk in data.chunks():
+                spooled.write(chunk)
+            spooled.seek(0)
+            spooled.file.close_called = True
+            data = spooled
+        else:
+            data = SimpleUploadedFile(data.name,
+                                      data.read(),
+                                      data.content_type)
+    return data
+
+
 def image_create(request, **kwargs):
     """Create image.
 
@@ -219,27 +476,28 @@ def image_create(request, **kwargs):
     asynchronously.
 
     In the case of 'data' the process of uploading the data may take
-    some time and is handed off to a separate thread.
+    some time and is handed off to the upload executor, see
+    :func:`get_upload_executor`. Its progress is available through
+    :func:`image_upload_progress`.
     """
     data = kwargs.pop('data', None)
-
-    image = glanceclient(request).images.create(**kwargs)
-
-    if data:
-        if isinstance(data, TemporaryUploadedFile):
-            # Hack to fool Django, so we can keep file open in the new thread.
-            data.file.close_called = True
-        if isinstance(data, InMemoryUploadedFile):
-            # Clone a new file for InMemeoryUploadedFile.
-            # Because the old one will be closed by Django.
-            data = SimpleUploadedFile(data.name,
-                                      data.read(),
-                                      data.content_type)
-        thread.start_new_thread(image_update,
-                                (request, image.id),
-                                {'data': data,
-                                 'purge_props': False})
-
+    if not data:
+        image = glanceclient(request).images.create(**kwargs)
+        _invalidate_image_catalog(request, getattr(image, 'owner', None))
+        return image
+
+    # Refuse the upload before an image without data is created, the
+    # queue slot is kept for it until it is submitted.
+    executor = get_upload_executor()
+    executor.reserve()
+    try:
+        data = _spool_upload(data)
+        image = glanceclient(request).images.create(**kwargs)
+    except Exception:
+        executor.release()
+        raise
+    _invalidate_image_catalog(request, getattr(image, 'owner', None))
+    executor.submit(request, image.id, data, reserved=True)
     return image
 
 
@@ -10,20 +10,27 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import base64
 import contextlib
+import functools
+import hashlib
 import six
+from six.moves.urllib import error
 from six.moves.urllib import request
+import socket
 
 from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import ugettext_lazy as _
 from oslo_serialization import jsonutils
 
 from heatclient import client as heat_client
 from heatclient.common import template_format
-from heatclient.common import template_utils
-from heatclient.common import utils as heat_utils
+from heatclient import exc as heat_exc
 from horizon import exceptions
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 from openstack_dashboard.api import base
 
 
@@ -102,46 +109,153 @@ def _ignore_if(key, value):
     return False
 
 
+def _cache_key(kind, value):
+    if isinstance(value, six.text_type):
+        value = value.encode('utf-8')
+    return 'horizon:heat:%s:%s' % (kind, hashlib.sha1(value).hexdigest())
+
+
+def _read_url(url):
+    """Returns the content of ``url``, using the Django cache."""
+    key = _cache_key('url', url)
+    content = cache.get(key)
+    if content is not None:
+        return content
+    timeout = getattr(settings, 'OPENSTACK_HEAT_TEMPLATE_FETCH_TIMEOUT', 10)
+    try:
+        with contextlib.closing(request.urlopen(url, timeout=timeout)) as u:
+            content = u.read()
+    except (error.URLError, socket.timeout):
+        # A timeout while reading the response is not wrapped in URLError.
+        raise heat_exc.CommandError(_('Could not fetch contents for %s')
+                                    % url)
+    if content:
+        try:
+            content.decode('utf-8')
+        except ValueError:
+            content = base64.encodestring(content)
+    cache.set(key, content,
+              getattr(settings, 'OPENSTACK_HEAT_TEMPLATE_CACHE_TTL', 300))
+    return content
+
+
+def _parse_template(content):
+    """Returns the parsed template, or ``None`` if ``content`` is not one.
+
+    Results are cached by content hash, so the same template fetched from
+    several URLs or validated several times is only parsed once.
+    """
+    key = _cache_key('template', content)
+    template = cache.get(key)
+    if template is None:
+        try:
+            if isinstance(content, six.binary_type):
+                content = content.decode('utf-8')
+            template = template_format.parse(content)
+        except (ValueError, TypeError):
+            template = False
+        cache.set(key, template,
+                  getattr(settings, 'OPENSTACK_HEAT_TEMPLATE_CACHE_TTL', 300))
+    return template or None
+
+
+def _find_file_urls(from_data, urls):
+    if isinstance(from_data, dict):
+        for key, value in six.iteritems(from_data):
+            if _ignore_if(key, value):
+                _find_file_urls(value, urls)
+                continue
+            if not value.startswith(('http://', 'https://')):
+                raise exceptions.GetFileError(value, 'get_file')
+            if value not in urls:
+                urls.append(value)
+    elif isinstance(from_data, list):
+        for value in from_data:
+            _find_file_urls(value, urls)
+    return urls
+
+
+def _check_cycles(root, includes):
+    """Raises TemplateCycleError if nested templates include each other."""
+    path = []
+    done = set()
+
+    def visit(url):
+        if url in path:
+            raise exceptions.TemplateCycleError(path[path.index(url):] +
+                                                [url])
+        if url in done:
+            return
+        path.append(url)
+        for child in includes.get(url, ()):
+            visit(child)
+        path.pop()
+        done.add(url)
+
+    visit(root)
+
+
+def _fetch_all(urls):
+    timeout = getattr(settings, 'OPENSTACK_HEAT_TEMPLATE_FETCH_TIMEOUT', 10)
+    max_workers = getattr(settings,
+                          'OPENSTACK_HEAT_TEMPLATE_FETCH_MAX_WORKERS', 8)
+    results = parallel.run_parallel(
+        [functools.partial(_read_url, url) for url in urls],
+        max_workers=max_workers, timeout=timeout)
+    contents = []
+    for url, (content, exc_info) in zip(urls, results):
+        if exc_info is not None:
+            if issubclass(exc_info[0], parallel.ParallelTimeout):
+                raise heat_exc.CommandError(
+                    _('Could not fetch contents for %s') % url)
+            six.reraise(*exc_info)
+        contents.append(content)
+    return contents
+
+
+def _get_file_contents(template, files, root=None):
+    """Fetches every file and nested template referenced by ``template``.
+
+    Templates are resolved level by level: all URLs found on a level are
+    fetched concurrently, each URL only once, and nested templates found
+    among them make up the next level.
+    """
+    includes = {root: _find_file_urls(template, [])}
+    level = includes[root]
+    while level:
+        next_level = []
+        for url, content in zip(level, _fetch_all(level)):
+            nested = _parse_template(content)
+            if nested is None:
+                files[url] = content
+                continue
+            files[url] = jsonutils.dumps(nested)
+            includes[url] = _find_file_urls(nested, [])
+            next_level.extend(child for child in includes[url]
+                              if child not in files and
+                              child not in next_level)
+        level = next_level
+    _check_cycles(root, includes)
+
+
 def get_template_files(template_data=None, template_url=None):
     if template_data:
         tpl = template_data
     elif template_url:
-        with contextlib.closing(request.urlopen(template_url)) as u:
-            tpl = u.read()
+        tpl = _read_url(template_url)
     else:
         return {}, None
     if not tpl:
         return {}, None
     if isinstance(tpl, six.binary_type):
         tpl = tpl.decode('utf-8')
-    template = template_format.parse(tpl)
+    # Parsing again raises the error explaining why tpl is no template.
+    template = _parse_template(tpl) or template_format.parse(tpl)
     files = {}
-    _get_file_contents(template, files)
+    _get_file_contents(template, files, template_url)
     return files, template
 
 
-def _get_file_contents(from_data, files):
-    if not isinstance(from_data, (dict, list)):
-        return
-    if isinstance(from_data, dict):
-        recurse_data = six.itervalues(from_data)
-        for key, value in six.iteritems(from_data):
-            if _ignore_if(key, value):
-                continue
-            if not value.startswith(('http://', 'https://')):
-                raise exceptions.GetFileError(value, 'get_file')
-            if value not in files:
-                file_content = heat_utils.read_url_content(value)
-                if template_utils.is_template(file_content):
-                    template = get_template_files(template_url=value)[1]
-                    file_content = jsonutils.dumps(template)
-                files[value] = file_content
-    else:
-        recurse_data = from_data
-    for value in recurse_data:
-        _get_file_contents(value, files)
-
-
 def stack_delete(request, stack_id):
     return heatclient(request).stacks.delete(stack_id)
 
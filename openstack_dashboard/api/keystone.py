@@ -18,9 +18,12 @@
 #    under the License.
 
 import collections
+import functools
+import hashlib
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
 import six
 import six.moves.urllib.parse as urlparse
@@ -33,6 +36,8 @@ from openstack_auth import utils as auth_utils
 from horizon import exceptions
 from horizon import messages
 from horizon.utils import functions as utils
+from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 
 from openstack_dashboard.api import base
 from openstack_dashboard import policy
@@ -152,13 +157,13 @@ def keystoneclient(request, admin=False):
 
     if is_multi_domain_enabled:
         # Cloud Admin, Domain Admin or Mixed Domain Admin
-        if is_domain_admin(request):
+        if _policy_check(request, "admin_and_matching_domain_id"):
             domain_token = request.session.get('domain_token')
             if domain_token:
                 token_id = getattr(domain_token, 'auth_token', None)
 
     if admin:
-        if not policy.check((("identity", "admin_required"),), request):
+        if not _policy_check(request, "admin_required"):
             raise exceptions.NotAuthorized
         endpoint_type = 'adminURL'
     else:
@@ -191,11 +196,68 @@ def keystoneclient(request, admin=False):
     return conn
 
 
+@memoized
+def _policy_check(request, rule):
+    """Checks an identity policy ``rule`` once per request."""
+    return policy.check((("identity", rule),), request)
+
+
+def _domain_names_key(request):
+    endpoint = _get_endpoint_url(request, 'adminURL')
+    endpoint = urlparse.urljoin(endpoint.rstrip('/'), 'v%s' % VERSIONS.active)
+    return 'horizon:keystone:domain_names:%s' % \
+        hashlib.sha1(endpoint.encode('utf-8')).hexdigest()
+
+
+def _domain_names(request):
+    return cache.get(_domain_names_key(request)) or {'names': {},
+                                                     'complete': False}
+
+
+def _domain_names_store(request, names, complete=False):
+    """Adds ``{domain_id: name}`` mappings to the cached domain names.
+
+    ``complete`` tells that ``names`` are all the domains.
+    """
+    cached = _domain_names(request)
+    if complete:
+        cached = {'names': {}, 'complete': True}
+    cached['names'].update(names)
+    ttl = getattr(settings, 'OPENSTACK_KEYSTONE_DOMAIN_CACHE_TTL', 600)
+    cache.set(_domain_names_key(request), cached, ttl)
+
+
+def _domain_names_forget(request):
+    cache.delete(_domain_names_key(request))
+
+
+def domain_name(request, domain_id):
+    """Returns the name of a domain.
+
+    Names are kept in the Django cache for
+    ``OPENSTACK_KEYSTONE_DOMAIN_CACHE_TTL`` seconds, so Keystone is only
+    asked for domains whose name is not known yet. Returns ``None`` when
+    the domain could not be retrieved.
+    """
+    names = _domain_names(request)['names']
+    if domain_id in names:
+        return names[domain_id]
+    try:
+        name = domain_get(request, domain_id).name
+    except Exception:
+        LOG.warning("Unable to retrieve Domain: %s" % domain_id)
+        return None
+    _domain_names_store(request, {domain_id: name})
+    return name
+
+
 def domain_create(request, name, description=None, enabled=None):
     manager = keystoneclient(request, admin=True).domains
-    return manager.create(name=name,
-                          description=description,
-                          enabled=enabled)
+    domain = manager.create(name=name,
+                            description=description,
+                            enabled=enabled)
+    _domain_names_forget(request)
+    return domain
 
 
 def domain_get(request, domain_id):
@@ -205,7 +267,9 @@ def domain_get(request, domain_id):
 
 def domain_delete(request, domain_id):
     manager = keystoneclient(request, admin=True).domains
-    return manager.delete(domain_id)
+    result = manager.delete(domain_id)
+    _domain_names_forget(request)
+    return result
 
 
 def domain_list(request):
@@ -214,13 +278,24 @@ def domain_list(request):
 
 
 def domain_lookup(request):
-    if policy.check((("identity", "identity:list_domains"),), request):
+    """Returns a ``{domain_id: name}`` mapping of the domains the user
+    may list, or of the default domain when they may not list domains.
+
+    The listing of the domains is kept in the Django cache, like the names
+    returned by :func:`domain_name`.
+    """
+    if _policy_check(request, "identity:list_domains"):
+        cached = _domain_names(request)
+        if cached['complete']:
+            return dict(cached['names'])
         try:
             domains = domain_list(request)
-            return dict((d.id, d.name) for d in domains)
         except Exception:
             LOG.warning("Pure project admin doesn't have a domain token")
             return None
+        names = dict((d.id, d.name) for d in domains)
+        _domain_names_store(request, names, complete=True)
+        return names
     else:
         domain = get_default_domain(request)
         return {domain.id: domain.name}
@@ -235,6 +310,7 @@ def domain_update(request, domain_id, name=None, description=None,
     except Exception as e:
         LOG.exception("Unable to update Domain: %s" % domain_id)
         raise e
+    _domain_names_forget(request)
     return response
 
 
@@ -243,13 +319,15 @@ def tenant_create(request, name, description=None, enabled=None,
     manager = VERSIONS.get_project_manager(request, admin=True)
     try:
         if VERSIONS.active < 3:
-            return manager.create(name, description, enabled, **kwargs)
+            project = manager.create(name, description, enabled, **kwargs)
         else:
-            return manager.create(name, domain,
-                                  description=description,
-                                  enabled=enabled, **kwargs)
+            project = manager.create(name, domain,
+                                     description=description,
+                                     enabled=enabled, **kwargs)
     except keystone_exceptions.Conflict:
         raise exceptions.Conflict()
+    _project_directory_update(request, project.id, project_info(project))
+    return project
 
 
 def get_default_domain(request, get_name=True):
@@ -260,23 +338,20 @@ def get_default_domain(request, get_name=True):
 
     :param get_name: Whether to get the domain name from Keystone if the
         context isn't set.  Setting this to False prevents an unnecessary call
-        to Keystone if only the domain ID is needed.
+        to Keystone if only the domain ID is needed. The name is taken from
+        the cached domain names when known, see :func:`domain_name`.
     """
     domain_id = request.session.get("domain_context", None)
-    domain_name = request.session.get("domain_context_name", None)
+    name = request.session.get("domain_context_name", None)
     # if running in Keystone V3 or later
     if VERSIONS.active >= 3 and domain_id is None:
         # if no domain context set, default to user's domain
         domain_id = request.user.user_domain_id
-        domain_name = request.user.user_domain_name
+        name = request.user.user_domain_name
         if get_name:
-            try:
-                domain = domain_get(request, domain_id)
-                domain_name = domain.name
-            except Exception:
-                LOG.warning("Unable to retrieve Domain: %s" % domain_id)
+            name = domain_name(request, domain_id) or name
     domain = base.APIDictWrapper({"id": domain_id,
-                                  "name": domain_name})
+                                  "name": name})
     return domain
 
 
@@ -284,7 +359,7 @@ def get_effective_domain_id(request):
     """Gets the id of the default domain to use when creating Identity objects.
     If the requests default domain is the same as DEFAULT_DOMAIN, return None.
     """
-    domain_id = get_default_domain(request).get('id')
+    domain_id = get_default_domain(request, get_name=False).get('id')
     return None if domain_id == DEFAULT_DOMAIN else domain_id
 
 
@@ -309,7 +384,9 @@ def tenant_get(request, project, admin=True):
 
 def tenant_delete(request, project):
     manager = VERSIONS.get_project_manager(request, admin=True)
-    return manager.delete(project)
+    result = manager.delete(project)
+    _project_directory_forget(request, getattr(project, 'id', project))
+    return result
 
 
 def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
@@ -346,18 +423,177 @@ def tenant_list(request, paginate=False, marker=None, domain=None, user=None,
     return tenants, has_more_data
 
 
+@memoized
+def user_project_list(request):
+    """Return the enabled projects of the current user, sorted by name.
+
+    Built at most once per request, and only when used.
+    """
+    if not request.user.is_authenticated():
+        return []
+    return sorted((project for project in request.user.authorized_tenants
+                   if project.enabled),
+                  key=lambda project: project.name.lower())
+
+
+def user_project_search(request, search=None, page=1, page_size=None):
+    """Return a page of the projects of the current user.
+
+    ``search`` filters the projects by a case insensitive substring of their
+    name. Returns the projects of page ``page``, counted from 1, and whether
+    there are more pages.
+    """
+    page_size = page_size or getattr(settings, 'DROPDOWN_MAX_ITEMS', 30)
+    projects = user_project_list(request)
+    if search:
+        search = search.lower()
+        projects = [project for project in projects
+                    if search in project.name.lower()]
+    start = (max(page, 1) - 1) * page_size
+    return (projects[start:start + page_size],
+            len(projects) > start + page_size)
+
+
+ProjectInfo = collections.namedtuple('ProjectInfo',
+                                     ['id', 'name', 'domain_id', 'enabled'])
+
+
+# Above this number of unknown project IDs the whole directory is rebuilt
+# instead of fetching the projects one by one.
+PROJECT_DIRECTORY_MAX_LOOKUPS = 20
+
+
+def project_info(project):
+    """Return the :class:`ProjectInfo` of a Keystone project."""
+    return ProjectInfo(project.id,
+                       getattr(project, 'name', None),
+                       getattr(project, 'domain_id', None),
+                       getattr(project, 'enabled', True))
+
+
+def project_directory_key(endpoint, domain_id=None):
+    """Cache key of the project directory of a Keystone endpoint."""
+    endpoint = urlparse.urljoin(endpoint.rstrip('/'), 'v%s' % VERSIONS.active)
+    key = '%s|%s' % (endpoint, domain_id or '')
+    return 'horizon:keystone:project_directory:%s' % \
+        hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def _project_directory_key(request):
+    domain_id = None
+    if VERSIONS.active >= 3:
+        domain_id = get_default_domain(request, get_name=False).id
+    return project_directory_key(_get_endpoint_url(request, 'adminURL'),
+                                 domain_id)
+
+
+def project_directory_store(key, projects):
+    """Store a ``{project_id: ProjectInfo}`` mapping in the cache."""
+    ttl = getattr(settings, 'OPENSTACK_KEYSTONE_PROJECT_DIRECTORY_TTL', 600)
+    cache.set(key, {'projects': projects}, ttl)
+
+
+def project_directory_refresh(request):
+    """Rebuild the project directory from a full project listing."""
+    tenants, has_more = tenant_list(request)
+    projects = dict((t.id, project_info(t)) for t in tenants)
+    project_directory_store(_project_directory_key(request), projects)
+    return projects
+
+
+@memoized
+def project_directory(request):
+    """Return a ``{project_id: ProjectInfo}`` mapping of all projects.
+
+    The mapping is shared between requests and processes through the Django
+    cache and expires after ``OPENSTACK_KEYSTONE_PROJECT_DIRECTORY_TTL``
+    seconds, after which the next request rebuilds it. It can also be
+    rebuilt with the ``refresh_project_directory`` management command.
+    """
+    directory = cache.get(_project_directory_key(request))
+    if directory is None:
+        return project_directory_refresh(request)
+    return directory['projects']
+
+
+@memoized
+def _projects_not_found(request):
+    """IDs of the projects Keystone did not find during this request."""
+    return set()
+
+
+def _project_lookup(request, project_id):
+    try:
+        return project_info(tenant_get(request, project_id))
+    except keystone_exceptions.NotFound:
+        return None
+
+
+def project_directory_get(request, project_ids):
+    """Return a ``{project_id: ProjectInfo}`` mapping for ``project_ids``.
+
+    Only the projects which exist are included, every value is a
+    ``ProjectInfo``. IDs missing from the cached directory, e.g. projects
+    created after it was built, are fetched from Keystone and added to it.
+    IDs which are not found are left out and only remembered until the end
+    of the request, so a project created meanwhile shows up on the next
+    one. Deleted projects are dropped from the directory.
+    """
+    projects = project_directory(request)
+    not_found = _projects_not_found(request)
+    project_ids = set(pid for pid in project_ids if pid)
+    missing = [pid for pid in project_ids
+               if pid not in projects and pid not in not_found]
+    if len(missing) > PROJECT_DIRECTORY_MAX_LOOKUPS:
+        projects.update(project_directory_refresh(request))
+        not_found.update(pid for pid in missing if pid not in projects)
+    elif missing:
+        results = parallel.run_parallel(
+            [functools.partial(_project_lookup, request, project_id)
+             for project_id in missing])
+        for project_id, (info, exc_info) in zip(missing, results):
+            if exc_info is not None:
+                LOG.warning("Unable to retrieve project %s." % project_id)
+            elif info is None:
+                not_found.add(project_id)
+            else:
+                projects[project_id] = info
+        project_directory_store(_project_directory_key(request), projects)
+    return dict((pid, projects[pid]) for pid in project_ids
+                if pid in projects)
+
+
+def _project_directory_update(request, project_id, info):
+    key = _project_directory_key(request)
+    directory = cache.get(key)
+    if directory is not None:
+        directory['projects'][project_id] = info
+        project_directory_store(key, directory['projects'])
+
+
+def _project_directory_forget(request, project_id):
+    key = _project_directory_key(request)
+    directory = cache.get(key)
+    if directory is not None:
+        directory['projects'].pop(project_id, None)
+        project_directory_store(key, directory['projects'])
+
+
 def tenant_update(request, project, name=None, description=None,
                   enabled=None, domain=None, **kwargs):
     manager = VERSIONS.get_project_manager(request, admin=True)
     try:
         if VERSIONS.active < 3:
-            return manager.update(project, name, description, enabled,
-                                  **kwargs)
+            project = manager.update(project, name, description, enabled,
+                                     **kwargs)
         else:
-            return manager.update(project, name=name, description=description,
-                                  enabled=enabled, domain=domain, **kwargs)
+            project = manager.update(project, name=name,
+                                     description=description,
+                                     enabled=enabled, domain=domain, **kwargs)
     except keystone_exceptions.Conflict:
         raise exceptions.Conflict()
+    _project_directory_update(request, project.id, project_info(project))
+    return project
 
 
 def user_list(request, project=None, domain=None, group=None, filters=None):
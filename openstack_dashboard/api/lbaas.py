@@ -18,6 +18,7 @@ from collections import OrderedDict
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import messages
+from horizon.utils import memoized
 
 from openstack_dashboard.api import neutron
 
@@ -67,6 +68,69 @@ class PoolMonitor(neutron.NeutronAPIDictWrapper):
         super(PoolMonitor, self).__init__(apiresource)
 
 
+def _list_raw(collection):
+    def lister(request, **params):
+        method = getattr(neutronclient(request), 'list_%s' % collection)
+        return method(**params).get(collection)
+    return lister
+
+
+# How referenced resources of each type are listed. They are filtered on
+# the ``id`` attribute so every type is fetched in one call (or as few as
+# the URI length limit of Neutron allows).
+_EXPANDERS = {
+    'subnets': lambda request, **params: neutron.subnet_list(request,
+                                                             **params),
+    'ports': lambda request, **params: neutron.port_list(request, **params),
+    'vips': _list_raw('vips'),
+    'pools': _list_raw('pools'),
+    'health_monitors': _list_raw('health_monitors'),
+}
+
+
+@memoized.memoized
+def _resolved(request, collection):
+    """Resources of ``collection`` resolved so far while serving request."""
+    return {}
+
+
+def _remember(request, collection, resources):
+    resolved = _resolved(request, collection)
+    for resource in resources:
+        resolved[resource['id']] = resource
+
+
+def _forget(request, collection, resource_id):
+    _resolved(request, collection).pop(resource_id, None)
+
+
+def _resolve(request, collection, ids):
+    """Map each ID in ``ids`` to the resource of ``collection`` it refers to.
+
+    IDs not resolved earlier in the same request are fetched with a single
+    list call. Resources which do not exist (any more) are mapped to
+    ``None``. Neutron API resources are returned as copies of the API
+    dictionaries, so callers are free to expand them.
+    """
+    resolved = _resolved(request, collection)
+    ids = list(OrderedDict.fromkeys(i for i in ids if i))
+    missing = [i for i in ids if i not in resolved]
+    if missing:
+        list_method = _EXPANDERS[collection]
+        resources = neutron.list_resources_with_long_filters(
+            list_method, 'id', missing, request=request)
+        _remember(request, collection, resources)
+        for resource_id in missing:
+            resolved.setdefault(resource_id, None)
+    result = OrderedDict()
+    for resource_id in ids:
+        resource = resolved[resource_id]
+        if isinstance(resource, dict):
+            resource = dict(resource)
+        result[resource_id] = resource
+    return result
+
+
 def vip_create(request, **kwargs):
     """Create a vip for a specified pool.
 
@@ -108,20 +172,25 @@ def vip_get(request, vip_id):
 
 def _vip_get(request, vip_id, expand_resource=False):
     vip = neutronclient(request).show_vip(vip_id).get('vip')
+    _remember(request, 'vips', [dict(vip)])
     if expand_resource:
-        vip['subnet'] = neutron.subnet_get(request, vip['subnet_id'])
-        vip['port'] = neutron.port_get(request, vip['port_id'])
-        vip['pool'] = _pool_get(request, vip['pool_id'])
+        vip['subnet'] = _resolve(request, 'subnets',
+                                 [vip['subnet_id']]).get(vip['subnet_id'])
+        vip['port'] = _resolve(request, 'ports',
+                               [vip['port_id']]).get(vip['port_id'])
+        vip['pool'] = _expand_pool(request, vip['pool_id'])
     return Vip(vip)
 
 
 def vip_update(request, vip_id, **kwargs):
     vip = neutronclient(request).update_vip(vip_id, kwargs).get('vip')
+    _forget(request, 'vips', vip_id)
     return Vip(vip)
 
 
 def vip_delete(request, vip_id):
     neutronclient(request).delete_vip(vip_id)
+    _forget(request, 'vips', vip_id)
 
 
 def pool_create(request, **kwargs):
@@ -150,10 +219,11 @@ def pool_create(request, **kwargs):
 def _get_vip(request, pool, vip_dict):
     if pool['vip_id'] is not None:
         try:
-            if vip_dict:
+            if vip_dict is not None:
                 vip = vip_dict.get(pool['vip_id'])
-            else:
-                vip = _vip_get(request, pool['vip_id'])
+                return Vip(vip) if vip is not None else None
+            vip = _resolve(request, 'vips', [pool['vip_id']])[pool['vip_id']]
+            vip = Vip(vip)
         except Exception:
             messages.warning(request, _("Unable to get VIP for pool "
                                         "%(pool)s.") % {"pool": pool["id"]})
@@ -163,20 +233,31 @@ def _get_vip(request, pool, vip_dict):
         return None
 
 
+def _expand_pool(request, pool_id):
+    try:
+        pool = _resolve(request, 'pools', [pool_id]).get(pool_id)
+    except Exception:
+        pool = None
+    if pool is None:
+        messages.warning(request, _("Unable to get pool detail."))
+        return None
+    return Pool(pool)
+
+
 def pool_list(request, **kwargs):
     return _pool_list(request, expand_subnet=True, expand_vip=True, **kwargs)
 
 
 def _pool_list(request, expand_subnet=False, expand_vip=False, **kwargs):
     pools = neutronclient(request).list_pools(**kwargs).get('pools')
+    _remember(request, 'pools', [dict(p) for p in pools])
     if expand_subnet:
-        subnets = neutron.subnet_list(request)
-        subnet_dict = OrderedDict((s.id, s) for s in subnets)
+        subnet_dict = _resolve(request, 'subnets',
+                               [p['subnet_id'] for p in pools])
         for p in pools:
             p['subnet'] = subnet_dict.get(p['subnet_id'])
     if expand_vip:
-        vips = vip_list(request)
-        vip_dict = OrderedDict((v.id, v) for v in vips)
+        vip_dict = _resolve(request, 'vips', [p['vip_id'] for p in pools])
         for p in pools:
             p['vip'] = _get_vip(request, p, vip_dict)
     return [Pool(p) for p in pools]
@@ -192,6 +273,7 @@ def _pool_get(request, pool_id, expand_resource=False):
     except Exception:
         messages.warning(request, _("Unable to get pool detail."))
         return None
+    _remember(request, 'pools', [dict(pool)])
     if expand_resource:
         # TODO(lyj): The expand resource(subnet, member etc.) attached
         # to a pool could be deleted without cleanup pool related database,
@@ -200,8 +282,11 @@ def _pool_get(request, pool_id, expand_resource=False):
         # we can safely remove the try/except once the neutron bug is fixed
         # https://bugs.launchpad.net/neutron/+bug/1406854
         try:
-            pool['subnet'] = neutron.subnet_get(request, pool['subnet_id'])
+            pool['subnet'] = _resolve(request, 'subnets',
+                                      [pool['subnet_id']])[pool['subnet_id']]
         except Exception:
+            pool['subnet'] = None
+        if pool['subnet'] is None:
             messages.warning(request, _("Unable to get subnet for pool "
                                         "%(pool)s.") % {"pool": pool_id})
         pool['vip'] = _get_vip(request, pool, vip_dict=None)
@@ -217,29 +302,34 @@ def _pool_get(request, pool_id, expand_resource=False):
         # If the filter to get health monitors list is empty, all health
         # monitors will be returned in the tenant.
         if pool['health_monitors']:
+            try:
+                monitor_dict = _resolve(request, 'health_monitors',
+                                        pool['health_monitors'])
+            except Exception:
+                monitor_dict = dict.fromkeys(pool['health_monitors'])
             monitors = []
-            for monitor_id in pool['health_monitors']:
-                try:
-                    monitors.append(_pool_health_monitor_get(request,
-                                                             monitor_id,
-                                                             False))
-                except Exception:
+            for monitor_id, monitor in monitor_dict.items():
+                if monitor is None:
                     messages.warning(request,
                                      _("Unable to get health monitor "
                                        "%(monitor_id)s for pool %(pool)s.")
                                      % {"pool": pool_id,
                                         "monitor_id": monitor_id})
+                else:
+                    monitors.append(PoolMonitor(monitor))
             pool['health_monitors'] = monitors
     return Pool(pool)
 
 
 def pool_update(request, pool_id, **kwargs):
     pool = neutronclient(request).update_pool(pool_id, kwargs).get('pool')
+    _forget(request, 'pools', pool_id)
     return Pool(pool)
 
 
 def pool_delete(request, pool):
     neutronclient(request).delete_pool(pool)
+    _forget(request, 'pools', pool)
 
 
 # not linked to UI yet
@@ -292,12 +382,14 @@ def _pool_health_monitor_get(request, monitor_id, expand_resource=False):
     monitor = neutronclient(request
                             ).show_health_monitor(monitor_id
                                                   ).get('health_monitor')
+    _remember(request, 'health_monitors', [dict(monitor)])
     if expand_resource:
         pool_ids = [p['pool_id'] for p in monitor['pools']]
-        # If the filter to get pools list is empty, all pools will be
-        # returned in the tenant.
+        # An empty ID filter would return all pools of the tenant.
         if pool_ids:
-            monitor['pools'] = _pool_list(request, id=pool_ids)
+            pool_dict = _resolve(request, 'pools', pool_ids)
+            monitor['pools'] = [Pool(p) for p in pool_dict.values()
+                                if p is not None]
     return PoolMonitor(monitor)
 
 
@@ -305,11 +397,13 @@ def pool_health_monitor_update(request, monitor_id, **kwargs):
     monitor = neutronclient(request
                             ).update_health_monitor(monitor_id, kwargs
                                                     ).get('health_monitor')
+    _forget(request, 'health_monitors', monitor_id)
     return PoolMonitor(monitor)
 
 
 def pool_health_monitor_delete(request, mon_id):
     neutronclient(request).delete_health_monitor(mon_id)
+    _forget(request, 'health_monitors', mon_id)
 
 
 def member_create(request, **kwargs):
@@ -330,6 +424,7 @@ def member_create(request, **kwargs):
     if kwargs.get('weight'):
         body['member']['weight'] = kwargs['weight']
     member = neutronclient(request).create_member(body).get('member')
+    _forget(request, 'pools', member['pool_id'])
     return Member(member)
 
 
@@ -340,10 +435,12 @@ def member_list(request, **kwargs):
 def _member_list(request, expand_pool, **kwargs):
     members = neutronclient(request).list_members(**kwargs).get('members')
     if expand_pool:
-        pools = _pool_list(request)
-        pool_dict = OrderedDict((p.id, p) for p in pools)
+        pool_dict = _resolve(request, 'pools',
+                             [m['pool_id'] for m in members])
         for m in members:
-            m['pool_name'] = pool_dict.get(m['pool_id']).name_or_id
+            pool = pool_dict.get(m['pool_id'])
+            m['pool_name'] = (Pool(pool).name_or_id if pool is not None
+                              else m['pool_id'])
     return [Member(m) for m in members]
 
 
@@ -354,7 +451,7 @@ def member_get(request, member_id):
 def _member_get(request, member_id, expand_pool):
     member = neutronclient(request).show_member(member_id).get('member')
     if expand_pool:
-        member['pool'] = _pool_get(request, member['pool_id'])
+        member['pool'] = _expand_pool(request, member['pool_id'])
     return Member(member)
 
 
@@ -380,6 +477,8 @@ def pool_monitor_association_create(request, **kwargs):
 
     neutronclient(request).associate_health_monitor(
         kwargs['pool_id'], body)
+    _forget(request, 'pools', kwargs['pool_id'])
+    _forget(request, 'health_monitors', kwargs['monitor_id'])
 
 
 def pool_monitor_association_delete(request, **kwargs):
@@ -392,3 +491,5 @@ def pool_monitor_association_delete(request, **kwargs):
 
     neutronclient(request).disassociate_health_monitor(
         kwargs['pool_id'], kwargs['monitor_id'])
+    _forget(request, 'pools', kwargs['pool_id'])
+    _forget(request, 'health_monitors', kwargs['monitor_id'])
@@ -20,19 +20,25 @@
 from __future__ import absolute_import
 
 import collections
+import hashlib
 import logging
+import threading
+import time
 
 import netaddr
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
 from neutronclient.common import exceptions as neutron_exc
 from neutronclient.v2_0 import client as neutron_client
 import six
+from six.moves.urllib import parse
 
 from horizon import exceptions
 from horizon import messages
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
 from openstack_dashboard.api import nova
@@ -51,6 +57,22 @@ ROUTER_INTERFACE_OWNERS = (
     'network:router_interface_distributed'
 )
 
+# The longest URI neutronclient sends, see neutronclient.client.MAX_URI_LEN.
+MAX_URI_LENGTH = 8192
+# Allowance for the API version, the resource path and the format suffix
+# in the URI, on top of the endpoint URL.
+URI_PATH_LENGTH = 64
+# Allowance for the endpoint URL when it is not known.
+URI_ENDPOINT_LENGTH = 192
+
+# URI length limits learned from RequestURITooLong errors, by endpoint.
+_uri_limits = {}
+_uri_limits_lock = threading.Lock()
+
+# IP versions of the addresses parsed by get_ip_version(), by address.
+IP_VERSION_CACHE_SIZE = 4096
+_ip_versions = {}
+
 
 class NeutronAPIDictWrapper(base.APIDictWrapper):
 
@@ -420,98 +442,186 @@ class FloatingIpManager(network_base.FloatingIpManager):
                        'fixed_ip_address': ip_address}
         self.client.update_floatingip(floating_ip_id,
                                       {'floatingip': update_dict})
+        self._forget_targets()
 
     def disassociate(self, floating_ip_id):
         update_dict = {'port_id': None}
         self.client.update_floatingip(floating_ip_id,
                                       {'floatingip': update_dict})
+        self._forget_targets()
+
+    def _targets_key(self):
+        endpoint = base.url_for(self.request, 'network')
+        return 'horizon:neutron:floating_ip_targets:%s:%s' % (
+            hashlib.sha1(endpoint.encode('utf-8')).hexdigest(),
+            self.request.user.tenant_id)
+
+    def _forget_targets(self):
+        cache.delete(self._targets_key())
 
-    def _get_reachable_subnets(self, ports):
+    def _get_reachable_subnets(self, ports, ext_net_ids, routers,
+                               shared_nets):
         if not is_enabled_by_config('enable_fip_topology_check', True):
             # All subnets are reachable from external network
             return set(
-                p.fixed_ips[0]['subnet_id'] for p in ports if p.fixed_ips
+                p['fixed_ips'][0]['subnet_id'] for p in ports
+                if p['fixed_ips']
             )
         # Retrieve subnet list reachable from external network
-        ext_net_ids = [ext_net.id for ext_net in self.list_pools()]
-        gw_routers = [r.id for r in router_list(self.request)
-                      if (r.external_gateway_info and
-                          r.external_gateway_info.get('network_id')
+        gw_routers = [r['id'] for r in routers
+                      if (r['external_gateway_info'] and
+                          r['external_gateway_info'].get('network_id')
                           in ext_net_ids)]
-        reachable_subnets = set([p.fixed_ips[0]['subnet_id'] for p in ports
-                                if ((p.device_owner in
-                                     ROUTER_INTERFACE_OWNERS)
-                                    and (p.device_id in gw_routers))])
+        reachable_subnets = set([p['fixed_ips'][0]['subnet_id']
+                                 for p in ports
+                                 if ((p['device_owner'] in
+                                      ROUTER_INTERFACE_OWNERS)
+                                     and (p['device_id'] in gw_routers)
+                                     and p['fixed_ips'])])
         # we have to include any shared subnets as well because we may not
         # have permission to see the router interface to infer connectivity
-        shared = set([s.id for n in network_list(self.request, shared=True)
-                      for s in n.subnets])
+        shared = set([subnet_id for n in shared_nets
+                      for subnet_id in n['subnets']])
         return reachable_subnets | shared
 
-    def list_targets(self):
+    def _list_target_sources(self):
+        """List what the targets are built from, concurrently.
+
+        Only the fields used by :meth:`_build_targets` are requested.
+        """
         tenant_id = self.request.user.tenant_id
-        ports = port_list(self.request, tenant_id=tenant_id)
-        servers, has_more = nova.server_list(self.request)
-        server_dict = collections.OrderedDict(
-            [(s.id, s.name) for s in servers])
-        reachable_subnets = self._get_reachable_subnets(ports)
-        if is_service_enabled(self.request,
-                              config_name='enable_lb',
-                              ext_name='lbaas'):
-            # Also get the loadbalancer VIPs
-            vip_dict = {v['port_id']: v['name']
-                        for v in self.client.list_vips().get('vips', [])}
-        else:
-            vip_dict = {}
+        check_topology = is_enabled_by_config('enable_fip_topology_check',
+                                              True)
+        with_vips = is_service_enabled(self.request,
+                                       config_name='enable_lb',
+                                       ext_name='lbaas')
+
+        def list_ports():
+            return self.client.list_ports(
+                tenant_id=tenant_id,
+                fields=['id', 'device_id', 'device_owner',
+                        'fixed_ips']).get('ports')
+
+        def list_servers():
+            # The names are all that is needed of the servers.
+            servers = nova.novaclient(self.request).servers.list(
+                False, {'project_id': tenant_id})
+            return dict((server.id, server.name) for server in servers)
+
+        def list_ext_net_ids():
+            if not check_topology:
+                return []
+            return [n['id'] for n in self.client.list_networks(
+                fields=['id'], **{'router:external': True}).get('networks')]
+
+        def list_routers():
+            if not check_topology:
+                return []
+            return self.client.list_routers(
+                fields=['id', 'external_gateway_info']).get('routers')
+
+        def list_shared_nets():
+            if not check_topology:
+                return []
+            return self.client.list_networks(
+                shared=True, fields=['subnets']).get('networks')
+
+        def list_vips():
+            if not with_vips:
+                return {}
+            vips = self.client.list_vips(
+                fields=['port_id', 'name']).get('vips', [])
+            return dict((v['port_id'], v['name']) for v in vips)
+
+        return parallel.map_parallel(
+            lambda fetch: fetch(),
+            [list_ports, list_servers, list_ext_net_ids, list_routers,
+             list_shared_nets, list_vips])
+
+    def _build_targets(self):
+        (ports, server_dict, ext_net_ids, routers, shared_nets,
+         vip_dict) = self._list_target_sources()
+        reachable_subnets = self._get_reachable_subnets(
+            ports, ext_net_ids, routers, shared_nets)
 
         targets = []
         for p in ports:
             # Remove network ports from Floating IP targets
-            if p.device_owner.startswith('network:'):
+            if p['device_owner'].startswith('network:'):
                 continue
-            port_id = p.id
-            server_name = server_dict.get(p.device_id) or vip_dict.get(port_id)
+            port_id = p['id']
+            server_name = (server_dict.get(p['device_id']) or
+                           vip_dict.get(port_id))
 
-            for ip in p.fixed_ips:
+            for ip in p['fixed_ips']:
                 if ip['subnet_id'] not in reachable_subnets:
                     continue
-                target = {'name': '%s: %s' % (server_name, ip['ip_address']),
-                          'id': '%s_%s' % (port_id, ip['ip_address']),
-                          'port_id': port_id,
-                          'instance_id': p.device_id}
-                targets.append(FloatingIpTarget(target))
+                targets.append({
+                    'name': '%s: %s' % (server_name, ip['ip_address']),
+                    'id': '%s_%s' % (port_id, ip['ip_address']),
+                    'port_id': port_id,
+                    'instance_id': p['device_id']})
         return targets
 
+    def list_targets(self):
+        """List the ports a floating IP can be associated with.
+
+        The targets of a project are kept in the Django cache for the
+        ``floating_ip_target_cache_ttl`` seconds of the
+        ``OPENSTACK_NEUTRON_NETWORK`` setting, and dropped when a floating
+        IP is associated or disassociated through the dashboard.
+        """
+        key = self._targets_key()
+        targets = cache.get(key)
+        if targets is None:
+            targets = self._build_targets()
+            network_config = getattr(settings, 'OPENSTACK_NEUTRON_NETWORK',
+                                     {})
+            ttl = network_config.get('floating_ip_target_cache_ttl', 30)
+            if ttl:
+                cache.set(key, targets, ttl)
+        return [FloatingIpTarget(dict(target)) for target in targets]
+
     def _target_ports_by_instance(self, instance_id):
         if not instance_id:
             return None
-        search_opts = {'device_id': instance_id}
+        search_opts = {'device_id': instance_id,
+                       'fields': ['id', 'fixed_ips']}
         return port_list(self.request, **search_opts)
 
-    def get_target_id_by_instance(self, instance_id, target_list=None):
-        if target_list is not None:
-            targets = [target for target in target_list
-                       if target['instance_id'] == instance_id]
-            if not targets:
+    def _targets_by_instance(self, instance_id, target_list):
+        if target_list is None:
+            # Only use the targets when they are cached already, listing
+            # the ports of the instance is cheaper than building them.
+            target_list = cache.get(self._targets_key())
+            if target_list is None:
                 return None
+        return [target for target in target_list
+                if target['instance_id'] == instance_id]
+
+    def get_target_id_by_instance(self, instance_id, target_list=None):
+        targets = self._targets_by_instance(instance_id, target_list)
+        if targets:
             return targets[0]['id']
-        else:
-            # In Neutron one port can have multiple ip addresses, so this
-            # method picks up the first one and generate target id.
-            ports = self._target_ports_by_instance(instance_id)
-            if not ports:
-                return None
-            return '{0}_{1}'.format(ports[0].id,
-                                    ports[0].fixed_ips[0]['ip_address'])
+        if target_list is not None:
+            return None
+        # The instance may also be newer than the cached targets.
+        # In Neutron one port can have multiple ip addresses, so this
+        # method picks up the first one and generate target id.
+        ports = self._target_ports_by_instance(instance_id)
+        if not ports:
+            return None
+        return '{0}_{1}'.format(ports[0].id,
+                                ports[0].fixed_ips[0]['ip_address'])
 
     def list_target_id_by_instance(self, instance_id, target_list=None):
-        if target_list is not None:
-            return [target['id'] for target in target_list
-                    if target['instance_id'] == instance_id]
-        else:
-            ports = self._target_ports_by_instance(instance_id)
-            return ['{0}_{1}'.format(p.id, p.fixed_ips[0]['ip_address'])
-                    for p in ports]
+        targets = self._targets_by_instance(instance_id, target_list)
+        if targets or target_list is not None:
+            return [target['id'] for target in targets]
+        # The instance may also be newer than the cached targets.
+        ports = self._target_ports_by_instance(instance_id) or []
+        return ['{0}_{1}'.format(p.id, p.fixed_ips[0]['ip_address'])
+                for p in ports]
 
     def is_simple_associate_supported(self):
         # NOTE: There are two reason that simple association support
@@ -544,14 +654,79 @@ def neutronclient(request):
     return c
 
 
+def _get_max_uri_length(endpoint):
+    network_config = getattr(settings, 'OPENSTACK_NEUTRON_NETWORK', {})
+    max_length = network_config.get('max_uri_length', MAX_URI_LENGTH)
+    return min(max_length, _uri_limits.get(endpoint, max_length))
+
+
+def _learn_max_uri_length(endpoint, length):
+    with _uri_limits_lock:
+        _uri_limits[endpoint] = min(length,
+                                    _uri_limits.get(endpoint, length))
+
+
+def _get_list_endpoint(list_method, params):
+    """Return the Neutron endpoint ``list_method`` sends its requests to.
+
+    The endpoint is found from the ``request`` in ``params``, or the one of
+    the manager ``list_method`` is bound to. ``None`` when unknown.
+    """
+    request = params.get('request')
+    if request is None:
+        manager = getattr(list_method, '__self__', None)
+        request = getattr(manager, 'request', None)
+    if request is None:
+        return None
+    try:
+        return base.url_for(request, 'network')
+    except Exception:
+        return None
+
+
+def _query_length(attr, value):
+    """Return the length of ``attr=value&`` in a query string."""
+    return len(parse.urlencode([(attr, six.text_type(value).encode('utf-8'))
+                                ])) + 1
+
+
+def _plan_filter_chunks(filter_attr, filter_values, length):
+    """Split ``filter_values`` into chunks of at most ``length`` characters
+    of query string each.
+
+    Every chunk holds at least one value, however long it is.
+    """
+    chunks = []
+    chunk = []
+    chunk_length = 0
+    for value in filter_values:
+        value_length = _query_length(filter_attr, value)
+        if chunk and chunk_length + value_length > length:
+            chunks.append(chunk)
+            chunk = []
+            chunk_length = 0
+        chunk.append(value)
+        chunk_length += value_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 def list_resources_with_long_filters(list_method,
                                      filter_attr, filter_values, **params):
     """List neutron resources with handling RequestURITooLong exception.
 
     If filter parameters are long, list resources API request leads to
-    414 error (URL is too long). For such case, this method split
-    list parameters specified by a list_field argument into chunks
-    and call the specified list_method repeatedly.
+    414 error (URL is too long). To avoid it, this method splits the
+    values of the filter specified by ``filter_attr`` into chunks which
+    fit in the maximum URI length, and calls the specified list_method
+    for every chunk, concurrently on the pool of
+    :mod:`horizon.utils.parallel`.
+
+    The maximum URI length is the ``max_uri_length`` of the
+    ``OPENSTACK_NEUTRON_NETWORK`` setting. When Neutron rejects a URI as
+    too long anyway, the limit it reported is remembered for its endpoint
+    and used by the following calls, and the chunk is split again.
 
     :param list_method: Method used to retrieve resource list.
     :param filter_attr: attribute name to be filtered. The value corresponding
@@ -559,43 +734,60 @@ def list_resources_with_long_filters(list_method,
         If you want to specify more attributes for a filter condition,
         pass them as keyword arguments like "attr2=values2".
     :param filter_values: values of "filter_attr" to be filtered.
-        If filter_values are too long and the total URI length exceed the
-        maximum length supported by the neutron server, filter_values will
-        be split into sub lists if filter_values is a list.
+        Duplicate values are only sent once. If filter_values are too long
+        and the total URI length exceed the maximum length supported by
+        the neutron server, filter_values will be split into sub lists.
     :param params: parameters to pass a specified listing API call
         without any changes. You can specify more filter conditions
         in addition to a pair of filter_attr and filter_values.
     """
-    try:
+    if isinstance(filter_values, six.string_types):
+        filter_values = [filter_values]
+    filter_values = list(collections.OrderedDict.fromkeys(filter_values))
+    if not filter_values:
         params[filter_attr] = filter_values
         return list_method(**params)
-    except neutron_exc.RequestURITooLong as uri_len_exc:
-        # The URI is too long because of too many filter values.
-        # Use the excess attribute of the exception to know how many
-        # filter values can be inserted into a single request.
-
-        # We consider only the filter condition from (filter_attr,
-        # filter_values) and do not consider other filter conditions
-        # which may be specified in **params.
-        if type(filter_values) != list:
-            filter_values = [filter_values]
-
-        # Length of each query filter is:
-        # <key>=<value>& (e.g., id=<uuid>)
-        # The length will be key_len + value_maxlen + 2
-        all_filter_len = sum(len(filter_attr) + len(val) + 2
-                             for val in filter_values)
-        allowed_filter_len = all_filter_len - uri_len_exc.excess
-
-        val_maxlen = max(len(val) for val in filter_values)
-        filter_maxlen = len(filter_attr) + val_maxlen + 2
-        chunk_size = allowed_filter_len // filter_maxlen
-
-        resources = []
-        for i in range(0, len(filter_values), chunk_size):
-            params[filter_attr] = filter_values[i:i + chunk_size]
-            resources.extend(list_method(**params))
-        return resources
+
+    endpoint = _get_list_endpoint(list_method, params)
+    # The other filter conditions take their full length in every request.
+    fixed_length = (len(endpoint or '') or URI_ENDPOINT_LENGTH) + \
+        URI_PATH_LENGTH
+    for key, values in params.items():
+        if key == 'request':
+            continue
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+        fixed_length += sum(_query_length(key, value) for value in values)
+
+    def list_chunk(chunk):
+        chunk_params = dict(params)
+        chunk_params[filter_attr] = chunk
+        try:
+            return list(list_method(**chunk_params))
+        except neutron_exc.RequestURITooLong as uri_len_exc:
+            if len(chunk) == 1:
+                raise
+            chunk_length = sum(_query_length(filter_attr, value)
+                               for value in chunk)
+            excess = getattr(uri_len_exc, 'excess', 0) or 0
+            if excess > 0:
+                allowed_length = max(chunk_length - excess, 1)
+            else:
+                allowed_length = chunk_length // 2
+            _learn_max_uri_length(endpoint, fixed_length + allowed_length)
+            resources = []
+            for sub_chunk in _plan_filter_chunks(filter_attr, chunk,
+                                                 allowed_length):
+                resources.extend(list_chunk(sub_chunk))
+            return resources
+
+    chunks = _plan_filter_chunks(
+        filter_attr, filter_values,
+        _get_max_uri_length(endpoint) - fixed_length)
+    resources = []
+    for chunk_resources in parallel.map_parallel(list_chunk, chunks):
+        resources.extend(chunk_resources)
+    return resources
 
 
 def network_list(request, **params):
@@ -1051,65 +1243,142 @@ def provider_list(request):
     return providers['service_providers']
 
 
+class ServerAddressResolver(object):
+    """Resolves the addresses of servers from Neutron.
+
+    The ports of the servers are listed first, then their floating IPs and
+    the names of their networks are listed concurrently. Only the fields
+    needed to build the addresses are requested.
+
+    The time spent in every phase ("ports", "floating_ips_networks" and
+    "format") is kept in ``timings`` and logged at debug level.
+    """
+
+    port_fields = ['id', 'device_id', 'network_id', 'fixed_ips',
+                   'mac_address']
+    floating_ip_fields = ['port_id', 'floating_ip_address']
+    network_fields = ['id', 'name']
+
+    def __init__(self, request, all_tenants=False):
+        self.request = request
+        self.all_tenants = all_tenants
+        self.client = neutronclient(request)
+        self.timings = collections.OrderedDict()
+
+    def _list(self, collection, filter_attr, filter_values, **params):
+        if not filter_values:
+            return []
+        list_method = getattr(self.client, 'list_%s' % collection)
+        return list_resources_with_long_filters(
+            lambda request, **kwargs: list_method(**kwargs).get(collection),
+            filter_attr, filter_values, request=self.request, **params)
+
+    def list_ports(self, servers):
+        return self._list('ports', 'device_id',
+                          [server.id for server in servers],
+                          fields=self.port_fields)
+
+    def list_floating_ips(self, ports):
+        if not FloatingIpManager(self.request).is_supported():
+            return []
+        params = {'fields': self.floating_ip_fields}
+        if not self.all_tenants:
+            # list_floatingips returns the floating IPs of all tenants
+            # to admins, see FloatingIpManager.list.
+            params['tenant_id'] = self.request.user.tenant_id
+        return self._list('floatingips', 'port_id',
+                          [port['id'] for port in ports], **params)
+
+    def list_networks(self, ports):
+        return self._list('networks', 'id',
+                          [port['network_id'] for port in ports],
+                          fields=self.network_fields)
+
+    def _timed(self, phase, started):
+        now = time.time()
+        self.timings[phase] = now - started
+        return now
+
+    def resolve(self, servers):
+        """Set the ``addresses`` of ``servers``.
+
+        The servers are left untouched if Neutron cannot be reached.
+        """
+        started = time.time()
+        try:
+            ports = self.list_ports(servers)
+            started = self._timed('ports', started)
+            floating_ips, networks = parallel.map_parallel(
+                lambda fetch: fetch(ports),
+                [self.list_floating_ips, self.list_networks])
+            started = self._timed('floating_ips_networks', started)
+        except Exception:
+            error_message = _('Unable to connect to Neutron.')
+            LOG.error(error_message)
+            messages.error(self.request, error_message)
+            return
+
+        # Map instance to its ports
+        instances_ports = collections.defaultdict(list)
+        for port in ports:
+            instances_ports[port['device_id']].append(port)
+
+        # Map port to its floating ips
+        ports_floating_ips = collections.defaultdict(list)
+        for fip in floating_ips:
+            ports_floating_ips[fip['port_id']].append(fip)
+
+        # Map network id to its name
+        network_names = dict((network['id'], network['name'])
+                             for network in networks)
+
+        for server in servers:
+            try:
+                addresses = _server_get_addresses(
+                    self.request,
+                    server,
+                    instances_ports,
+                    ports_floating_ips,
+                    network_names)
+            except Exception as e:
+                LOG.error(six.text_type(e))
+            else:
+                server.addresses = addresses
+        self._timed('format', started)
+        LOG.debug("Resolved the addresses of %d servers: %s",
+                  len(servers), ', '.join('%s %.3fs' % timing
+                                          for timing in self.timings.items()))
+
+
 def servers_update_addresses(request, servers, all_tenants=False):
     """Retrieve servers networking information from Neutron if enabled.
 
        Should be used when up to date networking information is required,
        and Nova's networking info caching mechanism is not fast enough.
     """
+    ServerAddressResolver(request, all_tenants).resolve(servers)
 
-    # Get all (filtered for relevant servers) information from Neutron
-    try:
-        ports = list_resources_with_long_filters(
-            port_list, 'device_id', [instance.id for instance in servers],
-            request=request)
-        fips = FloatingIpManager(request)
-        if fips.is_supported():
-            floating_ips = list_resources_with_long_filters(
-                fips.list, 'port_id', [port.id for port in ports],
-                all_tenants=all_tenants)
-        else:
-            floating_ips = []
-        networks = list_resources_with_long_filters(
-            network_list, 'id', set([port.network_id for port in ports]),
-            request=request)
-    except Exception:
-        error_message = _('Unable to connect to Neutron.')
-        LOG.error(error_message)
-        messages.error(request, error_message)
-        return
-
-    # Map instance to its ports
-    instances_ports = collections.defaultdict(list)
-    for port in ports:
-        instances_ports[port.device_id].append(port)
 
-    # Map port to its floating ips
-    ports_floating_ips = collections.defaultdict(list)
-    for fip in floating_ips:
-        ports_floating_ips[fip.port_id].append(fip)
+def get_ip_version(ip):
+    """Return the version of the IP address ``ip``, parsed once.
 
-    # Map network id to its name
-    network_names = dict(((network.id, network.name) for network in networks))
-
-    for server in servers:
-        try:
-            addresses = _server_get_addresses(
-                request,
-                server,
-                instances_ports,
-                ports_floating_ips,
-                network_names)
-        except Exception as e:
-            LOG.error(six.text_type(e))
-        else:
-            server.addresses = addresses
+    Raises ``netaddr.AddrFormatError`` if ``ip`` is not an IP address.
+    """
+    try:
+        return _ip_versions[ip]
+    except KeyError:
+        pass
+    version = netaddr.IPAddress(ip).version
+    if len(_ip_versions) >= IP_VERSION_CACHE_SIZE:
+        _ip_versions.clear()
+    _ip_versions[ip] = version
+    return version
 
 
 def _server_get_addresses(request, server, ports, floating_ips, network_names):
     def _format_address(mac, ip, type):
         try:
-            version = netaddr.IPAddress(ip).version
+            version = get_ip_version(ip)
         except Exception as e:
             error_message = _('Unable to parse IP address %s.') % ip
             LOG.error(error_message)
@@ -1123,18 +1392,18 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
     addresses = collections.defaultdict(list)
     instance_ports = ports.get(server.id, [])
     for port in instance_ports:
-        network_name = network_names.get(port.network_id)
+        network_name = network_names.get(port['network_id'])
         if network_name is not None:
-            for fixed_ip in port.fixed_ips:
+            for fixed_ip in port['fixed_ips']:
                 addresses[network_name].append(
-                    _format_address(port.mac_address,
+                    _format_address(port['mac_address'],
                                     fixed_ip['ip_address'],
                                     u'fixed'))
-            port_fips = floating_ips.get(port.id, [])
+            port_fips = floating_ips.get(port['id'], [])
             for fip in port_fips:
                 addresses[network_name].append(
-                    _format_address(port.mac_address,
-                                    fip.floating_ip_address,
+                    _format_address(port['mac_address'],
+                                    fip['floating_ip_address'],
                                     u'floating'))
 
     return dict(addresses)
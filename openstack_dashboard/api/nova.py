@@ -23,6 +23,7 @@ from __future__ import absolute_import
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.functional import cached_property  # noqa
 from django.utils.translation import ugettext_lazy as _
 import six
@@ -39,6 +40,7 @@ from horizon import conf
 from horizon import exceptions as horizon_exceptions
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import parallel
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
@@ -101,6 +103,7 @@ class Server(base.APIResourceWrapper):
               'OS-EXT-STS:task_state', 'OS-EXT-SRV-ATTR:instance_name',
               'OS-EXT-SRV-ATTR:host', 'OS-EXT-AZ:availability_zone',
               'OS-DCF:diskConfig']
+    __slots__ = ('request',)
 
     def __init__(self, apiresource, request):
         super(Server, self).__init__(apiresource)
@@ -667,7 +670,28 @@ def server_get(request, instance_id):
     return Server(novaclient(request).servers.get(instance_id), request)
 
 
-def server_list(request, search_opts=None, all_tenants=False):
+def server_get_many(request, instance_ids, search_opts=None):
+    """Return an OrderedDict of the existing servers among instance_ids.
+
+    Nova can not filter the server list by ID, so servers are fetched one
+    by one unless there are too many of them; ``search_opts`` is used for
+    listing servers in that case. See
+    :func:`openstack_dashboard.api.base.get_many`.
+    """
+    return base.get_many(
+        request, 'servers', instance_ids,
+        lambda instance_id: server_get(request, instance_id),
+        lambda: server_list(request, search_opts=dict(search_opts or {}))[0])
+
+
+def server_list(request, search_opts=None, all_tenants=False,
+                compact=False):
+    """List servers.
+
+    With ``compact=True`` the returned :class:`Server` objects only keep
+    their ``_attrs`` values instead of the full novaclient resources, which
+    is what large read-only listings should use.
+    """
     page_size = utils.get_page_size(request)
     c = novaclient(request)
     paginate = False
@@ -682,7 +706,8 @@ def server_list(request, search_opts=None, all_tenants=False):
         search_opts['all_tenants'] = True
     else:
         search_opts['project_id'] = request.user.tenant_id
-    servers = [Server(s, request)
+    server_class = base.compact(Server) if compact else Server
+    servers = [server_class(s, request)
                for s in c.servers.list(True, search_opts)]
 
     has_more_data = False
@@ -970,20 +995,78 @@ def service_disable(request, host, binary, reason=None):
         return novaclient(request).services.disable(host, binary)
 
 
+def _aggregate_has_details(aggregate):
+    info = getattr(aggregate, '_info', None) or {}
+    return 'hosts' in info and 'metadata' in info
+
+
 def aggregate_details_list(request):
-    result = []
     c = novaclient(request)
-    for aggregate in c.aggregates.list():
-        result.append(c.aggregates.get_details(aggregate.id))
-    return result
+    aggregates = c.aggregates.list()
+    # The list response already carries hosts and metadata on the Nova
+    # releases we support, so only fetch details for entries lacking them.
+    missing = [(index, aggregate.id)
+               for index, aggregate in enumerate(aggregates)
+               if not _aggregate_has_details(aggregate)]
+    if missing:
+        details = parallel.map_parallel(c.aggregates.get_details,
+                                        [agg_id for index, agg_id in missing])
+        for (index, agg_id), aggregate in zip(missing, details):
+            aggregates[index] = aggregate
+    return aggregates
+
+
+def _aggregate_host_index_key(request):
+    return 'horizon:nova:aggregate_host_index:%s' % \
+        base.url_for(request, 'compute')
+
+
+@memoized
+def aggregate_host_index(request):
+    """Return a mapping of compute host names to their placement.
+
+    Every value is a dict with the sorted ``aggregates`` names the host
+    belongs to and its ``availability_zone`` (``None`` when no aggregate
+    defines one). The index is kept in the Django cache for
+    ``OPENSTACK_NOVA_AGGREGATE_INDEX_TTL`` seconds and dropped whenever
+    aggregates are changed through Horizon.
+    """
+    key = _aggregate_host_index_key(request)
+    index = cache.get(key)
+    if index is not None:
+        return index
+
+    index = {}
+    for aggregate in aggregate_details_list(request):
+        zone = getattr(aggregate, 'availability_zone', None)
+        for host in getattr(aggregate, 'hosts', None) or []:
+            entry = index.setdefault(host, {'aggregates': [],
+                                            'availability_zone': None})
+            entry['aggregates'].append(aggregate.name)
+            if zone:
+                entry['availability_zone'] = zone
+    for entry in index.values():
+        entry['aggregates'].sort()
+
+    ttl = getattr(settings, 'OPENSTACK_NOVA_AGGREGATE_INDEX_TTL', 60)
+    cache.set(key, index, ttl)
+    return index
+
+
+def _invalidate_aggregate_host_index(request):
+    cache.delete(_aggregate_host_index_key(request))
 
 
 def aggregate_create(request, name, availability_zone=None):
-    return novaclient(request).aggregates.create(name, availability_zone)
+    result = novaclient(request).aggregates.create(name, availability_zone)
+    _invalidate_aggregate_host_index(request)
+    return result
 
 
 def aggregate_delete(request, aggregate_id):
-    return novaclient(request).aggregates.delete(aggregate_id)
+    result = novaclient(request).aggregates.delete(aggregate_id)
+    _invalidate_aggregate_host_index(request)
+    return result
 
 
 def aggregate_get(request, aggregate_id):
@@ -991,11 +1074,16 @@ def aggregate_get(request, aggregate_id):
 
 
 def aggregate_update(request, aggregate_id, values):
-    return novaclient(request).aggregates.update(aggregate_id, values)
+    result = novaclient(request).aggregates.update(aggregate_id, values)
+    _invalidate_aggregate_host_index(request)
+    return result
 
 
 def aggregate_set_metadata(request, aggregate_id, metadata):
-    return novaclient(request).aggregates.set_metadata(aggregate_id, metadata)
+    result = novaclient(request).aggregates.set_metadata(aggregate_id,
+                                                         metadata)
+    _invalidate_aggregate_host_index(request)
+    return result
 
 
 def host_list(request):
@@ -1003,11 +1091,15 @@ def host_list(request):
 
 
 def add_host_to_aggregate(request, aggregate_id, host):
-    return novaclient(request).aggregates.add_host(aggregate_id, host)
+    result = novaclient(request).aggregates.add_host(aggregate_id, host)
+    _invalidate_aggregate_host_index(request)
+    return result
 
 
 def remove_host_from_aggregate(request, aggregate_id, host):
-    return novaclient(request).aggregates.remove_host(aggregate_id, host)
+    result = novaclient(request).aggregates.remove_host(aggregate_id, host)
+    _invalidate_aggregate_host_index(request)
+    return result
 
 
 def interface_attach(request,
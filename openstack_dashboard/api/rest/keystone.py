@@ -526,6 +526,37 @@ class ProjectRole(generic.View):
         )
 
 
+@urls.register
+class UserProjects(generic.View):
+    """API over the projects of the current user.
+    """
+    url_regex = r'keystone/user-projects/$'
+
+    @rest_utils.ajax()
+    def get(self, request):
+        """Get a page of the enabled projects of the current user.
+
+        You may specify GET parameters for search (string), a case insensitive
+        substring of the project names, and page (integer, from 1).
+
+        The listing result is an object with properties:
+
+        items
+            The list of projects, with their id and name.
+        has_more
+            Boolean indicating there are more pages.
+        """
+        try:
+            page = int(request.GET.get('page') or 1)
+        except ValueError:
+            raise rest_utils.AjaxError(400, 'invalid page')
+        projects, has_more = api.keystone.user_project_search(
+            request, request.GET.get('search'), page)
+        return {'items': [{'id': project.id, 'name': project.name}
+                          for project in projects],
+                'has_more': has_more}
+
+
 @urls.register
 class ServiceCatalog(generic.View):
     url_regex = r'keystone/svc-catalog/$'
@@ -0,0 +1,276 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Tracing of the API calls made while serving a request.
+
+Add ``openstack_dashboard.api.tracing.TracingMiddleware`` to
+``MIDDLEWARE_CLASSES`` to record every HTTP call the API clients make:
+its service, method, URL template, status, size and duration. For every
+request the calls are summarized in a ``Server-Timing`` response header
+and a JSON log line, which also lists identical calls made more than once
+and URL templates called ``API_TRACE_FANOUT_THRESHOLD`` times or more
+(typically one call per table row). Totals over all requests are kept in
+process and logged every ``API_TRACE_DUMP_INTERVAL`` requests.
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+
+from django.conf import settings
+from requests import adapters
+import six
+from six.moves.urllib import parse
+
+from horizon.utils import parallel
+
+
+LOG = logging.getLogger(__name__)
+
+_ID_RE = re.compile(r'^([0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?'
+                    r'[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}|[0-9a-fA-F]{32,}|'
+                    r'\d+)(\.json)?$')
+
+_local = threading.local()
+_lock = threading.Lock()
+_totals = {}
+_requests = [0]
+_original_send = None
+
+
+Call = collections.namedtuple('Call', ['method', 'url', 'template', 'body',
+                                       'status', 'size', 'duration'])
+
+
+def url_template(url):
+    """Return the path of ``url`` with IDs replaced by ``{id}``.
+
+    Of the query string only the parameter names are kept.
+    """
+    url = parse.urlsplit(url)
+    segments = [_ID_RE.sub(lambda match: '{id}' + (match.group(2) or ''),
+                           segment)
+                for segment in url.path.split('/')]
+    template = '/'.join(segments)
+    if url.query:
+        names = sorted(set(name for name, _value in parse.parse_qsl(
+            url.query, keep_blank_values=True)))
+        template += '?' + '&'.join(names)
+    return template
+
+
+class Trace(object):
+    """The API calls made while serving one request."""
+
+    def __init__(self):
+        self.calls = []
+        self.started = time.time()
+
+    def record(self, method, url, body, status, size, duration):
+        if isinstance(body, six.text_type):
+            body = body.encode('utf-8')
+        if isinstance(body, six.binary_type):
+            body = hashlib.sha1(body).hexdigest()
+        else:
+            body = None
+        self.calls.append(Call(method, url, url_template(url), body,
+                               status, size, duration))
+
+    def repeated(self):
+        """Return ``(call, count)`` for identical calls made repeatedly."""
+        counts = collections.Counter((call.method, call.url, call.body)
+                                     for call in self.calls)
+        return [(call, count) for call, count in counts.items()
+                if count > 1]
+
+    def fanout(self, threshold):
+        """Return ``(template, count)`` for templates called often."""
+        counts = collections.Counter((call.method, call.template)
+                                     for call in self.calls)
+        return [(template, count) for template, count in counts.items()
+                if count >= threshold]
+
+
+def current():
+    return getattr(_local, 'trace', None)
+
+
+def _activate(trace):
+    _local.trace = trace
+
+
+def _deactivate(trace):
+    _local.trace = None
+
+
+parallel.register_context(current, _activate, _deactivate)
+
+
+def _traced_send(adapter, request, **kwargs):
+    trace = current()
+    if trace is None:
+        return _original_send(adapter, request, **kwargs)
+    started = time.time()
+    status = size = None
+    try:
+        response = _original_send(adapter, request, **kwargs)
+        status = response.status_code
+        if kwargs.get('stream'):
+            size = int(response.headers.get('Content-Length') or 0)
+        else:
+            size = len(response.content or b'')
+        return response
+    finally:
+        trace.record(request.method, request.url, request.body, status,
+                     size, time.time() - started)
+
+
+def install():
+    """Record the calls of all API clients, which all use ``requests``."""
+    global _original_send
+    with _lock:
+        if _original_send is None:
+            _original_send = adapters.HTTPAdapter.send
+            adapters.HTTPAdapter.send = _traced_send
+
+
+def _services(request):
+    """Map endpoint URLs of the service catalog to service types."""
+    prefixes = []
+    user = getattr(request, 'user', None)
+    for service in getattr(user, 'service_catalog', None) or []:
+        for endpoint in service.get('endpoints', []):
+            for key in ('url', 'publicURL', 'internalURL', 'adminURL'):
+                if endpoint.get(key):
+                    prefixes.append((endpoint[key].rstrip('/'),
+                                     service.get('type')))
+    return sorted(prefixes, key=lambda prefix: -len(prefix[0]))
+
+
+def _service(url, services):
+    for prefix, service in services:
+        if url.startswith(prefix):
+            return service
+    return parse.urlsplit(url).netloc
+
+
+def _server_timing(summary):
+    metrics = ['api;desc="%d calls";dur=%.1f'
+               % (summary['calls'], summary['api_ms'])]
+    for service, totals in sorted(summary['services'].items()):
+        metrics.append('%s;desc="%d calls";dur=%.1f' % (
+            re.sub(r'[^\w.-]', '_', service), totals['calls'],
+            totals['ms']))
+    return ', '.join(metrics)
+
+
+def summarize(request, response, trace):
+    """Return a dictionary describing the API calls of a request."""
+    services = _services(request)
+    threshold = getattr(settings, 'API_TRACE_FANOUT_THRESHOLD', 10)
+    by_service = {}
+    for call in trace.calls:
+        totals = by_service.setdefault(_service(call.url, services),
+                                       {'calls': 0, 'ms': 0.0})
+        totals['calls'] += 1
+        totals['ms'] += call.duration * 1000
+    return {
+        'event': 'api_trace',
+        'method': request.method,
+        'path': request.path,
+        'status': response.status_code,
+        'ms': round((time.time() - trace.started) * 1000, 1),
+        'calls': len(trace.calls),
+        'api_ms': round(sum(call.duration for call in trace.calls) * 1000,
+                        1),
+        'services': dict((service, {'calls': totals['calls'],
+                                    'ms': round(totals['ms'], 1)})
+                         for service, totals in by_service.items()),
+        'repeated': [{'call': '%s %s' % (method, url), 'count': count}
+                     for (method, url, _body), count in trace.repeated()],
+        'fanout': [{'call': '%s %s' % template, 'count': count}
+                   for template, count in trace.fanout(threshold)],
+        'errors': [{'call': '%s %s' % (call.method, call.template),
+                    'status': call.status}
+                   for call in trace.calls
+                   if call.status is None or call.status >= 400],
+    }
+
+
+def _accumulate(request, trace):
+    services = _services(request)
+    with _lock:
+        _requests[0] += 1
+        for call in trace.calls:
+            key = (_service(call.url, services), call.method, call.template)
+            totals = _totals.setdefault(key, [0, 0.0, 0, 0])
+            totals[0] += 1
+            totals[1] += call.duration * 1000
+            totals[2] += call.status is None or call.status >= 400
+            totals[3] += call.size or 0
+        return _requests[0]
+
+
+def totals():
+    """Return the API calls of all requests traced by this process.
+
+    Calls are grouped by service, method and URL template and sorted by
+    their total duration, longest first.
+    """
+    with _lock:
+        items = sorted(_totals.items(), key=lambda item: -item[1][1])
+        return {
+            'event': 'api_trace_totals',
+            'requests': _requests[0],
+            'calls': [{'call': '%s %s %s' % key, 'count': count,
+                       'ms': round(ms, 1), 'errors': errors,
+                       'bytes': size}
+                      for key, (count, ms, errors, size) in items],
+        }
+
+
+def reset():
+    with _lock:
+        _totals.clear()
+        _requests[0] = 0
+
+
+class TracingMiddleware(object):
+    """Traces the API calls made while serving each request."""
+
+    def __init__(self):
+        install()
+
+    def process_request(self, request):
+        _local.trace = Trace()
+
+    def process_response(self, request, response):
+        trace = current()
+        _local.trace = None
+        if trace is None:
+            return response
+        summary = summarize(request, response, trace)
+        if getattr(settings, 'API_TRACE_SERVER_TIMING', True):
+            response['Server-Timing'] = _server_timing(summary)
+        level = (logging.WARNING if summary['repeated'] or summary['fanout']
+                 else logging.INFO)
+        LOG.log(level, json.dumps(summary, sort_keys=True))
+
+        count = _accumulate(request, trace)
+        interval = getattr(settings, 'API_TRACE_DUMP_INTERVAL', 1000)
+        if interval and count % interval == 0:
+            LOG.info(json.dumps(totals(), sort_keys=True))
+        return response
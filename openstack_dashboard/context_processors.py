@@ -22,9 +22,12 @@ Context processors used by Horizon.
 import re
 
 from django.conf import settings
+from django.utils import functional
 
 from horizon import conf
 
+from openstack_dashboard.api import keystone
+
 
 def openstack(request):
     """Context processor necessary for OpenStack Dashboard functionality.
@@ -32,7 +35,8 @@ def openstack(request):
     The following variables are added to the request context:
 
     ``authorized_tenants``
-        A list of tenant objects which the current user has access to.
+        A list of the enabled tenant objects which the current user has
+        access to. It is only built when it is used.
 
     ``regions``
 
@@ -42,11 +46,8 @@ def openstack(request):
     context = {}
 
     # Auth/Keystone context
-    context.setdefault('authorized_tenants', [])
-    if request.user.is_authenticated():
-        context['authorized_tenants'] = [
-            tenant for tenant in
-            request.user.authorized_tenants if tenant.enabled]
+    context['authorized_tenants'] = functional.SimpleLazyObject(
+        lambda: keystone.user_project_list(request))
 
     # Region context/support
     available_regions = getattr(settings, 'AVAILABLE_REGIONS', [])
@@ -60,6 +61,17 @@ def openstack(request):
     # Adding webroot access
     context['WEBROOT'] = getattr(settings, "WEBROOT", "/")
 
+    context['JS_CATALOG'] = get_js_catalog()
+
+    return context
+
+
+def get_js_catalog():
+    """Return the packages of the JavaScript message catalog.
+
+    The packages are joined with ``+``, as the ``horizon:jsi18n`` URL
+    expects them.
+    """
     # Search for external plugins and append to javascript message catalog
     # internal plugins are under the openstack_dashboard domain
     # so we exclude them from the js_catalog
@@ -67,6 +79,4 @@ def openstack(request):
     regex = re.compile(r'^openstack_dashboard')
     all_plugins = conf.HORIZON_CONFIG['plugins']
     js_catalog.extend(p for p in all_plugins if not regex.search(p))
-    context['JS_CATALOG'] = '+'.join(js_catalog)
-
-    return context
+    return '+'.join(js_catalog)
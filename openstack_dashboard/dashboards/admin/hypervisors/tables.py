@@ -18,6 +18,10 @@ from horizon import tables
 from horizon.templatetags import sizeformat
 
 
+def get_aggregates(hypervisor):
+    return ", ".join(getattr(hypervisor, "aggregates", None) or [])
+
+
 class AdminHypervisorsTable(tables.DataTable):
     hostname = tables.Column("hypervisor_hostname",
                              link="horizon:admin:hypervisors:detail",
@@ -55,6 +59,10 @@ class AdminHypervisorsTable(tables.DataTable):
     running_vms = tables.Column("running_vms",
                                 verbose_name=_("Instances"))
 
+    aggregates = tables.Column(get_aggregates,
+                               verbose_name=_("Host Aggregates"),
+                               empty_value=_("-"))
+
     def get_object_id(self, hypervisor):
         return "%s_%s" % (hypervisor.id,
                           hypervisor.hypervisor_hostname)
@@ -37,8 +37,23 @@ class HypervisorTab(tabs.TableTab):
             exceptions.handle(self.request,
                               _('Unable to retrieve hypervisor information.'))
 
+        if hypervisors:
+            self._update_placement(hypervisors)
         return hypervisors
 
+    def _update_placement(self, hypervisors):
+        try:
+            index = nova.aggregate_host_index(self.request)
+        except Exception:
+            exceptions.handle(self.request,
+                              _('Unable to retrieve host aggregates.'),
+                              ignore=True)
+            return
+        for hypervisor in hypervisors:
+            service = getattr(hypervisor, 'service', None) or {}
+            placement = index.get(service.get('host'), {})
+            hypervisor.aggregates = placement.get('aggregates', [])
+
 
 class HypervisorHostTabs(tabs.TabGroup):
     slug = "hypervisor_info"
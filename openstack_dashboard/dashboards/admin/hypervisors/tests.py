@@ -24,7 +24,8 @@ class HypervisorViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.nova: ('extension_supported',
                                    'hypervisor_list',
                                    'hypervisor_stats',
-                                   'service_list')})
+                                   'service_list',
+                                   'aggregate_host_index')})
     def test_index(self):
         hypervisors = self.hypervisors.list()
         services = self.services.list()
@@ -35,6 +36,9 @@ class HypervisorViewTest(test.BaseAdminViewTests):
                                      IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.hypervisor_list(IsA(http.HttpRequest)).AndReturn(hypervisors)
+        api.nova.aggregate_host_index(IsA(http.HttpRequest)).AndReturn(
+            {'devstack001': {'aggregates': ['bar', 'foo'],
+                             'availability_zone': 'testing'}})
         api.nova.hypervisor_stats(IsA(http.HttpRequest)).AndReturn(stats)
         api.nova.service_list(IsA(http.HttpRequest), binary='nova-compute') \
             .AndReturn(compute_services)
@@ -46,6 +50,7 @@ class HypervisorViewTest(test.BaseAdminViewTests):
         hypervisors_tab = res.context['tab_group'].get_tab('hypervisor')
         self.assertItemsEqual(hypervisors_tab._tables['hypervisors'].data,
                               hypervisors)
+        self.assertContains(res, 'bar, foo', 1)
 
         host_tab = res.context['tab_group'].get_tab('compute_host')
         host_table = host_tab._tables['compute_host']
@@ -69,7 +74,8 @@ class HypervisorViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('hypervisor_list',
                                    'hypervisor_stats',
-                                   'service_list')})
+                                   'service_list',
+                                   'aggregate_host_index')})
     def test_service_list_unavailable(self):
         """test that error message should be returned when
         nova.service_list isn't available
@@ -77,6 +83,7 @@ class HypervisorViewTest(test.BaseAdminViewTests):
         hypervisors = self.hypervisors.list()
         stats = self.hypervisors.stats
         api.nova.hypervisor_list(IsA(http.HttpRequest)).AndReturn(hypervisors)
+        api.nova.aggregate_host_index(IsA(http.HttpRequest)).AndReturn({})
         api.nova.hypervisor_stats(IsA(http.HttpRequest)).AndReturn(stats)
         api.nova.service_list(IsA(http.HttpRequest), binary='nova-compute') \
             .AndRaise(self.exceptions.nova)
@@ -64,6 +64,7 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, image_id):
         image = api.glance.image_get(request, image_id)
+        image.upload_progress = api.glance.image_upload_progress(image_id)
         try:
             tenant_id = getattr(image, "owner")
             tenant = api.keystone.tenant_get(request, tenant_id)
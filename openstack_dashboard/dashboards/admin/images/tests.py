@@ -17,6 +17,7 @@ from django.core.urlresolvers import reverse
 from django import http
 from django.test.utils import override_settings
 
+from keystoneclient import exceptions as keystone_exceptions
 from mox3.mox import IsA  # noqa
 
 from openstack_dashboard import api
@@ -44,7 +45,7 @@ class ImageCreateViewTest(test.BaseAdminViewTests):
 
 class ImagesViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.glance: ('image_list_detailed',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_list', 'tenant_get')})
     def test_images_list(self):
         filters = {'is_public': None}
         api.glance.image_list_detailed(IsA(http.HttpRequest),
@@ -59,11 +60,16 @@ class ImagesViewTest(test.BaseAdminViewTests):
         # Test tenant list
         api.keystone.tenant_list(IsA(http.HttpRequest)).\
             AndReturn([self.tenants.list(), False])
+        tenant_ids = [t.id for t in self.tenants.list()]
+        for owner in set(i.owner for i in self.images.list()):
+            if owner and owner not in tenant_ids:
+                api.keystone.tenant_get(IsA(http.HttpRequest), owner) \
+                    .InAnyOrder().AndRaise(keystone_exceptions.NotFound)
         self.mox.ReplayAll()
 
         res = self.client.get(
             reverse('horizon:admin:images:index'))
-        self.assertContains(res, 'test_tenant', 8, 200)
+        self.assertContains(res, 'test_tenant', 7, 200)
         self.assertTemplateUsed(res, 'admin/images/index.html')
         self.assertEqual(len(res.context['images_table'].data),
                          len(self.images.list()))
@@ -104,7 +110,7 @@ class ImagesViewTest(test.BaseAdminViewTests):
         self.assertEqual(len(res.context['images_table'].data),
                          len(images))
         self.assertTemplateUsed(res, 'admin/images/index.html')
-        self.assertContains(res, 'test_tenant', 6, 200)
+        self.assertContains(res, 'test_tenant', 5, 200)
 
         res = self.client.get(url)
         # get first page with 2 items
@@ -118,7 +124,7 @@ class ImagesViewTest(test.BaseAdminViewTests):
         # get second page (items 2-4)
         self.assertEqual(len(res.context['images_table'].data),
                          settings.API_RESULT_PAGE_SIZE)
-        self.assertContains(res, 'test_tenant', 3, 200)
+        self.assertContains(res, 'test_tenant', 2, 200)
 
         params = "=".join([tables.AdminImagesTable._meta.pagination_param,
                            images[4].id])
@@ -127,7 +133,7 @@ class ImagesViewTest(test.BaseAdminViewTests):
         # get third page (item 5)
         self.assertEqual(len(res.context['images_table'].data),
                          1)
-        self.assertContains(res, 'test_tenant', 2, 200)
+        self.assertContains(res, 'test_tenant', 1, 200)
 
     @override_settings(API_RESULT_PAGE_SIZE=2)
     @test.create_stubs({api.glance: ('image_list_detailed',),
@@ -168,13 +174,13 @@ class ImagesViewTest(test.BaseAdminViewTests):
         self.assertEqual(len(res.context['images_table'].data),
                          len(images))
         self.assertTemplateUsed(res, 'admin/images/index.html')
-        self.assertContains(res, 'test_tenant', 4, 200)
+        self.assertContains(res, 'test_tenant', 3, 200)
 
         res = self.client.get(url)
         # get first page with 2 items
         self.assertEqual(len(res.context['images_table'].data),
                          settings.API_RESULT_PAGE_SIZE)
-        self.assertContains(res, 'test_tenant', 3, 200)
+        self.assertContains(res, 'test_tenant', 2, 200)
 
         params = "=".join([tables.AdminImagesTable._meta.pagination_param,
                            images[2].id])
@@ -182,7 +188,7 @@ class ImagesViewTest(test.BaseAdminViewTests):
         res = self.client.get(url)
         # get second page (item 3)
         self.assertEqual(len(res.context['images_table'].data), 1)
-        self.assertContains(res, 'test_tenant', 2, 200)
+        self.assertContains(res, 'test_tenant', 1, 200)
 
         params = "=".join([tables.AdminImagesTable._meta.prev_pagination_param,
                            images[2].id])
@@ -191,4 +197,4 @@ class ImagesViewTest(test.BaseAdminViewTests):
         # prev back to get first page with 2 items
         self.assertEqual(len(res.context['images_table'].data),
                          settings.API_RESULT_PAGE_SIZE)
-        self.assertContains(res, 'test_tenant', 3, 200)
+        self.assertContains(res, 'test_tenant', 2, 200)
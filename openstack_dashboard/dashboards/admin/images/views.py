@@ -78,16 +78,16 @@ class IndexView(tables.DataTableView):
             exceptions.handle(self.request, msg)
         if images:
             try:
-                tenants, more = api.keystone.tenant_list(self.request)
+                tenant_dict = api.keystone.project_directory_get(
+                    self.request, [image.owner for image in images])
             except Exception:
-                tenants = []
+                tenant_dict = {}
                 msg = _('Unable to retrieve project list.')
                 exceptions.handle(self.request, msg)
 
-            tenant_dict = dict([(t.id, t.name) for t in tenants])
-
             for image in images:
-                image.tenant_name = tenant_dict.get(image.owner)
+                tenant = tenant_dict.get(image.owner)
+                image.tenant_name = getattr(tenant, "name", None)
         return images
 
     def get_filters(self):
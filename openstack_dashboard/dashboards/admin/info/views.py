@@ -30,6 +30,7 @@ class IndexView(tabs.TabbedTableView):
     tab_group_class = project_tabs.SystemInfoTabs
     template_name = constants.INFO_TEMPLATE_NAME
     page_title = _("System Information")
+    concurrent_data_loading = True
 
     def get_context_data(self, **kwargs):
         context = super(IndexView, self).get_context_data(**kwargs)
@@ -45,7 +45,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
             AndReturn([tenants, False])
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -69,7 +70,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -107,7 +109,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -133,16 +136,13 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertMessageCount(res, error=1)
         self.assertItemsEqual(instances, servers)
 
-    @test.create_stubs({api.nova: ('server_list',),
-                        api.keystone: ('tenant_list',)})
+    @test.create_stubs({api.nova: ('server_list',)})
     def test_index_server_list_exception(self):
-        tenants = self.tenants.list()
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndRaise(self.exceptions.nova)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
 
         self.mox.ReplayAll()
 
@@ -198,7 +198,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
             AndReturn([self.tenants.list(), False])
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -233,7 +234,8 @@ class InstanceViewTest(test.BaseAdminViewTests):
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.server_list(IsA(http.HttpRequest),
-                             all_tenants=True, search_opts=search_opts) \
+                             all_tenants=True, search_opts=search_opts,
+                             compact=True) \
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers,
                                              all_tenants=True)
@@ -75,17 +75,8 @@ class AdminIndexView(tables.DataTableView):
         marker = self.request.GET.get(
             project_tables.AdminInstancesTable._meta.pagination_param, None)
         search_opts = self.get_filters({'marker': marker, 'paginate': True})
-        # Gather our tenants to correlate against IDs
-        try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
-        except Exception:
-            tenants = []
-            msg = _('Unable to retrieve instance project information.')
-            exceptions.handle(self.request, msg)
-
         if 'project' in search_opts:
-            ten_filter_ids = [t.id for t in tenants
-                              if t.name == search_opts['project']]
+            ten_filter_ids = self._get_project_ids(search_opts['project'])
             del search_opts['project']
             if len(ten_filter_ids) > 0:
                 search_opts['tenant_id'] = ten_filter_ids[0]
@@ -97,7 +88,8 @@ class AdminIndexView(tables.DataTableView):
             instances, self._more = api.nova.server_list(
                 self.request,
                 search_opts=search_opts,
-                all_tenants=True)
+                all_tenants=True,
+                compact=True)
         except Exception:
             self._more = False
             exceptions.handle(self.request,
@@ -120,7 +112,14 @@ class AdminIndexView(tables.DataTableView):
                 flavors = []
 
             full_flavors = OrderedDict([(f.id, f) for f in flavors])
-            tenant_dict = OrderedDict([(t.id, t) for t in tenants])
+            # Gather our tenants to correlate against IDs
+            try:
+                tenant_dict = api.keystone.project_directory_get(
+                    self.request, [inst.tenant_id for inst in instances])
+            except Exception:
+                tenant_dict = {}
+                msg = _('Unable to retrieve instance project information.')
+                exceptions.handle(self.request, msg)
             # Loop through instances to get flavor and tenant info.
             for inst in instances:
                 flavor_id = inst.flavor["id"]
@@ -139,6 +138,22 @@ class AdminIndexView(tables.DataTableView):
                 inst.tenant_name = getattr(tenant, "name", None)
         return instances
 
+    def _get_project_ids(self, name):
+        try:
+            projects = api.keystone.project_directory(self.request)
+            ids = [p.id for p in projects.values() if p.name == name]
+            if not ids:
+                # The project may have been created after the directory
+                # was built.
+                projects = api.keystone.project_directory_refresh(
+                    self.request)
+                ids = [p.id for p in projects.values() if p.name == name]
+        except Exception:
+            ids = []
+            msg = _('Unable to retrieve instance project information.')
+            exceptions.handle(self.request, msg)
+        return ids
+
     def get_filters(self, filters):
         filter_field = self.table.get_filter_field()
         filter_action = self.table._meta._filter_action
@@ -200,3 +215,18 @@ class DetailView(views.DetailView):
     def _get_actions(self, instance):
         table = project_tables.AdminInstancesTable(self.request)
         return table.render_row_actions(instance)
+
+    @memoized.memoized_method
+    def get_data(self):
+        instance = super(DetailView, self).get_data()
+        if instance.host_server:
+            try:
+                index = api.nova.aggregate_host_index(self.request)
+                placement = index.get(instance.host_server, {})
+                instance.host_aggregates = placement.get('aggregates', [])
+            except Exception:
+                msg = _('Unable to retrieve host aggregates for instance '
+                        '"%(name)s" (%(id)s).') % {'name': instance.name,
+                                                   'id': instance.id}
+                exceptions.handle(self.request, msg, ignore=True)
+        return instance
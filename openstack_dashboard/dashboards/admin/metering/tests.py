@@ -25,6 +25,11 @@ from openstack_dashboard.test.test_data import utils as test_utils
 INDEX_URL = reverse('horizon:admin:metering:index')
 CREATE_URL = reverse('horizon:admin:metering:create')
 SAMPLES_URL = reverse('horizon:admin:metering:samples')
+CSV_URL = reverse('horizon:admin:metering:csvreport')
+
+
+def _project_directory(tenants):
+    return dict((t.id, api.keystone.project_info(t)) for t in tenants)
 
 
 class MeteringViewTests(test.BaseAdminViewTests):
@@ -55,6 +60,33 @@ class MeteringViewTests(test.BaseAdminViewTests):
         self.assertFormError(res, "form", "date_from",
                              ['Must specify start of period'])
 
+    @test.create_stubs({api.keystone: ('project_directory',),
+                        api.ceilometer: ('meter_list',
+                                         'sample_list',
+                                         'statistic_list',
+                                         ), })
+    def test_csv_report(self):
+        meter = api.ceilometer.Meter(self.meters.list()[1])
+        api.ceilometer.meter_list(IsA(http.HttpRequest)) \
+            .AndReturn([meter])
+        api.ceilometer.sample_list(IsA(http.HttpRequest), meter.name,
+                                   limit=1).AndReturn([])
+        api.keystone.project_directory(IsA(http.HttpRequest)) \
+            .AndReturn(_project_directory(self.tenants.list()[:1]))
+        api.ceilometer.statistic_list(IsA(http.HttpRequest), meter.name,
+                                      period=IsA(int), query=IsA(list)) \
+            .AndReturn(self.statistics.list())
+        self.mox.ReplayAll()
+
+        res = self.client.get(CSV_URL + "?date_options=7")
+
+        rows = res.content.decode('utf-8').splitlines()
+        self.assertEqual(2, len(rows))
+        self.assertEqual(u'%s,%s,%s,Nova,2012-12-21T11:00:55.000000,4.55,'
+                         u'instance' % (self.tenants.first().name,
+                                        meter.name, meter.description),
+                         rows[1])
+
 
 class MeteringLineChartTabTests(test.BaseAdminViewTests):
     def setUp(self):
@@ -77,7 +109,7 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
 
         self.assertEqual(data.get('settings'), {})
 
-    @test.create_stubs({api.keystone: ('tenant_list',),
+    @test.create_stubs({api.keystone: ('project_directory',),
                         api.ceilometer: ('sample_list',
                                          'statistic_list',
                                          ), })
@@ -90,10 +122,8 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
                                       period=IsA(int),
                                       query=IsA(list)).MultipleTimes()\
             .AndReturn(self.testdata.statistics.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest),
-                                 domain=None,
-                                 paginate=False) \
-            .AndReturn([self.testdata.tenants.list(), False])
+        api.keystone.project_directory(IsA(http.HttpRequest)) \
+            .AndReturn(_project_directory(self.testdata.tenants.list()))
 
         self.mox.ReplayAll()
 
@@ -110,7 +140,7 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
         self._verify_series(res._container[0], 4.55, '2012-12-21T11:00:55',
                             expected_names)
 
-    @test.create_stubs({api.keystone: ('tenant_list',),
+    @test.create_stubs({api.keystone: ('project_directory',),
                         api.ceilometer: ('sample_list',
                                          'statistic_list',
                                          ), })
@@ -122,10 +152,8 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
                                       'memory', period=IsA(int),
                                       query=IsA(list))\
             .MultipleTimes().AndReturn(self.testdata.statistics.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest),
-                                 domain=None,
-                                 paginate=False) \
-            .AndReturn([self.testdata.tenants.list(), False])
+        api.keystone.project_directory(IsA(http.HttpRequest)) \
+            .AndReturn(_project_directory(self.testdata.tenants.list()))
 
         self.mox.ReplayAll()
 
@@ -143,8 +171,7 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
         self._verify_series(res._container[0], 9.0, '2012-12-21T11:00:55',
                             expected_names)
 
-    @test.create_stubs({api.keystone: ('tenant_list',),
-                        api.ceilometer: ('sample_list',
+    @test.create_stubs({api.ceilometer: ('sample_list',
                                          'resource_list',
                                          'statistic_list'
                                          ), })
@@ -159,11 +186,6 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
                                       'memory', period=IsA(int),
                                       query=IsA(list))\
             .MultipleTimes().AndReturn(self.testdata.statistics.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest),
-                                 domain=None,
-                                 paginate=False) \
-            .AndReturn([self.testdata.tenants.list(), False])
-
         self.mox.ReplayAll()
 
         # get all statistics of the meter
@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import itertools
 import json
 
 from django.core.urlresolvers import reverse_lazy
@@ -76,12 +77,13 @@ class SamplesView(django.views.generic.TemplateView):
                                               date_to, 3600 * 24)
 
         resources, unit = query.query(meter)
-        series = metering_utils.series_for_meter(request, resources,
-                                                 group_by, meter,
-                                                 meter_name, stats_attr, unit)
+        series = metering_utils.meter_series(request, resources,
+                                             group_by, meter,
+                                             meter_name, stats_attr, unit)
 
-        series = metering_utils.normalize_series_by_unit(series)
-        ret = {'series': series, 'settings': {}}
+        series = metering_utils.normalize_units(series)
+        ret = {'series': [item.to_chart() for item in series],
+               'settings': {}}
         return HttpResponse(json.dumps(ret), content_type='application/json')
 
 
@@ -105,15 +107,9 @@ class ReportCsvRenderer(csvbase.BaseCsvResponse):
 
     def get_row_data(self):
 
-        for p in self.context['usage'].values():
-            for u in p:
-                yield (u["project"],
-                       u["meter"],
-                       u["description"],
-                       u["service"],
-                       u["time"],
-                       u["value"],
-                       u["unit"])
+        for rows in self.context['usage'].values():
+            for row in rows:
+                yield row
 
 
 def load_report_data(request):
@@ -155,17 +151,15 @@ def load_report_data(request):
         for r in res:
             values = r.get_meter(meter.name.replace(".", "_"))
             if values:
-                for value in values:
-                    row = {"name": 'none',
-                           "project": r.id,
-                           "meter": meter.name,
-                           "description": meter.description,
-                           "service": service,
-                           "time": value._apiresource.period_end,
-                           "value": value._apiresource.avg,
-                           "unit": meter.unit}
-                    if r.id not in project_rows:
-                        project_rows[r.id] = [row]
-                    else:
-                        project_rows[r.id].append(row)
+                # One row per statistic, in the order of the CSV columns.
+                times, averages = metering_utils.statistics_columns(
+                    values, 'period_end', 'avg')
+                project_rows.setdefault(r.id, []).extend(zip(
+                    itertools.repeat(r.id),
+                    itertools.repeat(meter.name),
+                    itertools.repeat(meter.description),
+                    itertools.repeat(service),
+                    times,
+                    averages,
+                    itertools.repeat(meter.unit)))
     return project_rows
@@ -12,8 +12,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from collections import OrderedDict
-
 from django.core.urlresolvers import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
 
@@ -46,14 +44,12 @@ class IndexView(tables.DataTableView):
     @memoized.memoized_method
     def _get_tenant_list(self):
         try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
+            tenant_dict = api.keystone.project_directory(self.request)
         except Exception:
-            tenants = []
+            tenant_dict = {}
             msg = _("Unable to retrieve information about the "
                     "networks' projects.")
             exceptions.handle(self.request, msg)
-
-        tenant_dict = OrderedDict([(t.id, t) for t in tenants])
         return tenant_dict
 
     def _get_agents_data(self, network):
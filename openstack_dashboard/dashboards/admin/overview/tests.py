@@ -23,6 +23,7 @@ from django import http
 from django.utils import encoding
 from django.utils import timezone
 
+from keystoneclient import exceptions as keystone_exceptions
 from mox3.mox import IsA  # noqa
 
 from horizon.templatetags import sizeformat
@@ -42,6 +43,7 @@ class UsageViewTests(test.BaseAdminViewTests):
         self.mox.StubOutWithMock(api.nova, 'tenant_absolute_limits')
         self.mox.StubOutWithMock(api.nova, 'extension_supported')
         self.mox.StubOutWithMock(api.keystone, 'tenant_list')
+        self.mox.StubOutWithMock(api.keystone, 'tenant_get')
         self.mox.StubOutWithMock(api.neutron, 'is_extension_supported')
         self.mox.StubOutWithMock(api.network, 'floating_ip_supported')
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
@@ -71,6 +73,11 @@ class UsageViewTests(test.BaseAdminViewTests):
         if tenant_deleted:
             api.keystone.tenant_list(IsA(http.HttpRequest)) \
                 .AndReturn([[self.tenants.first()], False])
+            deleted_ids = set(u.tenant_id for u in usage_list
+                              if u.tenant_id != self.tenants.first().id)
+            for tenant_id in deleted_ids:
+                api.keystone.tenant_get(IsA(http.HttpRequest), tenant_id) \
+                    .InAnyOrder().AndRaise(keystone_exceptions.NotFound)
         else:
             api.keystone.tenant_list(IsA(http.HttpRequest)) \
                 .AndReturn([self.tenants.list(), False])
@@ -58,17 +58,18 @@ class GlobalOverview(usage.UsageView):
         data = super(GlobalOverview, self).get_data()
         # Pre-fill project names
         try:
-            projects, has_more = api.keystone.tenant_list(self.request)
+            projects = api.keystone.project_directory_get(
+                self.request, [instance.tenant_id for instance in data])
         except Exception:
-            projects = []
+            projects = {}
             exceptions.handle(self.request,
                               _('Unable to retrieve project list.'))
         for instance in data:
-            project = [t for t in projects if t.id == instance.tenant_id]
+            project = projects.get(instance.tenant_id)
             # If we could not get the project name, show the tenant_id with
             # a 'Deleted' identifier instead.
             if project:
-                instance.project_name = getattr(project[0], "name", None)
+                instance.project_name = getattr(project, "name", None)
             else:
                 deleted = _("Deleted")
                 instance.project_name = translation.string_concat(
@@ -97,8 +97,6 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         api.neutron.router_list(
             IsA(http.HttpRequest),
             search_opts=None).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
         self._mock_external_network_list()
         api.neutron.port_list(IsA(http.HttpRequest),
                               device_id=router.id, device_owner=IgnoreArg())\
@@ -107,8 +105,6 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         api.neutron.router_list(
             IsA(http.HttpRequest),
             search_opts=None).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
         self._mock_external_network_list()
         self.mox.ReplayAll()
 
@@ -138,8 +134,6 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         api.neutron.router_list(
             IsA(http.HttpRequest),
             search_opts=None).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
         self._mock_external_network_list()
         api.neutron.port_list(IsA(http.HttpRequest),
                               device_id=router.id, device_owner=IgnoreArg())\
@@ -151,8 +145,6 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         api.neutron.router_list(
             IsA(http.HttpRequest),
             search_opts=None).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
         self._mock_external_network_list()
         self.mox.ReplayAll()
 
@@ -49,13 +49,15 @@ class VolumeTab(volumes_tabs.PagedTableMixin, tabs.TableTab,
 
         # Gather our tenants to correlate against IDs
         try:
-            tenants, has_more = keystone.tenant_list(self.request)
+            tenant_dict = keystone.project_directory_get(
+                self.request,
+                [getattr(v, "os-vol-tenant-attr:tenant_id", None)
+                 for v in volumes])
         except Exception:
-            tenants = []
+            tenant_dict = {}
             msg = _('Unable to retrieve volume project information.')
             exceptions.handle(self.request, msg)
 
-        tenant_dict = OrderedDict([(t.id, t) for t in tenants])
         for volume in volumes:
             tenant_id = getattr(volume, "os-vol-tenant-attr:tenant_id", None)
             tenant = tenant_dict.get(tenant_id, None)
@@ -139,13 +141,16 @@ class SnapshotTab(volumes_tabs.PagedTableMixin, tabs.TableTab):
 
             # Gather our tenants to correlate against volume IDs
             try:
-                tenants, has_more = keystone.tenant_list(self.request)
+                tenant_dict = keystone.project_directory_get(
+                    self.request,
+                    [getattr(volumes.get(s.volume_id),
+                             'os-vol-tenant-attr:tenant_id', None)
+                     for s in snapshots])
             except Exception:
-                tenants = []
+                tenant_dict = {}
                 msg = _('Unable to retrieve volume project information.')
                 exceptions.handle(self.request, msg)
 
-            tenant_dict = dict([(t.id, t) for t in tenants])
             for snapshot in snapshots:
                 volume = volumes.get(snapshot.volume_id)
                 tenant_id = getattr(volume,
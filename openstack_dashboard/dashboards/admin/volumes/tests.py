@@ -15,6 +15,7 @@
 import copy
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django import http
 from django.test.utils import override_settings
@@ -36,7 +37,7 @@ INDEX_URL = reverse('horizon:admin:volumes:index')
 
 class VolumeTests(test.BaseAdminViewTests):
 
-    @test.create_stubs({api.nova: ('server_list',),
+    @test.create_stubs({api.nova: ('server_get_many',),
                         cinder: ('volume_list_paged',
                                  'volume_snapshot_list'),
                         keystone: ('tenant_list',)})
@@ -53,9 +54,9 @@ class VolumeTests(test.BaseAdminViewTests):
         cinder.volume_snapshot_list(IsA(http.HttpRequest), search_opts={
             'all_tenants': True}).AndReturn([])
         if not instanceless_volumes:
-            api.nova.server_list(IsA(http.HttpRequest), search_opts={
-                                 'all_tenants': True}) \
-                .AndReturn([self.servers.list(), False])
+            api.nova.server_get_many(IsA(http.HttpRequest), IsA(list),
+                                     search_opts={'all_tenants': True}) \
+                .AndReturn(dict((s.id, s) for s in self.servers.list()))
         keystone.tenant_list(IsA(http.HttpRequest)) \
             .AndReturn([self.tenants.list(), False])
 
@@ -72,12 +73,14 @@ class VolumeTests(test.BaseAdminViewTests):
     def test_index_with_attachments(self):
         self._test_index(instanceless_volumes=False)
 
-    @test.create_stubs({api.nova: ('server_list',),
+    @test.create_stubs({api.nova: ('server_get_many',),
                         cinder: ('volume_list_paged',
                                  'volume_snapshot_list'),
                         keystone: ('tenant_list',)})
     def _test_index_paginated(self, marker, sort_dir, volumes, url,
                               has_more, has_prev):
+        # Every page is expected to build the project directory anew.
+        cache.clear()
         vol_snaps = self.cinder_volume_snapshots.list()
         cinder.volume_list_paged(IsA(http.HttpRequest), sort_dir=sort_dir,
                                  marker=marker, paginate=True,
@@ -85,9 +88,9 @@ class VolumeTests(test.BaseAdminViewTests):
             .AndReturn([volumes, has_more, has_prev])
         api.cinder.volume_snapshot_list(
             IsA(http.HttpRequest), search_opts=None).AndReturn(vol_snaps)
-        api.nova.server_list(IsA(http.HttpRequest), search_opts={
-                             'all_tenants': True}) \
-            .AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(IsA(http.HttpRequest), IsA(list),
+                                 search_opts={'all_tenants': True}) \
+            .AndReturn(dict((s.id, s) for s in self.servers.list()))
         keystone.tenant_list(IsA(http.HttpRequest)) \
             .AndReturn([self.tenants.list(), False])
 
@@ -230,6 +233,8 @@ class VolumeTests(test.BaseAdminViewTests):
                         keystone: ('tenant_list',)})
     def _test_snapshots_index_paginated(self, marker, sort_dir, snapshots, url,
                                         has_more, has_prev):
+        # Every page is expected to build the project directory anew.
+        cache.clear()
         cinder.volume_snapshot_list_paged(
             IsA(http.HttpRequest), paginate=True, marker=marker,
             sort_dir=sort_dir, search_opts={'all_tenants': True}) \
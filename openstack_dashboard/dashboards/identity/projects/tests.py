@@ -51,12 +51,10 @@ PROJECT_DETAIL_URL = reverse('horizon:identity:projects:detail', args=[1])
 
 
 class TenantsViewTests(test.BaseAdminViewTests):
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'tenant_list',
+    @test.create_stubs({api.keystone: ('tenant_list',
                                        'domain_lookup')})
     def test_index(self):
         domain = self.domains.get(id="1")
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         api.keystone.tenant_list(IsA(http.HttpRequest),
                                  domain=None,
                                  paginate=True,
@@ -637,8 +637,7 @@ class UsersViewTests(test.BaseAdminViewTests):
             res, "form", 'password',
             ['Password must be between 8 and 18 characters.'])
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_update_enabled',
+    @test.create_stubs({api.keystone: ('user_update_enabled',
                                        'user_list',
                                        'domain_lookup')})
     def test_enable_user(self):
@@ -648,7 +647,6 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         user.enabled = False
 
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         api.keystone.user_list(IgnoreArg(), domain=domain_id).AndReturn(users)
         api.keystone.user_update_enabled(IgnoreArg(),
                                          user.id,
@@ -663,8 +661,7 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_update_enabled',
+    @test.create_stubs({api.keystone: ('user_update_enabled',
                                        'user_list',
                                        'domain_lookup')})
     def test_disable_user(self):
@@ -675,7 +672,6 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertTrue(user.enabled)
 
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         api.keystone.user_list(IgnoreArg(), domain=domain_id) \
             .AndReturn(users)
         api.keystone.user_update_enabled(IgnoreArg(),
@@ -691,8 +687,7 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_update_enabled',
+    @test.create_stubs({api.keystone: ('user_update_enabled',
                                        'user_list',
                                        'domain_lookup')})
     def test_enable_disable_user_exception(self):
@@ -702,7 +697,6 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         user.enabled = False
 
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         api.keystone.user_list(IgnoreArg(), domain=domain_id) \
             .AndReturn(users)
         api.keystone.user_update_enabled(IgnoreArg(), user.id, True) \
@@ -716,14 +710,12 @@ class UsersViewTests(test.BaseAdminViewTests):
 
         self.assertRedirectsNoFollow(res, USERS_INDEX_URL)
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_list',
+    @test.create_stubs({api.keystone: ('user_list',
                                        'domain_lookup')})
     def test_disabling_current_user(self):
         domain = self._get_default_domain()
         domain_id = domain.id
         users = self._get_users(domain_id)
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         for i in range(0, 2):
             api.keystone.user_list(IgnoreArg(), domain=domain_id) \
                 .AndReturn(users)
@@ -739,8 +731,7 @@ class UsersViewTests(test.BaseAdminViewTests):
                          u'You are not allowed to disable user: '
                          u'test_user')
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_list',
+    @test.create_stubs({api.keystone: ('user_list',
                                        'domain_lookup')})
     def test_disabling_current_user_domain_name(self):
         domain = self._get_default_domain()
@@ -749,7 +740,6 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         domain_lookup = dict((d.id, d.name) for d in domains)
 
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         for u in users:
             u.domain_name = domain_lookup.get(u.domain_id)
 
@@ -767,14 +757,12 @@ class UsersViewTests(test.BaseAdminViewTests):
                          u'You are not allowed to disable user: '
                          u'test_user')
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_list',
+    @test.create_stubs({api.keystone: ('user_list',
                                        'domain_lookup')})
     def test_delete_user_with_improper_permissions(self):
         domain = self._get_default_domain()
         domain_id = domain.id
         users = self._get_users(domain_id)
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         for i in range(0, 2):
             api.keystone.user_list(IgnoreArg(), domain=domain_id) \
                 .AndReturn(users)
@@ -790,8 +778,7 @@ class UsersViewTests(test.BaseAdminViewTests):
                          u'You are not allowed to delete user: %s'
                          % self.request.user.username)
 
-    @test.create_stubs({api.keystone: ('domain_get',
-                                       'user_list',
+    @test.create_stubs({api.keystone: ('user_list',
                                        'domain_lookup')})
     def test_delete_user_with_improper_permissions_domain_name(self):
         domain = self._get_default_domain()
@@ -800,7 +787,6 @@ class UsersViewTests(test.BaseAdminViewTests):
         users = self._get_users(domain_id)
         domain_lookup = dict((d.id, d.name) for d in domains)
 
-        api.keystone.domain_get(IsA(http.HttpRequest), '1').AndReturn(domain)
         for u in users:
             u.domain_name = domain_lookup.get(u.domain_id)
 
@@ -33,3 +33,4 @@ class IndexView(tabs.TabbedTableView):
     tab_group_class = project_tabs.AccessAndSecurityTabs
     template_name = 'project/access_and_security/index.html'
     page_title = _("Access & Security")
+    concurrent_data_loading = True
@@ -201,10 +201,9 @@ class InsertRuleToPolicy(forms.SelfHandlingForm):
             available_rules = [r for r in all_rules
                                if not r.firewall_policy_id]
 
-            current_rules = []
-            for r in kwargs['initial']['firewall_rules']:
-                r_obj = [rule for rule in all_rules if r == rule.id][0]
-                current_rules.append(r_obj)
+            rules_by_id = dict((rule.id, rule) for rule in all_rules)
+            current_rules = [rules_by_id[r]
+                             for r in kwargs['initial']['firewall_rules']]
 
             available_choices = [(r.id, r.name_or_id) for r in available_rules]
             current_choices = [(r.id, r.name_or_id) for r in current_rules]
@@ -256,10 +255,9 @@ class RemoveRuleFromPolicy(forms.SelfHandlingForm):
             tenant_id = request.user.tenant_id
             all_rules = api.fwaas.rule_list_for_tenant(request, tenant_id)
 
-            current_rules = []
-            for r in kwargs['initial']['firewall_rules']:
-                r_obj = [rule for rule in all_rules if r == rule.id][0]
-                current_rules.append(r_obj)
+            rules_by_id = dict((rule.id, rule) for rule in all_rules)
+            current_rules = [rules_by_id[r]
+                             for r in kwargs['initial']['firewall_rules']]
 
             current_choices = [(r.id, r.name_or_id) for r in current_rules]
         except Exception as e:
@@ -240,6 +240,15 @@ def get_image_type(image):
     return getattr(image, "properties", {}).get("image_type", "image")
 
 
+def get_image_size(image):
+    progress = getattr(image, 'upload_progress', None)
+    if progress and progress.get('size'):
+        return _("%(uploaded)s of %(size)s uploaded") % {
+            'uploaded': filters.filesizeformat(progress['uploaded']),
+            'size': filters.filesizeformat(progress['size'])}
+    return filters.filesizeformat(getattr(image, "size", None))
+
+
 def get_format(image):
     format = getattr(image, "disk_format", "")
     # The "container_format" attribute can actually be set to None,
@@ -261,6 +270,7 @@ class UpdateRow(tables.Row):
 
     def get_data(self, request, image_id):
         image = api.glance.image_get(request, image_id)
+        image.upload_progress = api.glance.image_upload_progress(image_id)
         return image
 
     def load_cells(self, image=None):
@@ -319,8 +329,7 @@ class ImagesTable(tables.DataTable):
                               empty_value=False,
                               filters=(filters.yesno, filters.capfirst))
     disk_format = tables.Column(get_format, verbose_name=_("Format"))
-    size = tables.Column("size",
-                         filters=(filters.filesizeformat,),
+    size = tables.Column(get_image_size,
                          attrs=({"data-type": "size"}),
                          verbose_name=_("Size"))
 
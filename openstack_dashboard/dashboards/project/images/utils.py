@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from collections import OrderedDict
+
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
@@ -23,6 +25,9 @@ def get_available_images(request, project_id=None, images_cache=None):
     project_id. If project_id is not specified, only public images
     are returned.
 
+    Both lists come from the image catalog shared between requests (see
+    :func:`openstack_dashboard.api.glance.image_catalog`).
+
     :param images_cache: An optional dict-like object in which to
      cache public and per-project id image metadata.
 
@@ -32,12 +37,8 @@ def get_available_images(request, project_id=None, images_cache=None):
     public_images = images_cache.get('public_images', [])
     images_by_project = images_cache.get('images_by_project', {})
     if 'public_images' not in images_cache:
-        public = {"is_public": True,
-                  "status": "active"}
         try:
-            images, _more, _prev = glance.image_list_detailed(
-                request, filters=public)
-            [public_images.append(image) for image in images]
+            public_images.extend(glance.image_catalog(request))
             images_cache['public_images'] = public_images
         except Exception:
             exceptions.handle(request,
@@ -48,11 +49,8 @@ def get_available_images(request, project_id=None, images_cache=None):
         images_by_project[project_id] = []
 
     if project_id not in images_by_project:
-        owner = {"property-owner_id": project_id,
-                 "status": "active"}
         try:
-            owned_images, _more, _prev = glance.image_list_detailed(
-                request, filters=owner)
+            owned_images = glance.image_catalog(request, project_id)
             images_by_project[project_id] = owned_images
         except Exception:
             owned_images = []
@@ -65,17 +63,13 @@ def get_available_images(request, project_id=None, images_cache=None):
     if 'images_by_project' not in images_cache:
         images_cache['images_by_project'] = images_by_project
 
-    images = owned_images + public_images
-
     # Remove duplicate images
-    image_ids = []
-    final_images = []
-    for image in images:
-        if image.id not in image_ids:
-            image_ids.append(image.id)
-            final_images.append(image)
-    return [image for image in final_images
-            if image.container_format not in ('aki', 'ari')]
+    images = OrderedDict()
+    for image in owned_images + public_images:
+        if image.id not in images and \
+                image.container_format not in ('aki', 'ari'):
+            images[image.id] = image
+    return list(images.values())
 
 
 def image_field_data(request, include_empty_option=False):
@@ -102,6 +102,7 @@ class DetailView(tables.MultiTableView):
     table_classes = (subnet_tables.SubnetsTable, port_tables.PortsTable)
     template_name = 'project/networks/detail.html'
     page_title = '{{ network.name | default:network.id }}'
+    concurrent_data_loading = True
 
     def get_subnets_data(self):
         try:
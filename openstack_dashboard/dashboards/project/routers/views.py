@@ -105,6 +105,7 @@ class DetailView(tabs.TabbedTableView):
     failure_url = reverse_lazy('horizon:project:routers:index')
     network_url = 'horizon:project:networks:detail'
     page_title = "{{ router.name|default:router.id }}"
+    concurrent_data_loading = True
 
     @memoized.memoized_method
     def _get_data(self):
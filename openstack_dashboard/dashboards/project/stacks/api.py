@@ -10,8 +10,14 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import hashlib
 import json
 
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import translation
+import six
+
 from openstack_dashboard.api import heat
 
 from openstack_dashboard.dashboards.project.stacks import mappings
@@ -22,7 +28,27 @@ class Stack(object):
     pass
 
 
-def d3_data(request, stack_id=''):
+def _topology_ttl():
+    return getattr(settings, 'OPENSTACK_HEAT_TOPOLOGY_CACHE_TTL', 600)
+
+
+def _cache_key(kind, *parts):
+    value = u'\0'.join(six.text_type(part) for part in parts)
+    digest = hashlib.sha1(value.encode('utf-8')).hexdigest()
+    return 'heat-topology-%s:%s' % (kind, digest)
+
+
+def _resource_signature(resource):
+    return (resource.resource_status,
+            getattr(resource, 'updated_time', None),
+            tuple(resource.required_by))
+
+
+def get_topology(request, stack_id=''):
+    """Return the ``(stack, resources)`` pair the topology is built from.
+
+    A stack which can not be retrieved any more is reported as deleted.
+    """
     try:
         stack = heat.stack_get(request, stack_id)
     except Exception:
@@ -36,8 +62,64 @@ def d3_data(request, stack_id=''):
         resources = heat.resources_list(request, stack.stack_name)
     except Exception:
         resources = []
+    return stack, resources
+
+
+def topology_version(stack, resources):
+    """Return a version string for the topology of ``stack``.
+
+    It only changes when the stack or one of its resources is updated, so
+    it is suitable as an ETag for the topology data.
+    """
+    state = [(stack.id, stack.stack_status,
+              getattr(stack, 'updated_time', None))]
+    state.extend(sorted((resource.resource_name,) +
+                        _resource_signature(resource)
+                        for resource in resources))
+    state = json.dumps(state)
+    return hashlib.sha1(state.encode('utf-8')).hexdigest()
+
+
+def resource_info(stack, resource):
+    """Rendered info box of ``resource``, cached until the resource changes.
+    """
+    key = _cache_key('info', stack.id, resource.resource_name,
+                     getattr(resource, 'physical_resource_id', None),
+                     resource.resource_status,
+                     getattr(resource, 'updated_time', None),
+                     translation.get_language())
+    info = cache.get(key)
+    if info is None:
+        info = sro.resource_info(resource)
+        cache.set(key, info, _topology_ttl())
+    return info
+
+
+def d3_data(request, stack_id='', since=None, topology=None):
+    """Return the JSON encoded topology of a stack.
+
+    When ``since`` is the version of an earlier response still known to
+    the cache, only the resource nodes which changed since then are
+    included, and the names of removed resources are listed in
+    ``removed``.
+    """
+    stack, resources = topology or get_topology(request, stack_id)
+    version = topology_version(stack, resources)
+    signatures = dict((resource.resource_name,
+                       _resource_signature(resource))
+                      for resource in resources)
+    cache.set(_cache_key('version', stack.id, version), signatures,
+              _topology_ttl())
+    previous = None
+    if since and since != version:
+        previous = cache.get(_cache_key('version', stack.id, since))
+    elif since:
+        previous = signatures
 
-    d3_data = {"nodes": [], "stack": {}}
+    d3_data = {"nodes": [], "stack": {}, "version": version}
+    if previous is not None:
+        d3_data['delta'] = True
+        d3_data['removed'] = sorted(set(previous) - set(signatures))
     if stack:
         stack_image = mappings.get_resource_image(stack.stack_status, 'stack')
         stack_node = {
@@ -57,6 +139,10 @@ def d3_data(request, stack_id=''):
 
     if resources:
         for resource in resources:
+            if (previous is not None and previous.get(
+                    resource.resource_name) ==
+                    signatures[resource.resource_name]):
+                continue
             resource_image = mappings.get_resource_image(
                 resource.resource_status,
                 resource.resource_type)
@@ -77,7 +163,7 @@ def d3_data(request, stack_id=''):
                 'text_x': 35,
                 'text_y': ".35em",
                 'in_progress': in_progress,
-                'info_box': sro.resource_info(resource)
+                'info_box': resource_info(stack, resource)
             }
             d3_data['nodes'].append(resource_node)
     return json.dumps(d3_data)
@@ -24,12 +24,14 @@ from mox3.mox import IsA  # noqa
 import six
 
 from heatclient.common import template_format as hc_format
+from heatclient.v1 import resources
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
 from openstack_dashboard.dashboards.project.stacks import api as project_api
 from openstack_dashboard.dashboards.project.stacks import forms
 from openstack_dashboard.dashboards.project.stacks import mappings
+from openstack_dashboard.dashboards.project.stacks import sro
 from openstack_dashboard.dashboards.project.stacks import tables
 
 
@@ -891,6 +893,89 @@ class StackTests(test.TestCase):
         self.assertIn(json.loads(template.validate)['Description'],
                       template_data)
 
+    def _topology_resource(self, name, status, updated_time,
+                           required_by=()):
+        return resources.Resource(resources.ResourceManager(None), {
+            'resource_name': name,
+            'physical_resource_id': '%s-id' % name,
+            'resource_type': 'OS::Nova::Server',
+            'resource_status': status,
+            'resource_status_reason': 'state changed',
+            'updated_time': updated_time,
+            'required_by': list(required_by)})
+
+    @test.create_stubs({api.heat: ('stack_get', 'resources_list')})
+    def test_topology_json_not_modified(self):
+        stack = self.stacks.first()
+        server = self._topology_resource('server', 'CREATE_COMPLETE',
+                                         '2016-01-01T00:00:00Z')
+        api.heat.stack_get(IsA(http.HttpRequest), stack.id) \
+            .MultipleTimes().AndReturn(stack)
+        api.heat.resources_list(IsA(http.HttpRequest), stack.stack_name) \
+            .MultipleTimes().AndReturn([server])
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:project:stacks:d3_data', args=[stack.id])
+        res = self.client.get(url)
+        self.assertEqual(200, res.status_code)
+        data = json.loads(res.content.decode('utf-8'))
+        self.assertEqual('"%s"' % data['version'], res['ETag'])
+        self.assertEqual(['server'], [n['name'] for n in data['nodes']])
+
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=res['ETag'])
+        self.assertEqual(304, res.status_code)
+        self.assertEqual(b'', res.content)
+
+    @test.create_stubs({api.heat: ('stack_get', 'resources_list')})
+    def test_topology_json_delta(self):
+        stack = self.stacks.first()
+        server = self._topology_resource('server', 'CREATE_IN_PROGRESS',
+                                         '2016-01-01T00:00:00Z')
+        volume = self._topology_resource('volume', 'CREATE_COMPLETE',
+                                         '2016-01-01T00:00:00Z')
+        port = self._topology_resource('port', 'CREATE_COMPLETE',
+                                       '2016-01-01T00:00:00Z')
+        server_done = self._topology_resource('server', 'CREATE_COMPLETE',
+                                              '2016-01-01T00:01:00Z')
+        api.heat.stack_get(IsA(http.HttpRequest), stack.id) \
+            .MultipleTimes().AndReturn(stack)
+        api.heat.resources_list(IsA(http.HttpRequest), stack.stack_name) \
+            .AndReturn([server, volume, port])
+        api.heat.resources_list(IsA(http.HttpRequest), stack.stack_name) \
+            .AndReturn([server_done, volume])
+        self.mox.ReplayAll()
+
+        url = reverse('horizon:project:stacks:d3_data', args=[stack.id])
+        full = json.loads(self.client.get(url).content.decode('utf-8'))
+        self.assertNotIn('delta', full)
+        self.assertEqual(3, len(full['nodes']))
+
+        res = self.client.get(url, {'since': full['version']})
+        delta = json.loads(res.content.decode('utf-8'))
+        self.assertTrue(delta['delta'])
+        self.assertNotEqual(full['version'], delta['version'])
+        self.assertEqual(['server'], [n['name'] for n in delta['nodes']])
+        self.assertEqual('CREATE_COMPLETE', delta['nodes'][0]['status'])
+        self.assertEqual(['port'], delta['removed'])
+        self.assertEqual(stack.stack_name, delta['stack']['name'])
+
+    def test_topology_resource_info_cached(self):
+        stack = self.stacks.first()
+        server = self._topology_resource('server', 'CREATE_IN_PROGRESS',
+                                         '2016-01-01T00:00:00Z')
+        server_done = self._topology_resource('server', 'CREATE_COMPLETE',
+                                              '2016-01-01T00:01:00Z')
+        self.mox.StubOutWithMock(sro, 'resource_info')
+        sro.resource_info(server).AndReturn('<h3>in progress</h3>')
+        sro.resource_info(server_done).AndReturn('<h3>complete</h3>')
+        self.mox.ReplayAll()
+
+        for _i in range(2):
+            self.assertEqual('<h3>in progress</h3>',
+                             project_api.resource_info(stack, server))
+        self.assertEqual('<h3>complete</h3>',
+                         project_api.resource_info(stack, server_done))
+
     @test.create_stubs({api.heat: ('resource_get', 'resource_metadata_get')})
     def test_resource_view(self):
         stack = self.stacks.first()
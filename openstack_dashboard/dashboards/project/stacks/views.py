@@ -18,6 +18,9 @@ import yaml
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.http import HttpResponse  # noqa
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+from django.utils.http import quote_etag
 from django.utils.translation import ugettext_lazy as _
 import django.views.generic
 
@@ -359,5 +362,16 @@ class ResourceView(tabs.TabView):
 
 class JSONView(django.views.generic.View):
     def get(self, request, stack_id=''):
-        return HttpResponse(project_api.d3_data(request, stack_id=stack_id),
-                            content_type="application/json")
+        topology = project_api.get_topology(request, stack_id)
+        version = project_api.topology_version(*topology)
+        if version in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                project_api.d3_data(request, stack_id=stack_id,
+                                    since=request.GET.get('since'),
+                                    topology=topology),
+                content_type="application/json")
+        response['ETag'] = quote_etag(version)
+        response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -52,7 +52,7 @@ class VolumeBackupsViewTests(test.TestCase):
         self.assertMessageCount(error=0, warning=0)
         self.assertRedirectsNoFollow(res, VOLUME_BACKUPS_TAB_URL)
 
-    @test.create_stubs({api.cinder: ('volume_list',
+    @test.create_stubs({api.cinder: ('volume_get_many',
                                      'volume_backup_supported',
                                      'volume_backup_list_paged',
                                      'volume_backup_delete')})
@@ -66,8 +66,9 @@ class VolumeBackupsViewTests(test.TestCase):
         api.cinder.volume_backup_list_paged(
             IsA(http.HttpRequest), marker=None, sort_dir='desc',
             paginate=True).AndReturn([vol_backups, False, False])
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
-            AndReturn(volumes)
+        api.cinder.volume_get_many(
+            IsA(http.HttpRequest), [b.volume_id for b in vol_backups]). \
+            AndReturn(dict((v.id, v) for v in volumes))
         api.cinder.volume_backup_delete(IsA(http.HttpRequest), backup.id)
 
         self.mox.ReplayAll()
@@ -106,7 +106,7 @@ class VolumeSnapshotsViewTests(test.TestCase):
         self.assertRedirectsNoFollow(res, VOLUME_SNAPSHOTS_TAB_URL)
 
     @test.create_stubs({api.cinder: ('volume_snapshot_list_paged',
-                                     'volume_list',
+                                     'volume_get_many',
                                      'volume_backup_supported',
                                      'volume_snapshot_delete',
                                      'tenant_absolute_limits')})
@@ -120,8 +120,9 @@ class VolumeSnapshotsViewTests(test.TestCase):
         api.cinder.volume_snapshot_list_paged(
             IsA(http.HttpRequest), paginate=True, marker=None,
             sort_dir='desc').AndReturn([vol_snapshots, False, False])
-        api.cinder.volume_list(IsA(http.HttpRequest)). \
-            AndReturn(volumes)
+        api.cinder.volume_get_many(
+            IsA(http.HttpRequest), [s.volume_id for s in vol_snapshots]). \
+            AndReturn(dict((v.id, v) for v in volumes))
 
         api.cinder.volume_snapshot_delete(IsA(http.HttpRequest), snapshot.id)
         self.mox.ReplayAll()
@@ -57,11 +57,9 @@ class VolumeTableMixIn(object):
         if not instance_ids:
             return []
         try:
-            # TODO(tsufiev): we should pass attached_instance_ids to
-            # nova.server_list as soon as Nova API allows for this
-            instances, has_more = api.nova.server_list(self.request,
-                                                       search_opts=search_opts)
-            return instances
+            instances = api.nova.server_get_many(self.request, instance_ids,
+                                                 search_opts=search_opts)
+            return list(instances.values())
         except Exception:
             exceptions.handle(self.request,
                               _("Unable to retrieve volume/instance "
@@ -165,8 +163,8 @@ class SnapshotTab(PagedTableMixin, tabs.TableTab):
                     api.cinder.volume_snapshot_list_paged(
                         self.request, paginate=True, marker=marker,
                         sort_dir=sort_dir)
-                volumes = api.cinder.volume_list(self.request)
-                volumes = dict((v.id, v) for v in volumes)
+                volumes = api.cinder.volume_get_many(
+                    self.request, [s.volume_id for s in snapshots])
             except Exception:
                 exceptions.handle(self.request, _("Unable to retrieve "
                                                   "volume snapshots."))
@@ -195,8 +193,8 @@ class BackupsTab(PagedTableMixin, tabs.TableTab, VolumeTableMixIn):
                 api.cinder.volume_backup_list_paged(
                     self.request, marker=marker, sort_dir=sort_dir,
                     paginate=True)
-            volumes = api.cinder.volume_list(self.request)
-            volumes = dict((v.id, v) for v in volumes)
+            volumes = api.cinder.volume_get_many(
+                self.request, [b.volume_id for b in backups])
             for backup in backups:
                 backup.volume = volumes.get(backup.volume_id)
         except Exception:
@@ -12,6 +12,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from collections import OrderedDict
 import copy
 
 from django.conf import settings
@@ -39,16 +40,20 @@ VOLUME_BACKUPS_TAB_URL = urlunquote(reverse(
     'horizon:project:volumes:backups_tab'))
 
 
+def by_id(resources):
+    return OrderedDict((r.id, r) for r in resources)
+
+
 class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
     @test.create_stubs({api.cinder: ('tenant_absolute_limits',
-                                     'volume_list',
+                                     'volume_get_many',
                                      'volume_list_paged',
                                      'volume_snapshot_list',
                                      'volume_snapshot_list_paged',
                                      'volume_backup_supported',
                                      'volume_backup_list_paged',
                                      ),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def _test_index(self, backup_supported=True, instanceless_volumes=False):
         vol_backups = self.cinder_volume_backups.list()
         vol_snaps = self.cinder_volume_snapshots.list()
@@ -64,20 +69,25 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
             sort_dir='desc', paginate=True).\
             AndReturn([volumes, False, False])
         if not instanceless_volumes:
-            api.nova.server_list(IsA(http.HttpRequest), search_opts=None).\
-                AndReturn([self.servers.list(), False])
+            api.nova.server_get_many(IsA(http.HttpRequest), IsA(list),
+                                     search_opts=None).\
+                AndReturn(by_id(self.servers.list()))
         api.cinder.volume_snapshot_list(IsA(http.HttpRequest)).\
             AndReturn(vol_snaps)
 
         api.cinder.volume_snapshot_list_paged(
             IsA(http.HttpRequest), paginate=True, marker=None,
             sort_dir='desc').AndReturn([vol_snaps, False, False])
-        api.cinder.volume_list(IsA(http.HttpRequest)).AndReturn(volumes)
+        api.cinder.volume_get_many(
+            IsA(http.HttpRequest),
+            [s.volume_id for s in vol_snaps]).AndReturn(by_id(volumes))
         if backup_supported:
             api.cinder.volume_backup_list_paged(
                 IsA(http.HttpRequest), marker=None, sort_dir='desc',
                 paginate=True).AndReturn([vol_backups, False, False])
-            api.cinder.volume_list(IsA(http.HttpRequest)).AndReturn(volumes)
+            api.cinder.volume_get_many(
+                IsA(http.HttpRequest),
+                [b.volume_id for b in vol_backups]).AndReturn(by_id(volumes))
         api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)).\
             MultipleTimes().AndReturn(self.cinder_limits['absolute'])
         self.mox.ReplayAll()
@@ -109,7 +119,7 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
                                      'volume_list_paged',
                                      'volume_backup_supported',
                                      'volume_snapshot_list'),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def _test_index_paginated(self, marker, sort_dir, volumes, url,
                               has_more, has_prev):
         backup_supported = True
@@ -123,8 +133,9 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
             AndReturn([volumes, has_more, has_prev])
         api.cinder.volume_snapshot_list(
             IsA(http.HttpRequest), search_opts=None).AndReturn(vol_snaps)
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None).\
-            AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(IsA(http.HttpRequest), IsA(list),
+                                 search_opts=None).\
+            AndReturn(by_id(self.servers.list()))
         api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)).MultipleTimes().\
             AndReturn(self.cinder_limits['absolute'])
         self.mox.ReplayAll()
@@ -209,10 +220,10 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
 
     @test.create_stubs({api.cinder: ('tenant_absolute_limits',
                                      'volume_snapshot_list_paged',
-                                     'volume_list',
+                                     'volume_get_many',
                                      'volume_backup_supported',
                                      ),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def _test_snapshots_index_paginated(self, marker, sort_dir, snapshots, url,
                                         has_more, has_prev):
         backup_supported = True
@@ -222,8 +233,8 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
         api.cinder.volume_snapshot_list_paged(
             IsA(http.HttpRequest), marker=marker, sort_dir=sort_dir,
             paginate=True).AndReturn([snapshots, has_more, has_prev])
-        api.cinder.volume_list(IsA(http.HttpRequest)).AndReturn(
-            self.cinder_volumes.list())
+        api.cinder.volume_get_many(IsA(http.HttpRequest), IsA(list)).\
+            AndReturn(by_id(self.cinder_volumes.list()))
         self.mox.ReplayAll()
 
         res = self.client.get(urlunquote(url))
@@ -298,10 +309,10 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
 
     @test.create_stubs({api.cinder: ('tenant_absolute_limits',
                                      'volume_backup_list_paged',
-                                     'volume_list',
+                                     'volume_get_many',
                                      'volume_backup_supported',
                                      ),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def _test_backups_index_paginated(self, marker, sort_dir, backups, url,
                                       has_more, has_prev):
         backup_supported = True
@@ -311,8 +322,8 @@ class VolumeAndSnapshotsAndBackupsTests(test.TestCase):
         api.cinder.volume_backup_list_paged(
             IsA(http.HttpRequest), marker=marker, sort_dir=sort_dir,
             paginate=True).AndReturn([backups, has_more, has_prev])
-        api.cinder.volume_list(IsA(http.HttpRequest)).AndReturn(
-            self.cinder_volumes.list())
+        api.cinder.volume_get_many(IsA(http.HttpRequest), IsA(list)).\
+            AndReturn(by_id(self.cinder_volumes.list()))
         self.mox.ReplayAll()
 
         res = self.client.get(urlunquote(url))
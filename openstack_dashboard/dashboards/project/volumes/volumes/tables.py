@@ -337,7 +337,7 @@ def get_attachment_name(request, attachment):
         name = attachment["instance"].name
     else:
         try:
-            server = api.nova.server_get(request, server_id)
+            server = api.nova.server_get_many(request, [server_id])[server_id]
             name = server.name
         except Exception:
             name = None
@@ -920,7 +920,7 @@ class VolumeViewTests(test.TestCase):
                                  'volume_snapshot_list',
                                  'volume_backup_supported',
                                  'volume_delete',),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def test_delete_volume(self):
         volumes = self.cinder_volumes.list()
         volume = self.cinder_volumes.first()
@@ -936,16 +936,18 @@ class VolumeViewTests(test.TestCase):
                                     search_opts=None).\
             AndReturn([])
         cinder.volume_delete(IsA(http.HttpRequest), volume.id)
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None).\
-            AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None).\
+            AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.volume_list_paged(
             IsA(http.HttpRequest), marker=None, paginate=True, sort_dir='desc',
             search_opts=None).AndReturn([volumes, False, False])
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=None).\
             AndReturn([])
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None).\
-            AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None).\
+            AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.tenant_absolute_limits(IsA(http.HttpRequest)).MultipleTimes().\
             AndReturn(self.cinder_limits['absolute'])
 
@@ -1154,7 +1156,7 @@ class VolumeViewTests(test.TestCase):
                                  'volume_list_paged',
                                  'volume_snapshot_list',
                                  'volume_backup_supported',),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def test_create_button_attributes(self):
         limits = self.cinder_limits['absolute']
         limits['maxTotalVolumes'] = 10
@@ -1169,8 +1171,9 @@ class VolumeViewTests(test.TestCase):
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=None).\
             AndReturn([])
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None)\
-            .AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None)\
+            .AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.tenant_absolute_limits(IsA(http.HttpRequest))\
             .MultipleTimes().AndReturn(limits)
         self.mox.ReplayAll()
@@ -1196,7 +1199,7 @@ class VolumeViewTests(test.TestCase):
                                  'volume_list_paged',
                                  'volume_snapshot_list',
                                  'volume_backup_supported',),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def test_create_button_disabled_when_quota_exceeded(self):
         limits = self.cinder_limits['absolute']
         limits['totalVolumesUsed'] = limits['maxTotalVolumes']
@@ -1210,8 +1213,9 @@ class VolumeViewTests(test.TestCase):
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=None).\
             AndReturn([])
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None)\
-            .AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None)\
+            .AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.tenant_absolute_limits(IsA(http.HttpRequest))\
             .MultipleTimes().AndReturn(limits)
         self.mox.ReplayAll()
@@ -1585,7 +1589,7 @@ class VolumeViewTests(test.TestCase):
                                  'volume_snapshot_list',
                                  'volume_backup_supported',
                                  'tenant_absolute_limits'),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def _test_encryption(self, encryption):
         volumes = self.volumes.list()
         for volume in volumes:
@@ -1602,8 +1606,9 @@ class VolumeViewTests(test.TestCase):
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=None).\
             AndReturn(self.cinder_volume_snapshots.list())
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None)\
-            .AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None)\
+            .AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.tenant_absolute_limits(IsA(http.HttpRequest))\
             .MultipleTimes('limits').AndReturn(limits)
 
@@ -1650,7 +1655,7 @@ class VolumeViewTests(test.TestCase):
                                  'volume_list_paged',
                                  'volume_snapshot_list',
                                  'tenant_absolute_limits'),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def test_create_transfer_availability(self):
         limits = self.cinder_limits['absolute']
 
@@ -1663,8 +1668,9 @@ class VolumeViewTests(test.TestCase):
         cinder.volume_snapshot_list(IsA(http.HttpRequest),
                                     search_opts=None).\
             AndReturn([])
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None)\
-                .AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None)\
+            .AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.tenant_absolute_limits(IsA(http.HttpRequest))\
               .MultipleTimes().AndReturn(limits)
 
@@ -1705,7 +1711,7 @@ class VolumeViewTests(test.TestCase):
                                  'volume_snapshot_list',
                                  'transfer_delete',
                                  'tenant_absolute_limits'),
-                        api.nova: ('server_list',)})
+                        api.nova: ('server_get_many',)})
     def test_delete_transfer(self):
         transfer = self.cinder_volume_transfers.first()
         volumes = []
@@ -1729,8 +1735,9 @@ class VolumeViewTests(test.TestCase):
                                     search_opts=None).\
             AndReturn([])
         cinder.transfer_delete(IsA(http.HttpRequest), transfer.id)
-        api.nova.server_list(IsA(http.HttpRequest), search_opts=None).\
-            AndReturn([self.servers.list(), False])
+        api.nova.server_get_many(
+            IsA(http.HttpRequest), IsA(list), search_opts=None).\
+            AndReturn(dict((s.id, s) for s in self.servers.list()))
         cinder.tenant_absolute_limits(IsA(http.HttpRequest)).MultipleTimes().\
             AndReturn(self.cinder_limits['absolute'])
 
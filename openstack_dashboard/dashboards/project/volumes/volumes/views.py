@@ -70,9 +70,10 @@ class DetailView(tabs.TabView):
                 self.request, search_opts={'volume_id': volume.id})
             if snapshots:
                 setattr(volume, 'has_snapshot', True)
+            instances = api.nova.server_get_many(
+                self.request, [att['server_id'] for att in volume.attachments])
             for att in volume.attachments:
-                att['instance'] = api.nova.server_get(self.request,
-                                                      att['server_id'])
+                att['instance'] = instances.get(att['server_id'])
         except Exception:
             redirect = self.get_redirect_url()
             exceptions.handle(self.request,
@@ -0,0 +1,53 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+
+import optparse
+
+from django.conf import settings
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+
+from horizon.utils import js_catalog
+
+from openstack_dashboard import context_processors
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        optparse.make_option(
+            '--language',
+            dest='languages',
+            action='append',
+            default=None,
+            help=('Language to compile the catalogs for, may be repeated. '
+                  'Defaults to all the languages of the LANGUAGES setting.'),
+        ),
+    )
+
+    help = ("Compiles the JavaScript translation catalogs of the dashboard "
+            "into content-hashed files in STATIC_ROOT, which pages then "
+            "link to instead of the dynamic catalog view. Run it after "
+            "collectstatic whenever translations or plugins change.")
+
+    def handle(self, *args, **options):
+        if not settings.STATIC_ROOT:
+            raise CommandError("STATIC_ROOT is not set.")
+        languages = (options['languages'] or
+                     [code for code, _name in settings.LANGUAGES])
+        packages = sorted(set(['horizon',
+                               context_processors.get_js_catalog()]))
+        manifest = js_catalog.compile_static(languages, packages)
+        for language in sorted(manifest):
+            for package_list, path in sorted(manifest[language].items()):
+                print("%-8s %-40s %s" % (language, package_list, path))
@@ -0,0 +1,54 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+
+import optparse
+
+from django.conf import settings
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+
+from horizon import themes
+from horizon.utils import theme_bundles
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        optparse.make_option(
+            '--theme',
+            dest='themes',
+            action='append',
+            default=None,
+            help=('Theme to compile the stylesheet of, may be repeated. '
+                  'Defaults to all the themes of the AVAILABLE_THEMES '
+                  'setting.'),
+        ),
+    )
+
+    help = ("Compiles the SCSS stylesheets of the themes into content-hashed "
+            "CSS files in STATIC_ROOT, which pages then link to instead of "
+            "compiling the SCSS on first use. Run it after collectstatic "
+            "whenever the themes, their SCSS or the plugins change.")
+
+    def handle(self, *args, **options):
+        if not settings.STATIC_ROOT:
+            raise CommandError("STATIC_ROOT is not set.")
+        available = [theme[0] for theme in themes.get_themes()]
+        unknown = set(options['themes'] or []) - set(available)
+        if unknown:
+            raise CommandError("Unknown themes: %s." %
+                               ", ".join(sorted(unknown)))
+        manifest = theme_bundles.compile_themes(options['themes'] or
+                                                available)
+        for theme in sorted(manifest):
+            print("%-20s %s" % (theme, manifest[theme]))
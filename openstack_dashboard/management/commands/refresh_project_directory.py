@@ -0,0 +1,94 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+
+import optparse
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+from keystoneauth1.identity import generic
+from keystoneauth1 import session
+
+from openstack_dashboard.api import keystone
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        optparse.make_option(
+            '--endpoint',
+            dest='endpoint',
+            default=None,
+            help=('Identity admin endpoint the dashboard talks to, as found '
+                  'in the service catalog. Defaults to the admin identity '
+                  'endpoint of the catalog of the given credentials.'),
+        ),
+        optparse.make_option(
+            '--domain',
+            dest='domain',
+            default=None,
+            help=('ID of the domain whose projects are listed (Identity v3 '
+                  'only). Defaults to the domain of the given user.'),
+        ),
+    )
+
+    help = ("Rebuilds the cached project directory used to show project "
+            "names in the admin panels. Credentials are read from the "
+            "OS_AUTH_URL, OS_USERNAME, OS_PASSWORD, OS_PROJECT_NAME, "
+            "OS_USER_DOMAIN_NAME and OS_PROJECT_DOMAIN_NAME environment "
+            "variables.")
+
+    def get_session(self):
+        auth_url = os.environ.get('OS_AUTH_URL',
+                                  getattr(settings, 'OPENSTACK_KEYSTONE_URL',
+                                          None))
+        if not auth_url or not os.environ.get('OS_USERNAME'):
+            raise CommandError("OS_AUTH_URL and OS_USERNAME are required.")
+        auth = generic.Password(
+            auth_url=auth_url,
+            username=os.environ['OS_USERNAME'],
+            password=os.environ.get('OS_PASSWORD'),
+            project_name=os.environ.get('OS_PROJECT_NAME',
+                                        os.environ.get('OS_TENANT_NAME')),
+            user_domain_name=os.environ.get('OS_USER_DOMAIN_NAME'),
+            project_domain_name=os.environ.get('OS_PROJECT_DOMAIN_NAME'))
+        verify = not getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
+        if verify:
+            verify = getattr(settings, 'OPENSTACK_SSL_CACERT', None) or True
+        return session.Session(auth=auth, verify=verify)
+
+    def handle(self, *args, **options):
+        sess = self.get_session()
+        endpoint = options.get('endpoint') or sess.get_endpoint(
+            service_type='identity', interface='admin')
+        version = keystone.VERSIONS.active
+        api_version = keystone.VERSIONS.get_active_version()
+        conn = api_version['client'].Client(session=sess,
+                                            endpoint_override=endpoint)
+
+        domain_id = None
+        if version < 3:
+            projects = conn.tenants.list()
+        else:
+            domain_id = (options.get('domain') or
+                         sess.auth.get_access(sess).user_domain_id)
+            if domain_id == keystone.DEFAULT_DOMAIN:
+                projects = conn.projects.list()
+            else:
+                projects = conn.projects.list(domain=domain_id)
+
+        directory = dict((p.id, keystone.project_info(p)) for p in projects)
+        keystone.project_directory_store(
+            keystone.project_directory_key(endpoint, domain_id), directory)
+        print("Stored %d projects of %s." % (len(directory), endpoint))
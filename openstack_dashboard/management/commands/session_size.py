@@ -0,0 +1,96 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+
+from importlib import import_module
+import optparse
+import timeit
+
+from django.conf import settings
+from django.contrib.sessions import serializers
+from django.core.management.base import BaseCommand  # noqa
+from django.core.management.base import CommandError  # noqa
+from django.core import signing
+
+from openstack_dashboard.utils import sessions
+
+
+COOKIE_SALT = 'django.contrib.sessions.backends.signed_cookies'
+
+
+class Command(BaseCommand):
+    args = '<session key>'
+    option_list = BaseCommand.option_list + (
+        optparse.make_option(
+            '--repeat',
+            dest='repeat',
+            type='int',
+            default=100,
+            help='Number of times the session is (de)serialized for timing.',
+        ),
+    )
+
+    help = ("Reports the size of every key of a session, serialized with "
+            "the pickle serializer and with the compact serializer, and "
+            "how long each serializer takes. The session key is the value "
+            "of the session cookie; with cookie-based sessions this is the "
+            "session itself.")
+
+    def handle(self, *args, **options):
+        if len(args) != 1:
+            raise CommandError("A session key is required.")
+        engine = import_module(settings.SESSION_ENGINE)
+        session = engine.SessionStore(session_key=args[0]).load()
+        if not session:
+            raise CommandError("The session is empty, expired or can not "
+                               "be read with the current SECRET_KEY.")
+
+        print("%-32s %10s %10s" % ("key", "pickle", "compact"))
+        for key, pickle_size, compact_size in sessions.size_report(session):
+            print("%-32s %10d %10d" % (key, pickle_size, compact_size))
+
+        print()
+        print("%-32s %10s %10s" % ("", "pickle", "compact"))
+        variants = (serializers.PickleSerializer, sessions.CompactSerializer)
+        self.row("serialized bytes",
+                 [len(serializer().dumps(session))
+                  for serializer in variants])
+        self.row("cookie bytes",
+                 [len(signing.dumps(session, salt=COOKIE_SALT,
+                                    serializer=serializer, compress=True))
+                  for serializer in variants])
+        repeat = options['repeat']
+        self.row("dumps ms",
+                 [self.time(lambda: serializer().dumps(session), repeat)
+                  for serializer in variants])
+        self.row("loads ms",
+                 [self.time(lambda: serializer().loads(data), repeat)
+                  for serializer, data in
+                  [(s, s().dumps(session)) for s in variants]])
+        self.row("loads + catalog ms",
+                 [self.time(lambda: self.load_catalog(serializer, data),
+                            repeat)
+                  for serializer, data in
+                  [(s, s().dumps(session)) for s in variants]])
+
+    def row(self, label, values):
+        print(("%-32s" + " %10s" * len(values)) % ((label,) + tuple(
+            "%.3f" % value if isinstance(value, float) else value
+            for value in values)))
+
+    def time(self, func, repeat):
+        return timeit.timeit(func, number=repeat) * 1000 / repeat
+
+    def load_catalog(self, serializer, data):
+        token = serializer().loads(data).get('token')
+        return getattr(token, 'serviceCatalog', None)
@@ -0,0 +1,75 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+
+import optparse
+
+from django.conf import settings
+from django.core.management.base import BaseCommand  # noqa
+from django.core import urlresolvers
+
+import horizon
+from horizon.utils import file_discovery
+from horizon.utils import startup
+
+
+class Command(BaseCommand):
+    option_list = BaseCommand.option_list + (
+        optparse.make_option(
+            '--output',
+            dest='output',
+            default=None,
+            help=('File to write the manifest to. Defaults to the '
+                  'STARTUP_MANIFEST setting; when neither is set only the '
+                  'timing report is printed.'),
+        ),
+        optparse.make_option(
+            '--threshold',
+            dest='threshold',
+            type='float',
+            default=1.0,
+            help=('Leave out of the report the steps faster than this '
+                  'number of milliseconds (default: 1).'),
+        ),
+    )
+
+    help = ("Loads the dashboards and panels and reports how long the steps "
+            "of the startup took. Writes the startup manifest, the static "
+            "files discovery and the resolved dashboards and panels, which "
+            "starting processes use instead of walking the static "
+            "directories again. Run it again whenever the installed "
+            "dashboards or their static files change.")
+
+    def handle(self, *args, **options):
+        with startup.timed('URLs'):
+            urlresolvers.get_resolver(None).url_patterns
+        dashboards = [
+            {'slug': dashboard.slug,
+             'panels': [panel.slug for panel in dashboard.get_panels()]}
+            for dashboard in horizon.get_dashboards()]
+
+        output = options['output'] or getattr(settings, 'STARTUP_MANIFEST',
+                                              None)
+        if output:
+            config = settings.HORIZON_CONFIG
+            file_discovery.save_manifest(
+                output,
+                dashboards=dashboards,
+                angular_modules=config.get('angular_modules', []),
+                scss_files=config.get('scss_files', []),
+                timings=startup.timings())
+            print("Wrote the startup manifest to %s." % output)
+        print("%d dashboards, %d panels." % (
+            len(dashboards),
+            sum(len(dashboard['panels']) for dashboard in dashboards)))
+        print(startup.report(options['threshold'] / 1000))
@@ -190,10 +190,9 @@ SESSION_TIMEOUT = 3600
 # the following size (common browsers drop cookies above a certain size):
 SESSION_COOKIE_MAX_SIZE = 4093
 
-# when doing upgrades, it may be wise to stick to PickleSerializer
-# NOTE(berendt): Check during the K-cycle if this variable can be removed.
-#                https://bugs.launchpad.net/horizon/+bug/1349463
-SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
+# Stores the session as compressed JSON with a single copy of the service
+# catalog. It reads sessions written by the pickle and JSON serializers too.
+SESSION_SERIALIZER = 'openstack_dashboard.utils.sessions.CompactSerializer'
 
 LANGUAGES = (
     ('cs', 'Czech'),
@@ -261,6 +260,11 @@ SECURITY_GROUP_RULES = {
 
 ADD_INSTALLED_APPS = []
 
+# Path of the startup manifest written by the startup_manifest command.
+# When set, the static files discovery it records is reused by the processes
+# starting up instead of walking the static directories again.
+STARTUP_MANIFEST = None
+
 # Deprecated Theme Settings
 CUSTOM_THEME_PATH = None
 DEFAULT_THEME_PATH = None
@@ -356,9 +360,16 @@ if DEFAULT_THEME_PATH is not None:
     logging.warning("DEFAULT_THEME_PATH has been deprecated.  Please convert "
                     "your settings to make use of AVAILABLE_THEMES.")
 
+from horizon.utils import file_discovery
+from horizon.utils import startup
+
+if STARTUP_MANIFEST:
+    file_discovery.load_manifest(STARTUP_MANIFEST)
+
 # populate HORIZON_CONFIG with auto-discovered JavaScript sources, mock files,
 # specs files and external templates.
-find_static_files(HORIZON_CONFIG)
+with startup.timed('static files discovery'):
+    find_static_files(HORIZON_CONFIG)
 
 # Ensure that we always have a SECRET_KEY set, even when no local_settings.py
 # file is present. See local_settings.py.example for full documentation on the
@@ -378,14 +389,15 @@ import openstack_dashboard.local.enabled
 from openstack_dashboard.utils import settings
 
 INSTALLED_APPS = list(INSTALLED_APPS)  # Make sure it's mutable
-settings.update_dashboards(
-    [
-        openstack_dashboard.enabled,
-        openstack_dashboard.local.enabled,
-    ],
-    HORIZON_CONFIG,
-    INSTALLED_APPS,
-)
+with startup.timed('pluggable dashboards'):
+    settings.update_dashboards(
+        [
+            openstack_dashboard.enabled,
+            openstack_dashboard.local.enabled,
+        ],
+        HORIZON_CONFIG,
+        INSTALLED_APPS,
+    )
 INSTALLED_APPS[0:0] = ADD_INSTALLED_APPS
 
 
@@ -22,6 +22,10 @@ from openstack_dashboard.api import keystone
 
 register = template.Library()
 
+# Session key and number of the recent projects of the project list.
+RECENT_PROJECTS_KEY = 'recent_projects'
+RECENT_PROJECTS = 5
+
 
 def is_multi_region_configured(request):
     return len(request.user.available_services_regions) > 1
@@ -74,17 +78,36 @@ def show_domain_list(context):
     return context
 
 
+def remember_project(request):
+    """Return the recent projects of the user, current project first.
+
+    Recent projects are kept in the session as ``[id, name]`` pairs.
+    """
+    recent = request.session.get(RECENT_PROJECTS_KEY) or []
+    current = [request.user.project_id, request.user.project_name]
+    if all(current) and (not recent or list(recent[0]) != current):
+        recent = [current] + [project for project in recent
+                              if project[0] != current[0]]
+        recent = recent[:RECENT_PROJECTS]
+        request.session[RECENT_PROJECTS_KEY] = recent
+    return recent
+
+
 @register.inclusion_tag('context_selection/_project_list.html',
                         takes_context=True)
 def show_project_list(context):
-    max_proj = getattr(settings, 'DROPDOWN_MAX_ITEMS', 30)
+    """Render the current and the recent projects of the user.
+
+    The other projects are searched for and loaded on demand from the
+    ``keystone/user-projects`` REST API.
+    """
     if 'request' not in context:
         return {}
     request = context['request']
-    projects = sorted(context['authorized_tenants'],
-                      key=lambda project: project.name.lower())
-    context = {'projects': projects[:max_proj],
+    context = {'projects': [{'id': project_id, 'name': name}
+                            for project_id, name in remember_project(request)],
                'project_id': request.user.project_id,
+               'webroot': getattr(settings, 'WEBROOT', '/'),
                'request': request}
     return context
 
@@ -23,6 +23,7 @@ from django.contrib.staticfiles.storage import staticfiles_storage
 from django import template
 
 from horizon import themes as hz_themes
+from horizon.utils import theme_bundles
 
 register = template.Library()
 
@@ -86,6 +87,12 @@ def current_theme(context):
     return get_theme(context.request)
 
 
+@register.assignment_tag()
+def theme_stylesheet(theme):
+    """Return the URL of the precompiled stylesheet of ``theme``, if any."""
+    return theme_bundles.stylesheet_url(theme)
+
+
 @register.simple_tag(takes_context=True)
 def themable_asset(context, asset):
     return find_asset(get_theme(context.request), asset)
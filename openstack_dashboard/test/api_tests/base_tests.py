@@ -18,7 +18,11 @@
 
 from __future__ import absolute_import
 
+import pickle
+
 from django.conf import settings
+from django import http
+from novaclient import exceptions as nova_exceptions
 
 from horizon import exceptions
 
@@ -84,6 +88,52 @@ class APIResourceWrapperTests(test.TestCase):
         self.assertIn('bar', resource_str)
         self.assertNotIn('baz', resource_str)
 
+    def test_no_instance_dict_until_needed(self):
+        resource = APIResource.get_instance()
+        self.assertFalse(resource.__dict__)
+        resource.extra = 'extra'
+        self.assertEqual({'extra': 'extra'}, resource.__dict__)
+        self.assertEqual('extra', resource.extra)
+
+    def test_pickle(self):
+        resource = APIDict.get_instance()
+        resource.extra = 'extra'
+        unpickled = pickle.loads(pickle.dumps(resource))
+        self.assertEqual('foo', unpickled.foo)
+        self.assertEqual('extra', unpickled.extra)
+
+
+class CompactAPIResourceWrapperTests(test.TestCase):
+    def test_get_attribute(self):
+        resource = api_base.compact(APIResource)(
+            APIResource.get_instance()._apiresource)
+        self.assertEqual('foo', resource.foo)
+        self.assertEqual('bar', resource.bar)
+        with self.assertRaises(AttributeError):
+            resource.baz
+        with self.assertRaises(AttributeError):
+            resource.missing
+
+    def test_drops_api_resource(self):
+        resource = api_base.compact(APIResource)(
+            APIResource.get_instance()._apiresource)
+        with self.assertRaises(AttributeError):
+            resource._apiresource
+        self.assertEqual({'foo': 'foo', 'bar': 'bar', 'baz': None},
+                         resource.to_dict())
+
+    def test_compact_class_is_reused(self):
+        compact_class = api_base.compact(APIResource)
+        self.assertTrue(issubclass(compact_class, APIResource))
+        self.assertIs(compact_class, api_base.compact(APIResource))
+        self.assertIs(compact_class, api_base.compact(compact_class))
+
+    def test_attribute_override(self):
+        resource = api_base.compact(APIResource)(
+            APIResource.get_instance()._apiresource)
+        resource.foo = 'new foo'
+        self.assertEqual('new foo', resource.foo)
+
 
 class APIDictWrapperTests(test.TestCase):
     # APIDict allows for both attribute access and dictionary style [element]
@@ -283,3 +333,78 @@ class QuotaSetTests(test.TestCase):
     def test_quotaset_add_with_wrong_type(self):
         quota_set = api_base.QuotaSet({'foo': 1, 'bar': 10})
         self.assertRaises(ValueError, quota_set.add, {'test': 7})
+
+    def test_quotaset_add_overrides_unset_quota(self):
+        quota_set = api_base.QuotaSet({'foo': None, 'bar': 10})
+        quota_set.add(api_base.QuotaSet({'foo': 12}))
+        self.assertEqual(2, len(quota_set))
+        self.assertEqual(12, quota_set.get('foo').limit)
+
+    def test_quotaset_setitem_replaces_quota(self):
+        quota_set = api_base.QuotaSet()
+        quota_set['foo'] = 1
+        quota_set['bar'] = 2
+        quota_set['foo'] = '3'
+        self.assertEqual(['foo', 'bar'], [q.name for q in quota_set])
+        self.assertEqual(3, quota_set.get('foo').limit)
+        self.assertEqual('bar', quota_set[1].name)
+
+    def test_quotaset_get_missing(self):
+        quota_set = api_base.QuotaSet({'foo': 1})
+        self.assertIsNone(quota_set.get('bar').limit)
+        self.assertEqual(5, quota_set.get('bar', 5).limit)
+
+    def test_quotaset_remove(self):
+        quota_set = api_base.QuotaSet({'foo': 1, 'bar': 10})
+        quota_set.remove('foo', 'missing')
+        self.assertEqual(['bar'], [q.name for q in quota_set])
+
+
+class GetManyTests(test.TestCase):
+
+    def setUp(self):
+        super(GetManyTests, self).setUp()
+        self.request = http.HttpRequest()
+        self.resources = dict((s.id, s) for s in self.servers.list())
+        self.calls = []
+
+    def _get(self, resource_id):
+        self.calls.append(('get', resource_id))
+        if resource_id not in self.resources:
+            raise nova_exceptions.NotFound(404)
+        return self.resources[resource_id]
+
+    def _list_all(self):
+        self.calls.append(('list', None))
+        return self.resources.values()
+
+    def test_get_many_fetches_each_once(self):
+        server = self.servers.first()
+        ids = [server.id, None, 'missing', server.id]
+        found = api_base.get_many(self.request, 'servers', ids,
+                                  self._get, self._list_all)
+        self.assertEqual([server.id], list(found))
+        self.assertEqual(server, found[server.id])
+        self.assertEqual(sorted([('get', server.id), ('get', 'missing')]),
+                         sorted(self.calls))
+
+        # Resolved and missing resources are remembered for the request.
+        found = api_base.get_many(self.request, 'servers', ids,
+                                  self._get, self._list_all)
+        self.assertEqual([server.id], list(found))
+        self.assertEqual(2, len(self.calls))
+
+    def test_get_many_lists_above_max_lookups(self):
+        ids = list(self.resources) + ['missing']
+        found = api_base.get_many(self.request, 'servers', ids,
+                                  self._get, self._list_all, max_lookups=1)
+        self.assertEqual(ids[:-1], list(found))
+        self.assertEqual([('list', None)], self.calls)
+
+    def test_get_many_raises_other_errors(self):
+        def get(resource_id):
+            raise nova_exceptions.ClientException(500)
+
+        self.assertRaises(nova_exceptions.ClientException,
+                          api_base.get_many, self.request, 'servers',
+                          [self.servers.first().id], get, self._list_all)
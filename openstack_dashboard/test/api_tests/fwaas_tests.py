@@ -62,7 +62,8 @@ class FwaasApiTests(test.APITestCase):
         api_policies = {'firewall_policies': self.api_fw_policies.list()}
 
         neutronclient.list_firewall_rules().AndReturn(api_rules)
-        neutronclient.list_firewall_policies().AndReturn(api_policies)
+        neutronclient.list_firewall_policies(
+            id=[self.api_fw_policies.first()['id']]).AndReturn(api_policies)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.rule_list(self.request)
@@ -82,7 +83,11 @@ class FwaasApiTests(test.APITestCase):
             shared=False).AndReturn({'firewall_rules': []})
         neutronclient.list_firewall_rules(shared=True) \
             .AndReturn(api_rules)
-        neutronclient.list_firewall_policies().AndReturn(api_policies)
+        neutronclient.list_firewall_policies(
+            tenant_id=tenant_id,
+            shared=False).AndReturn(api_policies)
+        neutronclient.list_firewall_policies(shared=True) \
+            .AndReturn({'firewall_policies': []})
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.rule_list_for_tenant(self.request, tenant_id)
@@ -183,7 +188,9 @@ class FwaasApiTests(test.APITestCase):
         rules_dict = {'firewall_rules': self.api_fw_rules.list()}
 
         neutronclient.list_firewall_policies().AndReturn(policies_dict)
-        neutronclient.list_firewall_rules().AndReturn(rules_dict)
+        neutronclient.list_firewall_rules(
+            id=self.api_fw_policies.first()['firewall_rules']
+        ).AndReturn(rules_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.policy_list(self.request)
@@ -203,7 +210,11 @@ class FwaasApiTests(test.APITestCase):
             shared=False).AndReturn({'firewall_policies': []})
         neutronclient.list_firewall_policies(
             shared=True).AndReturn(policies_dict)
-        neutronclient.list_firewall_rules().AndReturn(rules_dict)
+        neutronclient.list_firewall_rules(
+            tenant_id=tenant_id,
+            shared=False).AndReturn(rules_dict)
+        neutronclient.list_firewall_rules(shared=True) \
+            .AndReturn({'firewall_rules': []})
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.policy_list_for_tenant(self.request, tenant_id)
@@ -356,7 +367,8 @@ class FwaasApiTests(test.APITestCase):
         policies_dict = {'firewall_policies': self.api_fw_policies.list()}
 
         neutronclient.list_firewalls().AndReturn(firewalls_dict)
-        neutronclient.list_firewall_policies().AndReturn(policies_dict)
+        neutronclient.list_firewall_policies(
+            id=[self.api_fw_policies.first()['id']]).AndReturn(policies_dict)
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.firewall_list(self.request)
@@ -373,13 +385,53 @@ class FwaasApiTests(test.APITestCase):
 
         neutronclient.list_firewalls(tenant_id=tenant_id) \
             .AndReturn(firewalls_dict)
-        neutronclient.list_firewall_policies().AndReturn(policies_dict)
+        neutronclient.list_firewall_policies(
+            tenant_id=tenant_id,
+            shared=False).AndReturn(policies_dict)
+        neutronclient.list_firewall_policies(shared=True) \
+            .AndReturn({'firewall_policies': []})
         self.mox.ReplayAll()
 
         ret_val = api.fwaas.firewall_list_for_tenant(self.request, tenant_id)
         for (v, d) in zip(ret_val, exp_firewalls):
             self._assert_firewall_return_value(v, d)
 
+    @test.create_stubs({neutronclient: ('list_firewalls',
+                                        'list_firewall_policies',
+                                        'list_firewall_rules')})
+    def test_resource_graph_loads_each_collection_once(self):
+        tenant_id = self.request.user.project_id
+        api_rules = self.api_fw_rules.list()
+        api_policies = self.api_fw_policies.list()
+
+        neutronclient.list_firewall_policies(
+            tenant_id=tenant_id, shared=False) \
+            .AndReturn({'firewall_policies': api_policies[:1]})
+        neutronclient.list_firewall_policies(shared=True) \
+            .AndReturn({'firewall_policies': api_policies[1:]})
+        neutronclient.list_firewall_rules(
+            tenant_id=tenant_id, shared=False) \
+            .AndReturn({'firewall_rules': api_rules})
+        neutronclient.list_firewall_rules(shared=True) \
+            .AndReturn({'firewall_rules': []})
+        neutronclient.list_firewalls(tenant_id=tenant_id) \
+            .AndReturn({'firewalls': self.api_firewalls.list()})
+        self.mox.ReplayAll()
+
+        # Every collection is listed once, however often it is used.
+        for _i in range(2):
+            policies = api.fwaas.policy_list_for_tenant(self.request,
+                                                        tenant_id)
+            rules = api.fwaas.rule_list_for_tenant(self.request, tenant_id)
+            firewalls = api.fwaas.firewall_list_for_tenant(self.request,
+                                                           tenant_id)
+        for (v, d) in zip(policies, self.fw_policies.list()):
+            self._assert_policy_return_value(v, d)
+        for (v, d) in zip(rules, self.fw_rules.list()):
+            self._assert_rule_return_value(v, d)
+        for (v, d) in zip(firewalls, self.firewalls.list()):
+            self._assert_firewall_return_value(v, d)
+
     @test.create_stubs({neutronclient: ('show_firewall',
                                         'show_firewall_policy')})
     def test_firewall_get(self):
@@ -16,9 +16,21 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+import time
+
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django import http
 from django.test.utils import override_settings
+from glanceclient.v1 import images
+import mock
+from mox3.mox import IsA  # noqa
+import six
 
+from horizon import exceptions
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
@@ -248,6 +260,169 @@ class GlanceApiTests(test.APITestCase):
         image = api.glance.image_get(self.request, 'empty')
         self.assertIsNone(image.name)
 
+    def _catalog_image(self, image_id, updated_at, status='active',
+                       name=None):
+        return images.Image(images.ImageManager(None),
+                            {'id': image_id,
+                             'name': name or image_id,
+                             'status': status,
+                             'owner': self.tenant.id,
+                             'updated_at': updated_at})
+
+    @test.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_image_catalog_cached(self):
+        api_images = self.images.list()
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest),
+            filters={'is_public': True, 'status': 'active'}) \
+            .AndReturn([api_images, False, False])
+        self.mox.ReplayAll()
+
+        first = api.glance.image_catalog(self.request)
+        second = api.glance.image_catalog(self.request)
+        self.assertEqual([i.id for i in api_images], [i.id for i in first])
+        self.assertEqual([i.id for i in api_images], [i.id for i in second])
+        self.assertEqual(api_images[0].name, second[0].name)
+
+    @test.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_image_catalog_incremental_refresh(self):
+        old = self._catalog_image('old', '2016-01-01T00:00:00')
+        gone = self._catalog_image('gone', '2016-01-02T00:00:00')
+        renamed = self._catalog_image('old', '2016-01-03T00:00:00',
+                                      name='renamed')
+        deleted = self._catalog_image('gone', '2016-01-03T00:00:00',
+                                      status='deleted')
+        new = self._catalog_image('new', '2016-01-04T00:00:00')
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest),
+            filters={'property-owner_id': self.tenant.id,
+                     'status': 'active'}) \
+            .AndReturn([[old, gone], False, False])
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest), sort_key='updated_at', sort_dir='asc',
+            filters={'property-owner_id': self.tenant.id,
+                     'changes-since': '2016-01-02T00:00:00'}) \
+            .AndReturn([[renamed, deleted, new], False, False])
+        self.mox.ReplayAll()
+
+        api.glance.image_catalog(self.request, self.tenant.id)
+        key = api.glance._image_catalog_key(self.request, self.tenant.id)
+        catalog = cache.get(key)
+        catalog['checked'] = time.time() - 3600
+        cache.set(key, catalog)
+
+        result = api.glance.image_catalog(self.request, self.tenant.id)
+        self.assertEqual(['old', 'new'], [i.id for i in result])
+        self.assertEqual('renamed', result[0].name)
+        self.assertEqual('2016-01-04T00:00:00', cache.get(key)['since'])
+
+    @test.create_stubs({api.glance: ('image_list_detailed',)})
+    def test_image_catalog_invalidated_on_delete(self):
+        api.glance.image_list_detailed(
+            IsA(http.HttpRequest),
+            filters={'property-owner_id': self.tenant.id,
+                     'status': 'active'}) \
+            .AndReturn([self.images.list(), False, False])
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.delete('image-id')
+        self.mox.ReplayAll()
+
+        api.glance.image_catalog(self.request, self.tenant.id)
+        key = api.glance._image_catalog_key(self.request, self.tenant.id)
+        self.assertIsNotNone(cache.get(key))
+        api.glance.image_delete(self.request, 'image-id')
+        self.assertIsNone(cache.get(key))
+
+    @override_settings(IMAGE_UPLOAD_SPOOL_THRESHOLD=4)
+    @mock.patch.object(api.glance, 'get_upload_executor')
+    def test_image_create_spools_large_upload(self, get_executor):
+        data = InMemoryUploadedFile(six.BytesIO(b'0123456789'), 'data',
+                                    'image.iso', 'application/octet-stream',
+                                    10, None)
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.create(name='image') \
+            .AndReturn(self.images.first())
+        self.mox.ReplayAll()
+
+        api.glance.image_create(self.request, name='image', data=data)
+
+        executor = get_executor.return_value
+        executor.reserve.assert_called_once_with()
+        request, image_id, spooled = executor.submit.call_args[0]
+        self.assertEqual({'reserved': True}, executor.submit.call_args[1])
+        self.assertEqual(self.images.first().id, image_id)
+        self.assertIsInstance(spooled, TemporaryUploadedFile)
+        self.assertEqual(b'0123456789', spooled.read())
+        spooled.file.close_called = False
+        spooled.close()
+
+    def test_image_create_refused_when_queue_full(self):
+        executor = api.glance.ImageUploadExecutor(1, 1)
+        executor.reserve()
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        self.mox.ReplayAll()
+
+        # No image is created when its data cannot be queued.
+        with mock.patch.object(api.glance, 'get_upload_executor',
+                               return_value=executor):
+            self.assertRaises(exceptions.NotAvailable,
+                              api.glance.image_create, self.request,
+                              name='image', data=six.BytesIO(b'0123'))
+
+    def test_image_create_failure_releases_slot(self):
+        executor = api.glance.ImageUploadExecutor(1, 1)
+        glanceclient = self.stub_glanceclient()
+        glanceclient.images = self.mox.CreateMockAnything()
+        glanceclient.images.create(name='image') \
+            .AndRaise(exceptions.Conflict)
+        self.mox.ReplayAll()
+
+        with mock.patch.object(api.glance, 'get_upload_executor',
+                               return_value=executor):
+            self.assertRaises(exceptions.Conflict,
+                              api.glance.image_create, self.request,
+                              name='image', data=six.BytesIO(b'0123'))
+        # The slot taken for the upload was given back.
+        executor.reserve()
+
+    def test_upload_executor_is_bounded(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def upload(request, image_id, data, purge_props):
+            started.set()
+            release.wait(5)
+            while data.read(4):
+                pass
+
+        executor = api.glance.ImageUploadExecutor(1, 1)
+        with mock.patch.object(api.glance, 'image_update',
+                               side_effect=upload):
+            executor.submit(self.request, 'first', six.BytesIO(b'x' * 10))
+            started.wait(5)
+            executor.submit(self.request, 'second', six.BytesIO(b'y' * 6))
+            self.assertEqual(
+                {'uploaded': 0, 'size': None},
+                api.glance.image_upload_progress('second'))
+            self.assertRaises(exceptions.NotAvailable,
+                              executor.submit, self.request, 'third',
+                              six.BytesIO(b'z'))
+            release.set()
+            for _i in range(500):
+                if executor.metrics().get('completed') == 2:
+                    break
+                time.sleep(0.01)
+
+        metrics = executor.metrics()
+        self.assertEqual(2, metrics['completed'])
+        self.assertEqual(16, metrics['bytes'])
+        self.assertEqual(0, metrics['queued'])
+        self.assertIsNone(api.glance.image_upload_progress('first'))
+        self.assertIsNone(api.glance.image_upload_progress('second'))
+
     def test_metadefs_namespace_list(self):
         metadata_defs = self.metadata_defs.list()
         limit = getattr(settings, 'API_RESULT_LIMIT', 1000)
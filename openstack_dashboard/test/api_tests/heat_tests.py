@@ -9,10 +9,14 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import json
+import textwrap
+
 import six
 
 from django.conf import settings
 from django.test.utils import override_settings  # noqa
+from heatclient import exc as heat_exc
 
 from horizon import exceptions
 from openstack_dashboard import api
@@ -276,7 +280,7 @@ class HeatApiTests(test.APITestCase):
         url = 'http://test.example/example'
         data = b'echo "test"'
         self.mox.StubOutWithMock(six.moves.urllib.request, 'urlopen')
-        six.moves.urllib.request.urlopen(url).AndReturn(
+        six.moves.urllib.request.urlopen(url, timeout=10).AndReturn(
             six.BytesIO(data))
         self.mox.ReplayAll()
         files = api.heat.get_template_files(template_data=tmpl)[0]
@@ -302,9 +306,9 @@ class HeatApiTests(test.APITestCase):
         data2 = b'echo "test"'
         expected_files = {'http://test.example/example': b'echo "test"'}
         self.mox.StubOutWithMock(six.moves.urllib.request, 'urlopen')
-        six.moves.urllib.request.urlopen(url).AndReturn(
+        six.moves.urllib.request.urlopen(url, timeout=10).AndReturn(
             six.BytesIO(data))
-        six.moves.urllib.request.urlopen(url2).AndReturn(
+        six.moves.urllib.request.urlopen(url2, timeout=10).AndReturn(
             six.BytesIO(data2))
         self.mox.ReplayAll()
         files = api.heat.get_template_files(template_url=url)[0]
@@ -330,6 +334,82 @@ class HeatApiTests(test.APITestCase):
         except exceptions.GetFileError:
             self.assertRaises(exceptions.GetFileError)
 
+    def test_get_template_files_nested(self):
+        tmpl = textwrap.dedent('''
+    heat_template_version: 2013-05-23
+    resources:
+      group:
+        type: /nested.yaml
+      server:
+        type: OS::Nova::Server
+        properties:
+          user_data:
+            get_file: /script
+    ''')
+        nested = textwrap.dedent('''
+    heat_template_version: 2013-05-23
+    resources:
+      server:
+        type: OS::Nova::Server
+        properties:
+          user_data:
+            get_file: /script
+          metadata:
+            get_file: /metadata
+    ''')
+        with test.StubHTTPServer({}) as server:
+            server.responses.update({
+                '/root.yaml': tmpl.replace('/', server.url('/')).encode(),
+                '/nested.yaml': nested.replace('/',
+                                               server.url('/')).encode(),
+                '/script': b'echo "test"',
+                '/metadata': b'{}'})
+            url = server.url('/root.yaml')
+            files = api.heat.get_template_files(template_url=url)[0]
+            self.assertEqual(
+                sorted(server.url(path) for path in
+                       ('/nested.yaml', '/script', '/metadata')),
+                sorted(files))
+            self.assertEqual(b'echo "test"', files[server.url('/script')])
+            self.assertEqual('2013-05-23', json.loads(
+                files[server.url('/nested.yaml')])['heat_template_version'])
+            # Every URL is fetched once, also when validating again.
+            self.assertEqual(4, len(server.requests))
+            self.assertEqual(
+                files, api.heat.get_template_files(template_url=url)[0])
+            self.assertEqual(4, len(server.requests))
+
+    def test_get_template_files_cycle(self):
+        tmpl = textwrap.dedent('''
+    heat_template_version: 2013-05-23
+    resources:
+      nested:
+        type: %s
+    ''')
+        with test.StubHTTPServer({}) as server:
+            server.responses.update({
+                '/a.yaml': (tmpl % server.url('/b.yaml')).encode(),
+                '/b.yaml': (tmpl % server.url('/a.yaml')).encode()})
+            self.assertRaises(exceptions.TemplateCycleError,
+                              api.heat.get_template_files,
+                              template_url=server.url('/a.yaml'))
+
+    @override_settings(OPENSTACK_HEAT_TEMPLATE_FETCH_TIMEOUT=0.2)
+    def test_get_template_files_timeout(self):
+        tmpl = textwrap.dedent('''
+    heat_template_version: 2013-05-23
+    resources:
+      server:
+        type: OS::Nova::Server
+        properties:
+          user_data:
+            get_file: %s
+    ''')
+        with test.StubHTTPServer({'/script': (1, b'echo')}) as server:
+            self.assertRaises(
+                heat_exc.CommandError, api.heat.get_template_files,
+                template_data=tmpl % server.url('/script'))
+
     def test_template_version_list(self):
         api_template_versions = self.template_versions.list()
 
@@ -560,6 +560,26 @@ class KeystoneRestTestCase(test.TestCase):
                                                user=None, admin=True,
                                                filters=filters)
 
+    @mock.patch.object(keystone.api, 'keystone')
+    def test_user_projects_get(self, kc):
+        request = self.mock_rest_request(GET={'search': 'ni', 'page': '2'})
+        project = mock.Mock(id='project123')
+        project.name = 'Ni!'
+        kc.user_project_search.return_value = ([project], True)
+        response = keystone.UserProjects().get(request)
+        self.assertStatusCode(response, 200)
+        self.assertEqual(response.json,
+                         {"has_more": True,
+                          "items": [{"id": "project123", "name": "Ni!"}]})
+        kc.user_project_search.assert_called_once_with(request, 'ni', 2)
+
+    @mock.patch.object(keystone.api, 'keystone')
+    def test_user_projects_get_invalid_page(self, kc):
+        request = self.mock_rest_request(GET={'page': 'x'})
+        response = keystone.UserProjects().get(request)
+        self.assertStatusCode(response, 400)
+        self.assertFalse(kc.user_project_search.called)
+
     def test_project_create_full(self):
         self._test_project_create(
             '{"name": "bob", '
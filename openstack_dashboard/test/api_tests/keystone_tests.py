@@ -18,7 +18,12 @@
 
 from __future__ import absolute_import
 
+from django.core.cache import cache
+from django import http
+from keystoneclient import exceptions as keystone_exceptions
 from keystoneclient.v2_0 import client as keystone_client
+import mock
+from mox3.mox import IsA  # noqa
 import six
 
 from openstack_dashboard import api
@@ -84,6 +89,197 @@ class RoleAPITests(test.APITestCase):
         role = api.keystone.get_default_role(self.request)
 
 
+class ProjectDirectoryTests(test.APITestCase):
+    def setUp(self):
+        super(ProjectDirectoryTests, self).setUp()
+        cache.clear()
+
+    def tearDown(self):
+        super(ProjectDirectoryTests, self).tearDown()
+        cache.clear()
+
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_project_directory(self):
+        tenants = self.tenants.list()
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        self.mox.ReplayAll()
+
+        directory = api.keystone.project_directory(self.request)
+        self.assertEqual(sorted(t.id for t in tenants), sorted(directory))
+        info = directory[tenants[0].id]
+        self.assertEqual((tenants[0].id, tenants[0].name),
+                         (info.id, info.name))
+        self.assertTrue(info.enabled)
+        cached = cache.get(api.keystone._project_directory_key(self.request))
+        self.assertEqual(directory, cached['projects'])
+
+    @test.create_stubs({api.keystone: ('tenant_list', 'tenant_get')})
+    def test_project_directory_get_missing(self):
+        tenants = self.tenants.list()
+        new_tenant = tenants.pop()
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        api.keystone.tenant_get(IsA(http.HttpRequest), new_tenant.id) \
+            .InAnyOrder().AndReturn(new_tenant)
+        api.keystone.tenant_get(IsA(http.HttpRequest), 'gone') \
+            .InAnyOrder().AndRaise(keystone_exceptions.NotFound)
+        self.mox.ReplayAll()
+
+        ids = [tenants[0].id, new_tenant.id, 'gone']
+        projects = api.keystone.project_directory_get(self.request, ids)
+        self.assertEqual(sorted([tenants[0].id, new_tenant.id]),
+                         sorted(projects))
+        self.assertEqual(new_tenant.name, projects[new_tenant.id].name)
+        # Unknown projects are only remembered during the request.
+        projects = api.keystone.project_directory_get(self.request, ids)
+        self.assertEqual(2, len(projects))
+        cached = cache.get(api.keystone._project_directory_key(self.request))
+        self.assertIn(new_tenant.id, cached['projects'])
+        self.assertNotIn('gone', cached['projects'])
+
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_project_directory_forgets_deleted(self):
+        tenants = self.tenants.list()
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        self.mox.ReplayAll()
+
+        api.keystone.project_directory(self.request)
+        with mock.patch.object(api.keystone.VERSIONS,
+                               'get_project_manager') as get_manager:
+            api.keystone.tenant_delete(self.request, tenants[0].id)
+        get_manager.return_value.delete.assert_called_once_with(
+            tenants[0].id)
+        cached = cache.get(api.keystone._project_directory_key(self.request))
+        self.assertNotIn(tenants[0].id, cached['projects'])
+        self.assertIn(tenants[1].id, cached['projects'])
+
+    @test.create_stubs({api.keystone: ('tenant_list',)})
+    def test_project_directory_get_refreshes(self):
+        tenants = self.tenants.list()
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([[], False])
+        api.keystone.tenant_list(IsA(http.HttpRequest)) \
+            .AndReturn([tenants, False])
+        self.mox.ReplayAll()
+
+        self.mox.stubs.Set(api.keystone, 'PROJECT_DIRECTORY_MAX_LOOKUPS', 1)
+        ids = [t.id for t in tenants]
+        projects = api.keystone.project_directory_get(self.request, ids)
+        self.assertEqual(sorted(ids), sorted(projects))
+
+
+class DomainNameTests(test.APITestCase):
+    def setUp(self):
+        super(DomainNameTests, self).setUp()
+        cache.clear()
+
+    def tearDown(self):
+        super(DomainNameTests, self).tearDown()
+        cache.clear()
+
+    @test.create_stubs({api.keystone: ('domain_get',)})
+    def test_domain_name(self):
+        domain = self.domains.first()
+        api.keystone.domain_get(IsA(http.HttpRequest), domain.id) \
+            .AndReturn(domain)
+        api.keystone.domain_get(IsA(http.HttpRequest), 'gone') \
+            .AndRaise(keystone_exceptions.NotFound)
+        self.mox.ReplayAll()
+
+        # The name is only retrieved once.
+        self.assertEqual(domain.name,
+                         api.keystone.domain_name(self.request, domain.id))
+        self.assertEqual(domain.name,
+                         api.keystone.domain_name(self.request, domain.id))
+        self.assertIsNone(api.keystone.domain_name(self.request, 'gone'))
+
+    @test.create_stubs({api.keystone: ('domain_list', '_policy_check')})
+    def test_domain_lookup(self):
+        domains = self.domains.list()
+        api.keystone._policy_check(IsA(http.HttpRequest),
+                                   "identity:list_domains") \
+            .MultipleTimes().AndReturn(True)
+        api.keystone.domain_list(IsA(http.HttpRequest)).AndReturn(domains)
+        self.mox.ReplayAll()
+
+        expected = dict((d.id, d.name) for d in domains)
+        self.assertEqual(expected, api.keystone.domain_lookup(self.request))
+        self.assertEqual(expected, api.keystone.domain_lookup(self.request))
+        # The listing also provides the names of the domains.
+        self.assertEqual(domains[0].name,
+                         api.keystone.domain_name(self.request,
+                                                  domains[0].id))
+
+    @test.create_stubs({api.keystone: ('domain_list', 'domain_get',
+                                       '_policy_check')})
+    def test_domain_names_forgotten_on_update(self):
+        domain = self.domains.first()
+        api.keystone._policy_check(IsA(http.HttpRequest),
+                                   "identity:list_domains") \
+            .MultipleTimes().AndReturn(True)
+        api.keystone.domain_list(IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn([domain])
+        keystoneclient = self.stub_keystoneclient()
+        keystoneclient.domains = self.mox.CreateMockAnything()
+        keystoneclient.domains.update(domain.id, name='renamed',
+                                      description=None, enabled=None) \
+            .AndReturn(domain)
+        self.mox.ReplayAll()
+
+        api.keystone.domain_lookup(self.request)
+        api.keystone.domain_update(self.request, domain.id, name='renamed')
+        self.assertIsNone(
+            cache.get(api.keystone._domain_names_key(self.request)))
+        api.keystone.domain_lookup(self.request)
+
+    def test_policy_check_memoized(self):
+        with mock.patch('openstack_dashboard.policy.check') as check:
+            check.return_value = True
+            self.assertTrue(api.keystone._policy_check(self.request,
+                                                       "admin_required"))
+            self.assertTrue(api.keystone._policy_check(self.request,
+                                                       "admin_required"))
+        self.assertEqual(1, check.call_count)
+
+
+class UserProjectTests(test.APITestCase):
+    def setUp(self):
+        super(UserProjectTests, self).setUp()
+        self.request.user = mock.Mock(authorized_tenants=self.tenants.list())
+
+    def test_user_project_list(self):
+        projects = api.keystone.user_project_list(self.request)
+        names = [project.name for project in projects]
+        self.assertEqual(sorted(names, key=lambda name: name.lower()), names)
+        self.assertTrue(all(project.enabled for project in projects))
+        self.assertEqual(len([t for t in self.tenants.list() if t.enabled]),
+                         len(projects))
+
+    def test_user_project_list_anonymous(self):
+        self.request.user.is_authenticated.return_value = False
+        self.assertEqual([], api.keystone.user_project_list(self.request))
+
+    def test_user_project_search(self):
+        projects, has_more = api.keystone.user_project_search(
+            self.request, 'TEST_')
+        self.assertEqual(['test_tenant'],
+                         [project.name for project in projects])
+        self.assertFalse(has_more)
+
+    def test_user_project_search_pages(self):
+        projects = api.keystone.user_project_list(self.request)
+        first, has_more = api.keystone.user_project_search(
+            self.request, page=1, page_size=1)
+        self.assertEqual(projects[:1], first)
+        self.assertTrue(has_more)
+        last, has_more = api.keystone.user_project_search(
+            self.request, page=len(projects), page_size=1)
+        self.assertEqual(projects[-1:], last)
+        self.assertFalse(has_more)
+
+
 class ServiceAPITests(test.APITestCase):
     def test_service_wrapper(self):
         catalog = self.service_catalog
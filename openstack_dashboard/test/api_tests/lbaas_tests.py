@@ -12,6 +12,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from mox3.mox import IsA  # noqa
+import six
+
+from horizon import messages
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
@@ -87,17 +91,18 @@ class LbaasApiTests(test.APITestCase):
             self.assertIsInstance(v, api.lbaas.Vip)
             self.assertTrue(v.id)
 
-    @test.create_stubs({neutronclient: ('show_vip', 'show_pool'),
-                        api.neutron: ('subnet_get', 'port_get')})
+    @test.create_stubs({neutronclient: ('show_vip', 'list_pools'),
+                        api.neutron: ('subnet_list', 'port_list')})
     def test_vip_get(self):
         vip = self.api_vips.first()
         neutronclient.show_vip(vip['id']).AndReturn({'vip': vip})
-        api.neutron.subnet_get(self.request, vip['subnet_id']
-                               ).AndReturn(self.subnets.first())
-        api.neutron.port_get(self.request, vip['port_id']
-                             ).AndReturn(self.ports.first())
-        neutronclient.show_pool(vip['pool_id']
-                                ).AndReturn({'pool': self.api_pools.first()})
+        api.neutron.subnet_list(self.request, id=[vip['subnet_id']]
+                                ).AndReturn([self.subnets.first()])
+        api.neutron.port_list(self.request, id=[vip['port_id']]
+                              ).AndReturn([self.ports.first()])
+        pool = self.api_pools.list()[1]
+        neutronclient.list_pools(id=[vip['pool_id']]
+                                 ).AndReturn({'pools': [pool]})
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.vip_get(self.request, vip['id'])
@@ -107,7 +112,7 @@ class LbaasApiTests(test.APITestCase):
         self.assertIsInstance(ret_val.port, api.neutron.Port)
         self.assertEqual(vip['port_id'], ret_val.port.id)
         self.assertIsInstance(ret_val.pool, api.lbaas.Pool)
-        self.assertEqual(self.api_pools.first()['id'], ret_val.pool.id)
+        self.assertEqual(vip['pool_id'], ret_val.pool.id)
 
     @test.create_stubs({neutronclient: ('update_vip',)})
     def test_vip_update(self):
@@ -170,53 +175,116 @@ class LbaasApiTests(test.APITestCase):
                         api.neutron: ('subnet_list',)})
     def test_pool_list(self):
         pools = {'pools': self.api_pools.list()}
-        subnets = self.subnets.list()
-        vips = {'vips': self.api_vips.list()}
+        subnet_ids = [self.subnets.first().id,
+                      self.subnets.get(name='v6_subnet1').id]
+        subnets = [s for s in self.subnets.list() if s.id in subnet_ids]
+        vip_ids = [p['vip_id'] for p in self.api_pools.list()]
+        vips = {'vips': [v for v in self.api_vips.list()
+                         if v['id'] in vip_ids]}
 
         neutronclient.list_pools().AndReturn(pools)
-        api.neutron.subnet_list(self.request).AndReturn(subnets)
-        neutronclient.list_vips().AndReturn(vips)
+        api.neutron.subnet_list(self.request, id=subnet_ids
+                                ).AndReturn(subnets)
+        neutronclient.list_vips(id=vip_ids).AndReturn(vips)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.pool_list(self.request)
         for v in ret_val:
             self.assertIsInstance(v, api.lbaas.Pool)
             self.assertTrue(v.id)
+        self.assertEqual(self.subnets.first().id, ret_val[0].subnet.id)
+        self.assertEqual(vip_ids[0], ret_val[0].vip.id)
+
+    def _stub_pool_get(self, pool_dict, subnet, vip_dict, monitors):
+        neutronclient.show_pool(pool_dict['id']).AndReturn(
+            {'pool': dict(pool_dict)})
+        api.neutron.subnet_list(self.request, id=[subnet.id]
+                                ).AndReturn([subnet])
+        neutronclient.list_vips(id=[pool_dict['vip_id']]).AndReturn(
+            {'vips': [vip_dict]})
+        neutronclient.list_members(pool_id=pool_dict['id']).AndReturn(
+            {'members': self.api_members.list()})
+        neutronclient.list_health_monitors(
+            id=[m['id'] for m in monitors]).AndReturn(
+            {'health_monitors': monitors})
 
-    @test.create_stubs({neutronclient: ('show_pool', 'show_vip',
+    @test.create_stubs({neutronclient: ('show_pool', 'list_vips',
                                         'list_members',
-                                        'show_health_monitor',),
-                        api.neutron: ('subnet_get',)})
+                                        'list_health_monitors',),
+                        api.neutron: ('subnet_list',)})
     def test_pool_get(self):
-        pool = self.pools.first()
         subnet = self.subnets.first()
-        pool_dict = {'pool': self.api_pools.first()}
-        vip_dict = {'vip': self.api_vips.first()}
-
-        neutronclient.show_pool(pool.id).AndReturn(pool_dict)
-        api.neutron.subnet_get(self.request, subnet.id).AndReturn(subnet)
-        neutronclient.show_vip(pool.vip_id).AndReturn(vip_dict)
-        neutronclient.list_members(pool_id=pool.id).AndReturn(
-            {'members': self.api_members.list()})
-        monitor = self.api_monitors.first()
-        for pool_mon in pool.health_monitors:
-            neutronclient.show_health_monitor(pool_mon).AndReturn(
-                {'health_monitor': monitor})
+        monitors = self.api_monitors.list()
+        pool_dict = dict(self.api_pools.first(),
+                         health_monitors=[m['id'] for m in monitors])
+        vip_dict = self.api_vips.first()
+        self._stub_pool_get(pool_dict, subnet, vip_dict, monitors)
         self.mox.ReplayAll()
 
-        ret_val = api.lbaas.pool_get(self.request, pool.id)
+        ret_val = api.lbaas.pool_get(self.request, pool_dict['id'])
         self.assertIsInstance(ret_val, api.lbaas.Pool)
         self.assertIsInstance(ret_val.vip, api.lbaas.Vip)
-        self.assertEqual(ret_val.vip.id, vip_dict['vip']['id'])
+        self.assertEqual(ret_val.vip.id, vip_dict['id'])
         self.assertIsInstance(ret_val.subnet, api.neutron.Subnet)
         self.assertEqual(ret_val.subnet.id, subnet.id)
         self.assertEqual(3, len(ret_val.members))
         self.assertIsInstance(ret_val.members[0], api.lbaas.Member)
-        self.assertEqual(len(pool.health_monitors),
-                         len(ret_val.health_monitors))
+        self.assertEqual(len(monitors), len(ret_val.health_monitors))
         self.assertIsInstance(ret_val.health_monitors[0],
                               api.lbaas.PoolMonitor)
 
+    @test.create_stubs({neutronclient: ('show_pool', 'list_vips',
+                                        'list_members',
+                                        'list_health_monitors',),
+                        api.neutron: ('subnet_list',)})
+    def test_pool_get_expansion_memoized(self):
+        subnet = self.subnets.first()
+        monitors = self.api_monitors.list()[:1]
+        pool_dict = dict(self.api_pools.first(),
+                         health_monitors=[m['id'] for m in monitors])
+        vip_dict = self.api_vips.first()
+        self._stub_pool_get(pool_dict, subnet, vip_dict, monitors)
+        # The referenced resources are only resolved once per request.
+        neutronclient.show_pool(pool_dict['id']).AndReturn(
+            {'pool': dict(pool_dict)})
+        neutronclient.list_members(pool_id=pool_dict['id']).AndReturn(
+            {'members': self.api_members.list()})
+        self.mox.ReplayAll()
+
+        first = api.lbaas.pool_get(self.request, pool_dict['id'])
+        second = api.lbaas.pool_get(self.request, pool_dict['id'])
+        self.assertEqual(first.subnet.id, second.subnet.id)
+        self.assertEqual(first.vip.id, second.vip.id)
+        self.assertEqual(1, len(second.health_monitors))
+
+    @test.create_stubs({neutronclient: ('show_pool', 'list_vips',
+                                        'list_members',
+                                        'list_health_monitors',),
+                        api.neutron: ('subnet_list',),
+                        messages: ('warning',)})
+    def test_pool_get_missing_monitor(self):
+        subnet = self.subnets.first()
+        monitors = self.api_monitors.list()
+        pool_dict = dict(self.api_pools.first(),
+                         health_monitors=[m['id'] for m in monitors])
+        neutronclient.show_pool(pool_dict['id']).AndReturn(
+            {'pool': dict(pool_dict)})
+        api.neutron.subnet_list(self.request, id=[subnet.id]
+                                ).AndReturn([subnet])
+        neutronclient.list_vips(id=[pool_dict['vip_id']]).AndReturn(
+            {'vips': [self.api_vips.first()]})
+        neutronclient.list_members(pool_id=pool_dict['id']).AndReturn(
+            {'members': self.api_members.list()})
+        neutronclient.list_health_monitors(
+            id=[m['id'] for m in monitors]).AndReturn(
+            {'health_monitors': monitors[1:]})
+        messages.warning(self.request, IsA(six.text_type))
+        self.mox.ReplayAll()
+
+        ret_val = api.lbaas.pool_get(self.request, pool_dict['id'])
+        self.assertEqual([m['id'] for m in monitors[1:]],
+                         [m.id for m in ret_val.health_monitors])
+
     @test.create_stubs({neutronclient: ('update_pool',)})
     def test_pool_update(self):
         form_data = {'name': 'pool1name',
@@ -293,14 +361,16 @@ class LbaasApiTests(test.APITestCase):
         monitor = self.api_monitors.first()
         neutronclient.show_health_monitor(
             monitor['id']).AndReturn({'health_monitor': monitor})
-        neutronclient.list_pools(id=[p['pool_id'] for p in monitor['pools']]
-                                 ).AndReturn({'pools': self.api_pools.list()})
+        pool_ids = [p['pool_id'] for p in monitor['pools']]
+        neutronclient.list_pools(id=pool_ids).AndReturn(
+            {'pools': [p for p in self.api_pools.list()
+                       if p['id'] in pool_ids]})
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.pool_health_monitor_get(
             self.request, monitor['id'])
         self.assertIsInstance(ret_val, api.lbaas.PoolMonitor)
-        self.assertEqual(3, len(ret_val.pools))
+        self.assertEqual(len(pool_ids), len(ret_val.pools))
         self.assertIsInstance(ret_val.pools[0], api.lbaas.Pool)
 
     @test.create_stubs({neutronclient: ('create_member', )})
@@ -329,25 +399,30 @@ class LbaasApiTests(test.APITestCase):
     @test.create_stubs({neutronclient: ('list_members', 'list_pools')})
     def test_member_list(self):
         members = {'members': self.api_members.list()}
-        pools = {'pools': self.api_pools.list()}
+        # Each referenced pool is looked up once.
+        pool_ids = [self.api_pools.list()[1]['id'],
+                    self.api_pools.list()[2]['id']]
+        pools = {'pools': [p for p in self.api_pools.list()
+                           if p['id'] in pool_ids]}
 
         neutronclient.list_members().AndReturn(members)
-        neutronclient.list_pools().AndReturn(pools)
+        neutronclient.list_pools(id=pool_ids).AndReturn(pools)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.member_list(self.request)
         for v in ret_val:
             self.assertIsInstance(v, api.lbaas.Member)
             self.assertTrue(v.id)
+            self.assertTrue(v.pool_name)
 
-    @test.create_stubs({neutronclient: ('show_member', 'show_pool')})
+    @test.create_stubs({neutronclient: ('show_member', 'list_pools')})
     def test_member_get(self):
         member = self.members.first()
         member_dict = {'member': self.api_members.first()}
-        pool_dict = {'pool': self.api_pools.first()}
+        pool_dict = {'pools': [self.api_pools.list()[1]]}
 
         neutronclient.show_member(member.id).AndReturn(member_dict)
-        neutronclient.show_pool(member.pool_id).AndReturn(pool_dict)
+        neutronclient.list_pools(id=[member.pool_id]).AndReturn(pool_dict)
         self.mox.ReplayAll()
 
         ret_val = api.lbaas.member_get(self.request, member.id)
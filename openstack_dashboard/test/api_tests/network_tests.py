@@ -278,18 +278,22 @@ class NetworkApiNeutronTests(NetworkApiNeutronTestBase):
         server_networks = [net for net in self.api_networks.list()
                            if net['id'] in server_network_ids]
 
-        self.qclient.list_ports(device_id=server_ids) \
+        resolver = api.neutron.ServerAddressResolver
+        self.qclient.list_ports(device_id=server_ids,
+                                fields=resolver.port_fields) \
             .AndReturn({'ports': server_ports})
         if router_enabled:
             self.qclient.list_floatingips(tenant_id=tenant_id,
-                                          port_id=server_port_ids) \
+                                          port_id=server_port_ids,
+                                          fields=resolver.floating_ip_fields) \
+                .InAnyOrder() \
                 .AndReturn({'floatingips': assoc_fips})
-            self.qclient.list_ports(tenant_id=tenant_id) \
-                .AndReturn({'ports': self.api_ports.list()})
-        self.qclient.list_networks(id=set(server_network_ids)) \
+        server_network_ids = list(
+            collections.OrderedDict.fromkeys(server_network_ids))
+        self.qclient.list_networks(id=server_network_ids,
+                                   fields=resolver.network_fields) \
+            .InAnyOrder() \
             .AndReturn({'networks': server_networks})
-        self.qclient.list_subnets() \
-            .AndReturn({'subnets': self.api_subnets.list()})
         self.mox.ReplayAll()
 
         api.network.servers_update_addresses(self.request, servers)
@@ -697,7 +701,7 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
             'enable_fip_topology_check': True,
         }
     )
-    def test_floating_ip_target_list(self):
+    def _stub_target_list(self):
         ports = self.api_ports.list()
         # Port on the first subnet is connected to a router
         # attached to external network in neutron_data.
@@ -710,28 +714,41 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
                 (subnet_id in self._subs_from_port(p) or
                  (set(shared_subnet_ids) & set(self._subs_from_port(p)))))
         ]
-        filters = {'tenant_id': self.request.user.tenant_id}
-        self.qclient.list_ports(**filters).AndReturn({'ports': ports})
+        filters = {'tenant_id': self.request.user.tenant_id,
+                   'fields': ['id', 'device_id', 'device_owner',
+                              'fixed_ips']}
+        self.qclient.list_ports(**filters).InAnyOrder() \
+            .AndReturn({'ports': ports})
         servers = self.servers.list()
         novaclient = self.stub_novaclient()
         novaclient.servers = self.mox.CreateMockAnything()
         search_opts = {'project_id': self.request.user.tenant_id}
-        novaclient.servers.list(True, search_opts).AndReturn(servers)
+        novaclient.servers.list(False, search_opts).InAnyOrder() \
+            .AndReturn(servers)
 
-        search_opts = {'router:external': True}
+        search_opts = {'router:external': True, 'fields': ['id']}
         ext_nets = [n for n in self.api_networks.list()
                     if n['router:external']]
-        self.qclient.list_networks(**search_opts) \
+        self.qclient.list_networks(**search_opts).InAnyOrder() \
             .AndReturn({'networks': ext_nets})
-        self.qclient.list_routers().AndReturn({'routers':
-                                               self.api_routers.list()})
-        self.qclient.list_networks(shared=True).AndReturn({'networks':
-                                                           shared_nets})
-        shared_subs = [s for s in self.api_subnets.list()
-                       if s['id'] in shared_subnet_ids]
-        self.qclient.list_subnets().AndReturn({'subnets': shared_subs})
-        self.qclient.list_vips().AndReturn({'vips': self.vips.list()})
+        self.qclient.list_routers(fields=['id', 'external_gateway_info']) \
+            .InAnyOrder() \
+            .AndReturn({'routers': self.api_routers.list()})
+        self.qclient.list_networks(shared=True, fields=['subnets']) \
+            .InAnyOrder() \
+            .AndReturn({'networks': shared_nets})
+        self.qclient.list_vips(fields=['port_id', 'name']).InAnyOrder() \
+            .AndReturn({'vips': self.vips.list()})
+        return target_ports
 
+    @override_settings(
+        OPENSTACK_NEUTRON_NETWORK={
+            'enable_lb': True,
+            'enable_fip_topology_check': True,
+        }
+    )
+    def test_floating_ip_target_list(self):
+        target_ports = self._stub_target_list()
         self.mox.ReplayAll()
 
         rets = api.network.floating_ip_target_list(self.request)
@@ -740,10 +757,39 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
             self.assertEqual(exp[0], ret.id)
             self.assertEqual(exp[1], ret.name)
 
+        # The targets are cached for the instance actions.
+        cached = api.network.floating_ip_target_list(self.request)
+        self.assertEqual([ret.id for ret in rets],
+                         [ret.id for ret in cached])
+        instance_id = rets[0].instance_id
+        ret = api.network.floating_ip_target_get_by_instance(self.request,
+                                                             instance_id)
+        self.assertEqual(rets[0].id, ret)
+
+    @override_settings(
+        OPENSTACK_NEUTRON_NETWORK={
+            'enable_lb': True,
+            'enable_fip_topology_check': True,
+        }
+    )
+    def test_floating_ip_target_list_forgotten_on_associate(self):
+        fip = self.api_q_floating_ips.list()[1]
+        assoc_port = self.api_ports.list()[1]
+        ip_address = assoc_port['fixed_ips'][0]['ip_address']
+        target_id = '%s_%s' % (assoc_port['id'], ip_address)
+        self._stub_target_list()
+        self.qclient.update_floatingip(fip['id'], IsA(dict))
+        self._stub_target_list()
+        self.mox.ReplayAll()
+
+        api.network.floating_ip_target_list(self.request)
+        api.network.floating_ip_associate(self.request, fip['id'], target_id)
+        api.network.floating_ip_target_list(self.request)
+
     def test_floating_ip_target_get_by_instance(self):
         ports = self.api_ports.list()
         candidates = [p for p in ports if p['device_id'] == '1']
-        search_opts = {'device_id': '1'}
+        search_opts = {'device_id': '1', 'fields': ['id', 'fixed_ips']}
         self.qclient.list_ports(**search_opts).AndReturn({'ports': candidates})
         self.mox.ReplayAll()
 
@@ -753,7 +799,7 @@ class NetworkApiNeutronFloatingIpTests(NetworkApiNeutronTestBase):
     def test_target_floating_ip_port_by_instance(self):
         ports = self.api_ports.list()
         candidates = [p for p in ports if p['device_id'] == '1']
-        search_opts = {'device_id': '1'}
+        search_opts = {'device_id': '1', 'fields': ['id', 'fixed_ips']}
         self.qclient.list_ports(**search_opts).AndReturn({'ports': candidates})
         self.mox.ReplayAll()
 
@@ -15,6 +15,7 @@ import copy
 import uuid
 
 from mox3.mox import IsA  # noqa
+import netaddr
 
 from django import http
 from django.test.utils import override_settings
@@ -595,32 +596,88 @@ class NeutronApiTests(test.APITestCase):
     def test_get_router_ha_permission_without_l3_ha_extension(self):
         self._test_get_router_ha_permission_with_policy_check(False)
 
+    def _max_uri_length(self, values_length):
+        # The URI length which leaves values_length characters for the
+        # filter values, next to the endpoint and the resource path.
+        endpoint = api.base.url_for(self.request, 'network')
+        return len(endpoint) + api.neutron.URI_PATH_LENGTH + values_length
+
+    def _get_ports(self, count):
+        return [{'id': str(uuid.uuid4()),
+                 'name': 'port%s' % i,
+                 'admin_state_up': True}
+                for i in range(count)]
+
     def test_list_resources_with_long_filters(self):
         # In this tests, port_list is called with id=[10 port ID]
         # filter. It generates about 40*10 char length URI.
         # Each port ID is converted to "id=<UUID>&" in URI and
         # it means 40 chars (len(UUID)=36).
-        # If excess length is 220, it means 400-220=180 chars
-        # can be sent in the first request.
-        # As a result three API calls with 4, 4, 2 port ID
-        # are expected.
-
-        ports = [{'id': str(uuid.uuid4()),
-                  'name': 'port%s' % i,
-                  'admin_state_up': True}
-                 for i in range(10)]
+        # If 180 chars are left for the filter values, three API calls
+        # with 4, 4, 2 port ID are expected, without a first call
+        # with all of them.
+        ports = self._get_ports(10)
         port_ids = [port['id'] for port in ports]
 
         neutronclient = self.stub_neutronclient()
-        uri_len_exc = neutron_exc.RequestURITooLong(excess=220)
-        neutronclient.list_ports(id=port_ids).AndRaise(uri_len_exc)
         for i in range(0, 10, 4):
-            neutronclient.list_ports(id=port_ids[i:i + 4]) \
+            neutronclient.list_ports(id=port_ids[i:i + 4]).InAnyOrder() \
                 .AndReturn({'ports': ports[i:i + 4]})
         self.mox.ReplayAll()
 
+        network_config = {'max_uri_length': self._max_uri_length(180)}
+        with self.settings(OPENSTACK_NEUTRON_NETWORK=network_config):
+            ret_val = api.neutron.list_resources_with_long_filters(
+                api.neutron.port_list, 'id', port_ids,
+                request=self.request)
+        self.assertEqual(10, len(ret_val))
+        self.assertEqual(port_ids, [p.id for p in ret_val])
+
+    def test_list_resources_with_long_filters_duplicates(self):
+        ports = self._get_ports(2)
+        port_ids = [port['id'] for port in ports]
+
+        neutronclient = self.stub_neutronclient()
+        neutronclient.list_ports(id=port_ids).AndReturn({'ports': ports})
+        self.mox.ReplayAll()
+
         ret_val = api.neutron.list_resources_with_long_filters(
-            api.neutron.port_list, 'id', port_ids,
+            api.neutron.port_list, 'id', port_ids + port_ids[::-1],
             request=self.request)
-        self.assertEqual(10, len(ret_val))
         self.assertEqual(port_ids, [p.id for p in ret_val])
+
+    def test_list_resources_with_long_filters_learns_limit(self):
+        # If excess length is 220, it means 400-220=180 chars
+        # can be sent in a request. The limit is kept for the following
+        # requests to the same endpoint.
+        self.addCleanup(api.neutron._uri_limits.clear)
+        ports = self._get_ports(10)
+        port_ids = [port['id'] for port in ports]
+
+        neutronclient = self.stub_neutronclient()
+        uri_len_exc = neutron_exc.RequestURITooLong(excess=220)
+        neutronclient.list_ports(id=port_ids).AndRaise(uri_len_exc)
+        for _i in range(2):
+            for i in range(0, 10, 4):
+                neutronclient.list_ports(id=port_ids[i:i + 4]) \
+                    .InAnyOrder() \
+                    .AndReturn({'ports': ports[i:i + 4]})
+        self.mox.ReplayAll()
+
+        for _i in range(2):
+            ret_val = api.neutron.list_resources_with_long_filters(
+                api.neutron.port_list, 'id', port_ids,
+                request=self.request)
+            self.assertEqual(port_ids, [p.id for p in ret_val])
+        endpoint = api.base.url_for(self.request, 'network')
+        self.assertEqual(self._max_uri_length(180),
+                         api.neutron._uri_limits[endpoint])
+
+    def test_get_ip_version(self):
+        api.neutron._ip_versions.clear()
+        self.assertEqual(4, api.neutron.get_ip_version('10.0.0.1'))
+        self.assertEqual(6, api.neutron.get_ip_version('2001:db8::1'))
+        self.assertEqual({'10.0.0.1': 4, '2001:db8::1': 6},
+                         api.neutron._ip_versions)
+        self.assertRaises(netaddr.AddrFormatError,
+                          api.neutron.get_ip_version, 'not-an-ip')
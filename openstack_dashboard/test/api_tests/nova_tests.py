@@ -20,11 +20,13 @@
 from __future__ import absolute_import
 
 from django.conf import settings
+from django.core.cache import cache
 from django import http
 from django.test.utils import override_settings
 
 from mox3.mox import IsA  # noqa
 from novaclient import exceptions as nova_exceptions
+from novaclient.v2 import aggregates
 from novaclient.v2 import flavor_access as nova_flavor_access
 from novaclient.v2 import servers
 import six
@@ -600,3 +602,61 @@ class ComputeApiTests(test.APITestCase):
         ret_val = api.nova.server_group_list(self.request)
         self.assertIsInstance(ret_val, list)
         self.assertEqual(len(ret_val), len(server_groups))
+
+    def test_aggregate_details_list_uses_list_response(self):
+        aggregates = self.aggregates.list()
+
+        novaclient = self.stub_novaclient()
+        novaclient.aggregates = self.mox.CreateMockAnything()
+        novaclient.aggregates.list().AndReturn(aggregates)
+        self.mox.ReplayAll()
+
+        ret_val = api.nova.aggregate_details_list(self.request)
+        self.assertEqual(aggregates, ret_val)
+
+    def test_aggregate_details_list_fetches_missing_details(self):
+        aggregate = self.aggregates.first()
+        summary = aggregates.Aggregate(aggregates.AggregateManager(None),
+                                       {'id': aggregate.id,
+                                        'name': aggregate.name})
+
+        novaclient = self.stub_novaclient()
+        novaclient.aggregates = self.mox.CreateMockAnything()
+        novaclient.aggregates.list().AndReturn([summary])
+        novaclient.aggregates.get_details(aggregate.id).AndReturn(aggregate)
+        self.mox.ReplayAll()
+
+        ret_val = api.nova.aggregate_details_list(self.request)
+        self.assertEqual([aggregate], ret_val)
+
+    def test_aggregate_host_index(self):
+        cache.clear()
+        novaclient = self.stub_novaclient()
+        novaclient.aggregates = self.mox.CreateMockAnything()
+        novaclient.aggregates.list().AndReturn(self.aggregates.list())
+        self.mox.ReplayAll()
+
+        index = api.nova.aggregate_host_index(self.request)
+        self.assertEqual({'aggregates': ['bar', 'foo'],
+                          'availability_zone': 'testing'}, index['foo'])
+        self.assertEqual(set(['foo', 'bar']), set(index))
+        self.assertEqual(index, cache.get(
+            api.nova._aggregate_host_index_key(self.request)))
+        cache.clear()
+
+    def test_aggregate_host_index_invalidated_after_change(self):
+        key = api.nova._aggregate_host_index_key(self.request)
+
+        def rebuild(*args):
+            # A concurrent request rebuilds the index before the host
+            # was added.
+            cache.set(key, {'stale': {}})
+
+        novaclient = self.stub_novaclient()
+        novaclient.aggregates = self.mox.CreateMockAnything()
+        novaclient.aggregates.add_host('1', 'host') \
+            .WithSideEffects(rebuild).AndReturn(self.aggregates.first())
+        self.mox.ReplayAll()
+
+        api.nova.add_host_to_aggregate(self.request, '1', 'host')
+        self.assertIsNone(cache.get(key))
@@ -0,0 +1,143 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+from django import http
+from django.test.utils import override_settings
+import mock
+from openstack_auth import utils
+import requests
+
+from horizon.utils import parallel
+
+from openstack_dashboard.api import tracing
+from openstack_dashboard.test import helpers as test
+
+
+SERVER_ID = '8c3af2f0-d0b5-4a43-a5f0-7e4d3e0e5d4a'
+
+
+def _send(adapter, request, **kwargs):
+    response = requests.Response()
+    response.status_code = 404 if 'missing' in request.url else 200
+    response._content = b'{"server": {}}'
+    return response
+
+
+class TracingTests(test.TestCase):
+
+    def setUp(self):
+        super(TracingTests, self).setUp()
+        mock.patch.object(tracing, '_original_send', _send).start()
+        self.addCleanup(tracing.reset)
+        self.request.user = utils.get_user(self.request)
+        self.middleware = tracing.TracingMiddleware.__new__(
+            tracing.TracingMiddleware)
+
+    def call(self, url, method='GET', body=None):
+        request = requests.Request(method, url, data=body).prepare()
+        return tracing._traced_send(None, request)
+
+    def test_url_template(self):
+        self.assertEqual(
+            '/v2/{id}/servers/{id}/os-interface',
+            tracing.url_template('http://nova:8774/v2/%s/servers/%s/'
+                                 'os-interface' % ('a' * 32, SERVER_ID)))
+        self.assertEqual('/v2.0/ports.json?device_id&fields',
+                         tracing.url_template(
+                             'http://neutron/v2.0/ports.json?fields=id&'
+                             'device_id=1&fields=name&device_id=2'))
+        self.assertEqual('/v2/servers/detail',
+                         tracing.url_template('http://nova/v2/servers/detail'))
+
+    def test_not_traced_outside_request(self):
+        self.call('http://public.nova.example.com:8774/v2/servers')
+        self.assertIsNone(tracing.current())
+        self.assertEqual([], tracing.totals()['calls'])
+
+    def test_records_calls(self):
+        self.middleware.process_request(self.request)
+        self.call('http://public.nova.example.com:8774/v2/servers/%s'
+                  % SERVER_ID)
+        self.call('http://public.nova.example.com:8776/v2/missing')
+        trace = tracing.current()
+
+        self.assertEqual(2, len(trace.calls))
+        call = trace.calls[0]
+        self.assertEqual(('GET', '/v2/servers/{id}', 200, 14),
+                         (call.method, call.template, call.status,
+                          call.size))
+        self.assertEqual(404, trace.calls[1].status)
+
+    def test_records_calls_of_parallel_workers(self):
+        self.middleware.process_request(self.request)
+        url = 'http://public.nova.example.com:8774/v2/servers/%d'
+        parallel.run_parallel([lambda i=i: self.call(url % i)
+                               for i in range(4)], max_workers=4)
+        self.assertEqual(4, len(tracing.current().calls))
+
+    @override_settings(API_TRACE_FANOUT_THRESHOLD=3)
+    def test_summary(self):
+        self.middleware.process_request(self.request)
+        nova = 'http://public.nova.example.com:8774/v2'
+        for server in range(3):
+            self.call('%s/servers/%d' % (nova, server))
+        self.call('%s/flavors/detail' % nova)
+        self.call('%s/flavors/detail' % nova)
+        self.call('%s/servers/action' % nova, 'POST', '{"a": 1}')
+        self.call('%s/servers/action' % nova, 'POST', '{"a": 2}')
+        self.call('http://public.nova.example.com:8776/v2/missing')
+        self.call('http://unknown.example.com/ping')
+
+        with mock.patch.object(tracing.LOG, 'log') as log:
+            response = self.middleware.process_response(
+                self.request, http.HttpResponse())
+        self.assertIsNone(tracing.current())
+
+        level, line = log.call_args[0]
+        summary = json.loads(line)
+        self.assertEqual(tracing.logging.WARNING, level)
+        self.assertEqual(9, summary['calls'])
+        self.assertEqual(
+            {'compute': 7, 'volumev2': 1, 'unknown.example.com': 1},
+            dict((service, totals['calls'])
+                 for service, totals in summary['services'].items()))
+        self.assertEqual([{'call': 'GET %s/flavors/detail' % nova,
+                           'count': 2}], summary['repeated'])
+        self.assertEqual([{'call': 'GET /v2/servers/{id}', 'count': 3}],
+                         summary['fanout'])
+        self.assertEqual([{'call': 'GET /v2/missing', 'status': 404}],
+                         summary['errors'])
+        self.assertTrue(response['Server-Timing'].startswith(
+            'api;desc="9 calls";dur='))
+        self.assertIn('compute;desc="7 calls";dur=',
+                      response['Server-Timing'])
+
+    @override_settings(API_TRACE_SERVER_TIMING=False,
+                       API_TRACE_DUMP_INTERVAL=2)
+    def test_totals(self):
+        url = 'http://public.nova.example.com:8774/v2/servers/%d'
+        with mock.patch.object(tracing.LOG, 'info') as info:
+            for server in range(2):
+                self.middleware.process_request(self.request)
+                self.call(url % server)
+                response = self.middleware.process_response(
+                    self.request, http.HttpResponse())
+                self.assertNotIn('Server-Timing', response)
+
+        totals = tracing.totals()
+        self.assertEqual(2, totals['requests'])
+        self.assertEqual([('compute GET /v2/servers/{id}', 2, 0, 28)],
+                         [(call['call'], call['count'], call['errors'],
+                           call['bytes']) for call in totals['calls']])
+        self.assertEqual(totals, json.loads(info.call_args[0][0]))
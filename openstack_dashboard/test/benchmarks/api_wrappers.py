@@ -0,0 +1,133 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Memory and attribute access benchmark for the API resource wrappers.
+
+Compares the ``__getattribute__`` based wrappers Horizon used to ship with
+the slotted wrappers of :mod:`openstack_dashboard.api.base`, in both the
+regular and the compact mode. Run it with::
+
+    python -m openstack_dashboard.test.benchmarks.api_wrappers [count]
+"""
+
+from __future__ import print_function
+
+import copy
+import gc
+import os
+import sys
+import timeit
+import types
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE',
+                      'openstack_dashboard.test.settings')
+
+import django  # noqa
+
+django.setup()
+
+from novaclient.v2 import servers  # noqa
+
+from openstack_dashboard.api import base  # noqa
+from openstack_dashboard.api import nova  # noqa
+from openstack_dashboard.test.test_data import utils  # noqa
+
+
+class LegacyResourceWrapper(object):
+    """The wrapper implementation used before slotted wrappers."""
+    _attrs = []
+    _apiresource = None
+
+    def __init__(self, apiresource):
+        self._apiresource = apiresource
+
+    def __getattribute__(self, attr):
+        try:
+            return object.__getattribute__(self, attr)
+        except AttributeError:
+            if attr not in self._attrs:
+                raise
+            return getattr(self._apiresource, attr)
+
+
+class LegacyServer(LegacyResourceWrapper):
+    _attrs = nova.Server._attrs
+
+    def __init__(self, apiresource, request):
+        super(LegacyServer, self).__init__(apiresource)
+        self.request = request
+
+    @property
+    def availability_zone(self):
+        return getattr(self, 'OS-EXT-AZ:availability_zone', "")
+
+
+def deep_size(objects):
+    """Approximate number of bytes retained by ``objects``."""
+    seen = set()
+    pending = list(objects)
+    total = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, (type, types.ModuleType)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        # Unlike touching __dict__, this does not create missing instance
+        # dictionaries of slotted objects.
+        pending.extend(gc.get_referents(obj))
+    return total
+
+
+def make_resources(count):
+    test_data = utils.load_test_data()
+    info = test_data.servers.first()._info
+    manager = servers.ServerManager(None)
+    resources = []
+    for index in range(count):
+        server_info = copy.deepcopy(info)
+        server_info['id'] = 'server-%d' % index
+        server_info['name'] = 'server-%d' % index
+        resources.append(servers.Server(manager, server_info, loaded=True))
+    return resources
+
+
+def access(wrappers):
+    for wrapper in wrappers:
+        wrapper.id
+        wrapper.name
+        wrapper.status
+        wrapper.tenant_id
+        wrapper.availability_zone
+
+
+def run(count=1000, repeat=5):
+    resources = make_resources(count)
+    request = object()
+    variants = (
+        ('legacy', LegacyServer),
+        ('slotted', nova.Server),
+        ('compact', base.compact(nova.Server)),
+    )
+    print("%-10s %14s %18s" % ("wrapper", "retained KiB", "access ms/1000"))
+    for name, wrapper_class in variants:
+        wrappers = [wrapper_class(resource, request)
+                    for resource in resources]
+        size = deep_size(wrappers)
+        seconds = min(timeit.repeat(lambda: access(wrappers),
+                                    number=1, repeat=repeat))
+        print("%-10s %14.1f %18.2f" % (name, size / 1024.0,
+                                       seconds * 1000 * 1000 / count))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,592 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""In-process fake OpenStack cloud for benchmarks.
+
+:class:`FakeCloud` generates a scaled data set out of the resources of
+:mod:`openstack_dashboard.test.test_data` and serves it to the real API
+clients: while :meth:`FakeCloud.installed` is active, every HTTP request
+made through ``requests`` is answered by the fake Nova, Cinder, Glance,
+Neutron and Keystone APIs instead of going over the network. Calls are
+counted per API route and can be delayed to simulate a remote cloud.
+
+Only the calls the dashboard makes while rendering the benchmark
+scenarios are implemented; anything else is answered with a 404 and
+counted under ``unrouted``.
+"""
+
+import collections
+import contextlib
+import copy
+import io
+import json
+import re
+import threading
+import time
+
+import mock
+import requests
+from requests.packages import urllib3
+from requests import structures
+from six.moves.urllib import parse
+
+from openstack_dashboard.test.test_data import utils as test_utils
+
+
+SCALES = {
+    'servers': 10000,
+    'ports': 5000,
+    'projects': 20000,
+    'networks': 100,
+    'routers': 20,
+    'volumes': 5000,
+    'snapshots': 1000,
+    'images': 1000,
+    'flavors': 20,
+    'keypairs': 10,
+}
+
+# Services are told apart by the port of the fake service catalog.
+SERVICES = {
+    8774: 'compute',
+    8776: 'volume',
+    9292: 'image',
+    9696: 'network',
+    5000: 'identity',
+    35357: 'identity',
+}
+
+PROJECT_ID = '1'
+USER_ID = '1'
+
+
+def _uuid(kind, index):
+    return '%08x-0000-4000-8000-%012x' % (kind, index)
+
+
+class Collection(object):
+    """Resources of one type, with their JSON representation cached."""
+
+    def __init__(self, items=()):
+        self.items = []
+        self.by_id = {}
+        self._json = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        self.items.append(item)
+        self.by_id[item['id']] = item
+
+    def json(self, item):
+        text = self._json.get(item['id'])
+        if text is None:
+            text = self._json[item['id']] = json.dumps(item)
+        return text
+
+    def dumps(self, key, items, fields=None, extra=''):
+        if fields:
+            body = json.dumps([dict((f, item.get(f)) for f in fields)
+                               for item in items])
+        else:
+            body = '[%s]' % ','.join(self.json(item) for item in items)
+        return '{"%s":%s%s}' % (key, body, extra)
+
+
+class FakeCloud(object):
+    """A scaled, in-memory cloud answering the dashboard's API calls.
+
+    ``scale`` multiplies the default resource counts of :data:`SCALES`,
+    individual counts can be overridden with keyword arguments. A tenth
+    of the servers, ports, volumes and snapshots belongs to the project
+    of the benchmark user, the rest is spread over 99 other projects.
+    ``delay`` is the number of seconds every call takes.
+    """
+
+    def __init__(self, scale=1.0, delay=0, **counts):
+        self.delay = delay
+        self.counts = dict((name, max(1, int(count * scale)))
+                           for name, count in SCALES.items())
+        self.counts.update(counts)
+        self.calls = collections.Counter()
+        self.backend_time = 0.0
+        self._lock = threading.Lock()
+        self._fixtures = test_utils.load_test_data()
+        self._generate()
+        self.routes = [(service, method, re.compile('^%s$' % path), handler)
+                       for service, method, path, handler in self._routes()]
+
+    # Data set
+
+    def _owner(self, index):
+        others = min(99, len(self.projects.items) - 1)
+        if index % 10 == 0 or not others:
+            return PROJECT_ID
+        return self.projects.items[index % others + 1]['id']
+
+    def _generate(self):
+        fixtures = self._fixtures
+        counts = self.counts
+
+        domain = dict(fixtures.domains.first()._info)
+        self.domains = Collection([domain])
+        project = dict(fixtures.tenants.first()._info)
+        self.projects = Collection()
+        for index in range(counts['projects']):
+            item = dict(project, domain_id=domain['id'], parent_id=None,
+                        is_domain=False)
+            if index:
+                item['id'] = _uuid(1, index)
+                item['name'] = 'project-%05d' % index
+            else:
+                item['id'] = PROJECT_ID
+            self.projects.add(item)
+        self.member_projects = self.projects.items[:100]
+
+        flavor = fixtures.flavors.first()._info
+        self.flavors = Collection(
+            dict(copy.deepcopy(flavor), id=_uuid(2, index),
+                 name='flavor-%02d' % index, vcpus=index % 8 + 1,
+                 ram=512 * (index + 1), disk=10 * index)
+            for index in range(counts['flavors']))
+
+        image = fixtures.images.first()._info
+        self.images = Collection(
+            dict(copy.deepcopy(image), id=_uuid(3, index),
+                 name='image-%04d' % index, owner=self._owner(index),
+                 is_public=bool(index % 2))
+            for index in range(counts['images']))
+
+        network = fixtures.api_networks.first()
+        subnet = fixtures.api_subnets.first()
+        self.networks = Collection()
+        self.subnets = Collection()
+        for index in range(counts['networks']):
+            network_id, subnet_id = _uuid(4, index), _uuid(5, index)
+            tenant_id = self._owner(index)
+            cidr = '10.%d.%d.0/24' % (index // 256, index % 256)
+            self.networks.add(dict(network, id=network_id,
+                                   name='net-%03d' % index,
+                                   tenant_id=tenant_id, subnets=[subnet_id]))
+            self.subnets.add(dict(subnet, id=subnet_id, network_id=network_id,
+                                  name='subnet-%03d' % index,
+                                  tenant_id=tenant_id, cidr=cidr,
+                                  gateway_ip=cidr.replace('0/24', '1'),
+                                  allocation_pools=[]))
+
+        router = fixtures.api_routers.first()
+        self.routers = Collection(
+            dict(router, id=_uuid(6, index), name='router-%02d' % index,
+                 tenant_id=self._owner(index), external_gateway_info=None)
+            for index in range(counts['routers']))
+
+        server = fixtures.servers.first()._info
+        self.servers = Collection()
+        for index in range(counts['servers']):
+            item = copy.deepcopy(server)
+            item.update(id=_uuid(7, index), name='server-%05d' % index,
+                        tenant_id=self._owner(index), user_id=USER_ID,
+                        addresses={}, links=[],
+                        image={'id': self.images.items[
+                            index % len(self.images.items)]['id']},
+                        flavor={'id': self.flavors.items[
+                            index % len(self.flavors.items)]['id']})
+            self.servers.add(item)
+
+        port = fixtures.api_ports.first()
+        self.ports = Collection()
+        for index in range(counts['ports']):
+            server = self.servers.items[index % len(self.servers.items)]
+            networks = [n for n in self.networks.items
+                        if n['tenant_id'] == server['tenant_id']]
+            network = (networks or self.networks.items)[
+                index % len(networks or self.networks.items)]
+            subnet_id = network['subnets'][0]
+            address = self.subnets.by_id[subnet_id]['cidr'].replace(
+                '0/24', '%d' % (index % 250 + 2))
+            mac = 'fa:16:3e:%02x:%02x:%02x' % (
+                index >> 16 & 255, index >> 8 & 255, index & 255)
+            self.ports.add(dict(
+                port, id=_uuid(8, index), name='', device_id=server['id'],
+                device_owner='compute:nova', network_id=network['id'],
+                tenant_id=server['tenant_id'], mac_address=mac,
+                fixed_ips=[{'subnet_id': subnet_id, 'ip_address': address}]))
+            server['addresses'].setdefault(network['name'], []).append({
+                'version': 4, 'addr': address,
+                'OS-EXT-IPS:type': 'fixed', 'OS-EXT-IPS-MAC:mac_addr': mac})
+
+        volume = fixtures.cinder_volumes.first()._apiresource._info
+        self.volumes = Collection()
+        for index in range(counts['volumes']):
+            item = dict(volume, id=_uuid(9, index), name='volume-%04d' % index,
+                        description='', size=index % 100 + 1,
+                        attachments=[], bootable='false',
+                        availability_zone='nova', metadata={},
+                        **{'os-vol-tenant-attr:tenant_id':
+                           self._owner(index)})
+            item.pop('display_name', None)
+            item.pop('display_description', None)
+            if index % 3 == 0:
+                server = self.servers.items[index % len(self.servers.items)]
+                item['status'] = 'in-use'
+                item['attachments'] = [{'server_id': server['id'],
+                                        'device': '/dev/vdb',
+                                        'id': item['id'],
+                                        'volume_id': item['id']}]
+            self.volumes.add(item)
+
+        self.snapshots = Collection(
+            {'id': _uuid(10, index), 'name': 'snapshot-%04d' % index,
+             'description': '', 'status': 'available', 'size': 1,
+             'created_at': '2016-01-01T00:00:00.000000', 'metadata': {},
+             'volume_id': self.volumes.items[
+                 index % len(self.volumes.items)]['id'],
+             'os-extended-snapshot-attributes:project_id':
+                 self._owner(index)}
+            for index in range(counts['snapshots']))
+
+        keypair = fixtures.keypairs.first()._info
+        self.keypairs = Collection(
+            dict(keypair, id='keypair-%d' % index,
+                 name='keypair-%d' % index, fingerprint='00:11')
+            for index in range(counts['keypairs']))
+
+        usage = fixtures.usages.first()._info
+        owners = sorted(set(item['tenant_id'] for item in self.servers.items))
+        self.usages = [dict(usage, tenant_id=owner, server_usages=[])
+                       for owner in owners]
+
+        self.security_groups = Collection([{
+            'id': _uuid(11, 0), 'name': 'default', 'description': '',
+            'tenant_id': PROJECT_ID, 'security_group_rules': []}])
+
+    # Transport
+
+    @contextlib.contextmanager
+    def installed(self):
+        """Answer all HTTP requests from this cloud while active."""
+        cloud = self
+
+        def send(adapter, request, **kwargs):
+            return cloud.handle(request)
+
+        with mock.patch.object(requests.adapters.HTTPAdapter, 'send', send):
+            yield self
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.backend_time = 0.0
+
+    def handle(self, request):
+        started = time.time()
+        url = parse.urlsplit(request.url)
+        service = SERVICES.get(url.port)
+        path = re.sub(r'\.json$', '', re.sub('/+', '/', url.path).rstrip('/'))
+        query = parse.parse_qs(url.query, keep_blank_values=True)
+        body = json.loads(request.body) if request.body else None
+        for route_service, method, pattern, handler in self.routes:
+            if route_service != service or method != request.method:
+                continue
+            match = pattern.match(path)
+            if match:
+                name = '%s %s %s' % (service, method, pattern.pattern[1:-1])
+                status, content = handler(query, body, *match.groups())
+                break
+        else:
+            name = 'unrouted %s %s' % (request.method, request.url)
+            status, content = 404, '{"error": {"code": 404}}'
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.calls[name] += 1
+            self.backend_time += time.time() - started
+        return self._response(request, status, content)
+
+    def _response(self, request, status, content):
+        headers = {'Content-Type': 'application/json',
+                   'x-openstack-request-id': 'req-benchmark'}
+        if isinstance(content, dict):
+            headers.update(content)
+            content = ''
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'OK' if status < 400 else 'Error'
+        response.url = request.url
+        response.request = request
+        response.headers = structures.CaseInsensitiveDict(headers)
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(), headers=headers, status=status, version=11,
+            reason=response.reason, preload_content=False)
+        response.encoding = 'utf-8'
+        response._content = content.encode('utf-8')
+        response._content_consumed = True
+        return response
+
+    # API
+
+    def _routes(self):
+        return [
+            ('compute', 'GET', r'/v2/servers/detail', self.server_list),
+            ('compute', 'GET', r'/v2/servers/([^/]+)', self.server_get),
+            ('compute', 'POST', r'/v2/servers/([^/]+)/action',
+             self.server_action),
+            ('compute', 'GET', r'/v2/flavors/detail', self.flavor_list),
+            ('compute', 'GET', r'/v2/flavors/([^/]+)', self.flavor_get),
+            ('compute', 'GET', r'/v2/flavors/([^/]+)/os-extra_specs',
+             self.extra_specs),
+            ('compute', 'GET', r'/v2/os-keypairs', self.keypair_list),
+            ('compute', 'GET', r'/v2/limits', self.nova_limits),
+            ('compute', 'GET', r'/v2/os-quota-sets/([^/]+)(?:/defaults)?',
+             self.nova_quotas),
+            ('compute', 'GET', r'/v2/os-availability-zone(?:/detail)?',
+             self.availability_zones),
+            ('compute', 'GET', r'/v2/extensions', self.nova_extensions),
+            ('compute', 'GET', r'/v2/os-simple-tenant-usage',
+             self.usage_list),
+            ('compute', 'GET', r'/v2/os-simple-tenant-usage/([^/]+)',
+             self.usage_get),
+            ('compute', 'GET', r'/v2/os-server-groups',
+             self.empty('server_groups')),
+            ('volume', 'GET', r'/v2/volumes/detail', self.volume_list),
+            ('volume', 'GET', r'/v2/volumes/([^/]+)', self.volume_get),
+            ('volume', 'GET', r'/v2/snapshots/detail', self.snapshot_list),
+            ('volume', 'GET', r'/v2/backups/detail', self.empty('backups')),
+            ('volume', 'GET', r'/v2/limits', self.cinder_limits),
+            ('volume', 'GET', r'/v2/os-quota-sets/([^/]+)(?:/defaults)?',
+             self.cinder_quotas),
+            ('volume', 'GET', r'/v2/types', self.empty('volume_types')),
+            ('volume', 'GET', r'/v2/os-availability-zone',
+             self.availability_zones),
+            ('volume', 'GET', r'/v2/extensions', self.empty('extensions')),
+            ('volume', 'GET', r'/v2/os-volume-transfer/detail',
+             self.empty('transfers')),
+            ('image', 'GET', r'/v1/images/detail', self.image_list),
+            ('image', 'HEAD', r'/v1/images/([^/]+)', self.image_get),
+            ('network', 'GET', r'/v2.0/networks', self.lister('networks')),
+            ('network', 'GET', r'/v2.0/subnets', self.lister('subnets')),
+            ('network', 'GET', r'/v2.0/ports', self.lister('ports')),
+            ('network', 'GET', r'/v2.0/routers', self.lister('routers')),
+            ('network', 'GET', r'/v2.0/security-groups',
+             self.lister('security_groups', 'security_groups')),
+            ('network', 'GET', r'/v2.0/floatingips',
+             self.empty('floatingips')),
+            ('network', 'GET', r'/v2.0/extensions',
+             self.neutron_extensions),
+            ('network', 'GET', r'/v2.0/quotas/([^/]+)', self.neutron_quotas),
+            ('identity', 'GET', r'/v3/projects', self.project_list),
+            ('identity', 'GET', r'/v3/projects/([^/]+)', self.project_get),
+            ('identity', 'GET', r'/v3/users/([^/]+)/projects',
+             self.user_projects),
+            ('identity', 'GET', r'/v3/auth/projects', self.user_projects),
+            ('identity', 'GET', r'/v3/domains', self.domain_list),
+            ('identity', 'GET', r'/v3/domains/([^/]+)', self.domain_get),
+        ]
+
+    def empty(self, key):
+        return lambda query, body, *args: (200, '{"%s":[]}' % key)
+
+    def _get(self, collection, key, resource_id):
+        item = getattr(self, collection).by_id.get(resource_id)
+        if item is None:
+            return 404, '{"itemNotFound": {"code": 404}}'
+        return 200, '{"%s":%s}' % (key,
+                                   getattr(self, collection).json(item))
+
+    def _page(self, items, query):
+        marker = query.get('marker', [None])[0]
+        if marker:
+            ids = [item['id'] for item in items]
+            items = items[ids.index(marker) + 1:] if marker in ids else []
+        limit = query.get('limit', [None])[0]
+        if limit:
+            items = items[:int(limit)]
+        return items
+
+    def _owned(self, items, query, owner_key='tenant_id'):
+        if query.get('all_tenants', ['0'])[0] not in ('0', 'False', 'false'):
+            owner = query.get('project_id', query.get('tenant_id', [None]))[0]
+        else:
+            owner = PROJECT_ID
+        if owner is None:
+            return items
+        return [item for item in items if item.get(owner_key) == owner]
+
+    def server_list(self, query, body):
+        items = self._owned(self.servers.items, query)
+        for key in ('status', 'flavor', 'image'):
+            if key in query:
+                value = query[key][0]
+                items = [item for item in items
+                         if value in (item[key], (item[key] or {}).get('id')
+                                      if isinstance(item[key], dict)
+                                      else None)]
+        if 'name' in query:
+            pattern = re.compile(query['name'][0])
+            items = [item for item in items if pattern.search(item['name'])]
+        return 200, self.servers.dumps('servers', self._page(items, query))
+
+    def server_get(self, query, body, server_id):
+        return self._get('servers', 'server', server_id)
+
+    def server_action(self, query, body, server_id):
+        action = list(body)[0]
+        if not action.endswith('Console'):
+            return 404, '{}'
+        return 200, json.dumps({'console': {
+            'type': 'novnc',
+            'url': 'http://vnc.example.com/vnc_auto.html?token=%s'
+                   % server_id}})
+
+    def flavor_list(self, query, body):
+        return 200, self.flavors.dumps('flavors', self.flavors.items)
+
+    def flavor_get(self, query, body, flavor_id):
+        return self._get('flavors', 'flavor', flavor_id)
+
+    def extra_specs(self, query, body, flavor_id):
+        return 200, '{"extra_specs":{}}'
+
+    def keypair_list(self, query, body):
+        return 200, json.dumps({'keypairs': [{'keypair': item} for item
+                                             in self.keypairs.items]})
+
+    def nova_limits(self, query, body):
+        limits = copy.deepcopy(self._fixtures.limits)
+        servers = self._owned(self.servers.items, {})
+        limits['absolute'].update(totalInstancesUsed=len(servers),
+                                  maxTotalInstances=len(servers) * 2,
+                                  maxTotalCores=-1, maxTotalRAMSize=-1)
+        return 200, json.dumps({'limits': dict(limits, rate=[])})
+
+    def nova_quotas(self, query, body, tenant_id):
+        quotas = dict((quota.name, quota.limit)
+                      for quota in self._fixtures.quotas.first())
+        return 200, json.dumps({'quota_set': dict(quotas, id=tenant_id)})
+
+    def availability_zones(self, query, body):
+        return 200, json.dumps({'availabilityZoneInfo': [
+            {'zoneName': 'nova', 'zoneState': {'available': True},
+             'hosts': None}]})
+
+    def nova_extensions(self, query, body):
+        return 200, json.dumps({'extensions': [
+            {'name': name, 'alias': alias, 'namespace': '', 'links': [],
+             'updated': '2016-01-01T00:00:00Z', 'description': ''}
+            for name, alias in (('AdminActions', 'os-admin-actions'),
+                                ('ServerGroups', 'os-server-groups'),
+                                ('SimpleTenantUsage',
+                                 'os-simple-tenant-usage'))]})
+
+    def usage_list(self, query, body):
+        return 200, json.dumps({'tenant_usages': self.usages})
+
+    def usage_get(self, query, body, tenant_id):
+        usages = [usage for usage in self.usages
+                  if usage['tenant_id'] == tenant_id]
+        return 200, json.dumps({'tenant_usage': usages[0] if usages else {}})
+
+    def volume_list(self, query, body):
+        items = self._owned(self.volumes.items, query,
+                            'os-vol-tenant-attr:tenant_id')
+        return 200, self.volumes.dumps('volumes', self._page(items, query))
+
+    def volume_get(self, query, body, volume_id):
+        return self._get('volumes', 'volume', volume_id)
+
+    def snapshot_list(self, query, body):
+        items = self._owned(self.snapshots.items, query,
+                            'os-extended-snapshot-attributes:project_id')
+        return 200, self.snapshots.dumps('snapshots',
+                                         self._page(items, query))
+
+    def cinder_limits(self, query, body):
+        limits = copy.deepcopy(self._fixtures.cinder_limits)
+        return 200, json.dumps({'limits': dict(limits, rate=[])})
+
+    def cinder_quotas(self, query, body, tenant_id):
+        quotas = dict((quota.name, quota.limit)
+                      for quota in self._fixtures.cinder_quotas.first())
+        return 200, json.dumps({'quota_set': dict(quotas, id=tenant_id)})
+
+    def image_list(self, query, body):
+        items = self.images.items
+        if 'is_public' in query:
+            public = query['is_public'][0] == 'True'
+            items = [item for item in items if item['is_public'] == public]
+        if 'property-owner_id' in query:
+            items = [item for item in items
+                     if item['owner'] == query['property-owner_id'][0]]
+        return 200, self.images.dumps('images', self._page(items, query))
+
+    def image_get(self, query, body, image_id):
+        item = self.images.by_id.get(image_id)
+        if item is None:
+            return 404, ''
+        headers = dict(('x-image-meta-%s' % key, str(value))
+                       for key, value in item.items()
+                       if key != 'properties' and value is not None)
+        headers.update(('x-image-meta-property-%s' % key, str(value))
+                       for key, value in item['properties'].items())
+        return 200, headers
+
+    def lister(self, collection, key=None):
+        key = key or collection
+
+        def handler(query, body):
+            items = getattr(self, collection).items
+            fields = query.pop('fields', None)
+            for name, values in query.items():
+                if name in ('limit', 'marker', 'sort_key', 'sort_dir'):
+                    continue
+                values = set(value.lower() for value in values)
+                items = [item for item in items
+                         if str(item.get(name)).lower() in values]
+            return 200, getattr(self, collection).dumps(
+                key, self._page(items, query), fields)
+        return handler
+
+    def neutron_extensions(self, query, body):
+        return 200, json.dumps({'extensions': [
+            {'alias': alias, 'name': alias, 'description': '', 'links': [],
+             'updated': '2016-01-01T00:00:00-00:00'}
+            for alias in ('agent', 'binding', 'dvr', 'extraroute',
+                          'external-net', 'quotas', 'router',
+                          'security-group')]})
+
+    def neutron_quotas(self, query, body, tenant_id):
+        return 200, json.dumps({'quota': {
+            'network': -1, 'subnet': -1, 'port': -1, 'router': -1,
+            'floatingip': -1, 'security_group': -1,
+            'security_group_rule': -1}})
+
+    def project_list(self, query, body):
+        items = self.projects.items
+        if 'domain_id' in query:
+            items = [item for item in items
+                     if item['domain_id'] == query['domain_id'][0]]
+        return 200, self.projects.dumps('projects', items,
+                                        extra=',"links":{}')
+
+    def project_get(self, query, body, project_id):
+        return self._get('projects', 'project', project_id)
+
+    def user_projects(self, query, body, user_id=USER_ID):
+        return 200, self.projects.dumps('projects', self.member_projects,
+                                        extra=',"links":{}')
+
+    def domain_list(self, query, body):
+        return 200, self.domains.dumps('domains', self.domains.items,
+                                       extra=',"links":{}')
+
+    def domain_get(self, query, body, domain_id):
+        return self._get('domains', 'domain', domain_id)
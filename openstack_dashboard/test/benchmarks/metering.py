@@ -0,0 +1,113 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark of the metering statistics processing.
+
+Builds synthetic Ceilometer statistics for many resources and times the
+steps the metering panel runs on them once they are fetched: building the
+series of a meter, normalizing their unit, serializing them to the line
+chart JSON and building the rows of the usage report CSV. Run it with::
+
+    python -m openstack_dashboard.test.benchmarks.metering [options]
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import itertools
+import json
+import os
+import random
+import sys
+import timeit
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE',
+                      'openstack_dashboard.test.settings')
+
+import django  # noqa
+
+django.setup()
+
+from ceilometerclient.v2 import statistics as ceilometer_statistics  # noqa
+from django import http  # noqa
+
+from openstack_dashboard.api import ceilometer  # noqa
+from openstack_dashboard.utils import metering  # noqa
+
+
+def make_aggregates(resources, points, meter='disk_read_bytes'):
+    """Return ``resources`` aggregates with ``points`` hourly statistics."""
+    manager = ceilometer_statistics.StatisticsManager(None)
+    start = datetime.datetime(2016, 1, 1)
+    aggregates = []
+    for index in range(resources):
+        statistics = []
+        for point in range(points):
+            end = (start + datetime.timedelta(hours=point)).isoformat()
+            value = random.uniform(0, 4 * 1024 ** 3)
+            statistics.append(ceilometer_statistics.Statistics(manager, {
+                'min': value / 2, 'max': value * 2, 'avg': value,
+                'sum': value * 6, 'count': 6, 'period': 3600,
+                'duration_start': end, 'duration_end': end,
+                'period_start': end, 'period_end': end}))
+        aggregate = ceilometer.ResourceAggregate(
+            identifier='project-%d' % index)
+        aggregate.set_meter(meter, statistics)
+        aggregates.append(aggregate)
+    return aggregates
+
+
+def chart(aggregates, meter='disk_read_bytes'):
+    series = metering.meter_series(http.HttpRequest(), aggregates,
+                                   'project', meter, meter, 'avg', 'B')
+    series = metering.normalize_units(series)
+    return json.dumps({'series': [item.to_chart() for item in series],
+                       'settings': {}})
+
+
+def report_rows(aggregates, meter='disk_read_bytes'):
+    rows = []
+    for aggregate in aggregates:
+        times, averages = metering.statistics_columns(
+            aggregate.get_meter(meter), 'period_end', 'avg')
+        rows.extend(zip(itertools.repeat(aggregate.id),
+                        itertools.repeat(meter), itertools.repeat(''),
+                        itertools.repeat('Nova'), times, averages,
+                        itertools.repeat('B')))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--resources', type=int, default=300,
+                        help='Number of resources (default: 300).')
+    parser.add_argument('--points', type=int, default=720,
+                        help='Statistics per resource (default: 720, '
+                        '30 days of hourly statistics).')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs of every step (default: 5).')
+    args = parser.parse_args(argv)
+
+    aggregates = make_aggregates(args.resources, args.points)
+    total = args.resources * args.points
+    print("%d resources, %d statistics" % (args.resources, total))
+    print("%-12s %10s %14s" % ("step", "best ms", "statistics/s"))
+    for name, func in (('chart', lambda: chart(aggregates)),
+                       ('report rows', lambda: report_rows(aggregates))):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print("%-12s %10.1f %14d" % (name, best * 1000, total / best))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
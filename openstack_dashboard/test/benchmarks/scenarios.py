@@ -0,0 +1,259 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Page rendering benchmarks against a fake cloud.
+
+Renders dashboard pages with the Django test client while the API clients
+talk to :class:`~openstack_dashboard.test.benchmarks.fake_cloud.FakeCloud`,
+and reports latency percentiles, the number of API calls and the peak
+memory growth of every scenario, compared to a stored baseline. Run it
+with::
+
+    python -m openstack_dashboard.test.benchmarks.scenarios [options]
+
+The exit status is 1 when a scenario makes more API calls than recorded in
+the baseline. Latencies depend on the machine, compare them only with a
+baseline saved on the same one (``--save-baseline``).
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE',
+                      'openstack_dashboard.test.settings')
+
+import django  # noqa
+
+django.setup()
+
+from django.conf import settings  # noqa
+from django.core.cache import cache  # noqa
+from django.core import urlresolvers  # noqa
+from django.test import client as test_client  # noqa
+from django.test import utils as test_utils  # noqa
+from keystoneclient.v3 import projects  # noqa
+import mock  # noqa
+from openstack_auth import user  # noqa
+
+from openstack_dashboard.test.benchmarks import fake_cloud  # noqa
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'baseline.json')
+
+SCENARIOS = collections.OrderedDict([
+    ('instances', 'horizon:project:instances:index'),
+    ('volumes', 'horizon:project:volumes:index'),
+    ('network_topology', 'horizon:project:network_topology:json'),
+    ('admin_overview', 'horizon:admin:overview:index'),
+    ('launch_instance', 'horizon:project:instances:launch'),
+])
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = int(math.ceil(percent / 100.0 * len(values))) - 1
+    return values[max(0, min(index, len(values) - 1))]
+
+
+def _rss_kb():
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+    except (IOError, OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def _get_user(cloud):
+    fixtures = cloud._fixtures
+    tenants = [projects.Project(None, dict(item), loaded=True)
+               for item in cloud.member_projects]
+
+    def get_user(request):
+        return user.User(id=fake_cloud.USER_ID,
+                         token=fixtures.token,
+                         user=fixtures.user.name,
+                         domain_id=fixtures.domain.id,
+                         user_domain_name=fixtures.domain.name,
+                         tenant_id=fake_cloud.PROJECT_ID,
+                         service_catalog=fixtures.service_catalog,
+                         roles=[fixtures.roles.admin._info],
+                         enabled=True,
+                         authorized_tenants=tenants,
+                         endpoint=settings.OPENSTACK_KEYSTONE_URL)
+    return get_user
+
+
+def render(cloud, url):
+    """Render ``url`` once, returns the response and the API calls made."""
+    cloud.reset()
+    response = test_client.Client().get(url)
+    return response, dict(cloud.calls)
+
+
+def measure(cloud, url, iterations):
+    """Render ``url`` with a cold cache once, then ``iterations`` times."""
+    result = {}
+    rss = _rss_kb()
+    with cloud.installed(), \
+            mock.patch('openstack_auth.utils.get_user', _get_user(cloud)), \
+            test_utils.override_settings(ALLOWED_HOSTS=['testserver']):
+        cache.clear()
+        response, calls = render(cloud, url)
+        if response.status_code != 200:
+            raise RuntimeError("%s returned %s." % (url,
+                                                    response.status_code))
+        result['cold_calls'] = sum(calls.values())
+        timings, backend = [], []
+        for _i in range(iterations):
+            started = time.time()
+            response, calls = render(cloud, url)
+            timings.append((time.time() - started) * 1000)
+            backend.append(cloud.backend_time * 1000)
+    result.update(
+        p50=percentile(timings, 50), p90=percentile(timings, 90),
+        p99=percentile(timings, 99), backend_p50=percentile(backend, 50),
+        calls=sum(calls.values()), call_counts=calls)
+    if resource is not None and rss is not None:
+        result['peak_kb'] = max(
+            0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+    return result
+
+
+def _measure_in_child(cloud, url, iterations, results):
+    try:
+        results.put(measure(cloud, url, iterations))
+    except Exception as exc:
+        traceback.print_exc()
+        results.put({'error': '%s: %s' % (type(exc).__name__, exc)})
+
+
+def run(cloud, names, iterations):
+    """Run every scenario in its own process, so peak memory is its own."""
+    report = collections.OrderedDict()
+    for name in names:
+        url = urlresolvers.reverse(SCENARIOS[name])
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=_measure_in_child, args=(cloud, url, iterations, results))
+        process.start()
+        report[name] = results.get()
+        process.join()
+    return report
+
+
+def compare(report, baseline):
+    """Print the report next to the baseline, returns the regressions."""
+    regressions = []
+    print("%-18s %9s %9s %9s %9s %11s %9s %14s" % (
+        "scenario", "p50 ms", "p90 ms", "p99 ms", "api ms", "calls",
+        "peak MiB", "baseline p50"))
+    for name, result in report.items():
+        if 'error' in result:
+            print("%-18s %s" % (name, result['error']))
+            regressions.append(name)
+            continue
+        base = baseline.get(name, {})
+        calls = "%d/%d" % (result['cold_calls'], result['calls'])
+        if base and (result['calls'] > base['calls'] or
+                     result['cold_calls'] > base['cold_calls']):
+            calls += '!'
+            regressions.append(name)
+        peak = result.get('peak_kb')
+        print("%-18s %9.1f %9.1f %9.1f %9.1f %11s %9s %14s" % (
+            name, result['p50'], result['p90'], result['p99'],
+            result['backend_p50'], calls,
+            '%.1f' % (peak / 1024.0) if peak is not None else '-',
+            '%.1f' % base['p50'] if base else '-'))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help='Scenarios to run: %s. Defaults to all.'
+                        % ', '.join(SCENARIOS))
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiplier of the resource counts of the '
+                        'fake cloud (default: 1.0, 10000 servers).')
+    parser.add_argument('--delay', type=float, default=0,
+                        help='Seconds every API call takes (default: 0).')
+    parser.add_argument('--iterations', type=int, default=10,
+                        help='Warm renders per scenario (default: 10).')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='Baseline to compare with.')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store the results as the new baseline.')
+    parser.add_argument('--verbose', action='store_true',
+                        help='List the API calls of every scenario.')
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error("Unknown scenarios: %s" % ', '.join(sorted(unknown)))
+
+    cloud = fake_cloud.FakeCloud(scale=args.scale, delay=args.delay)
+    report = run(cloud, names, args.iterations)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        if stored.get('scale') == args.scale:
+            baseline = stored['scenarios']
+        else:
+            print("Baseline was recorded with scale %s, not comparing."
+                  % stored.get('scale'))
+    regressions = compare(report, baseline)
+
+    if args.verbose:
+        for name, result in report.items():
+            print("\n%s" % name)
+            for call, count in sorted(result.get('call_counts', {}).items()):
+                print("  %4d  %s" % (count, call))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({'scale': args.scale, 'scenarios': dict(
+                (name, dict((key, round(value, 1)
+                             if isinstance(value, float) else value)
+                            for key, value in result.items()
+                            if key != 'call_counts'))
+                for name, result in report.items()
+                if 'error' not in result)}, f, indent=2, sort_keys=True,
+                separators=(',', ': '))
+            f.write('\n')
+    elif regressions:
+        print("\nMore API calls than in the baseline: %s"
+              % ', '.join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark of the rendering of data tables.
+
+Renders a table like the admin instance table, with links, status and
+display choices, filters and truncated columns, out of synthetic rows, and
+times building the rows and rendering the whole table. Templates are loaded
+through the cached template loader, as in production. Run it with::
+
+    python -m openstack_dashboard.test.benchmarks.tables [options]
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import timeit
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE',
+                      'openstack_dashboard.test.settings')
+
+import django  # noqa
+
+django.setup()
+
+from django.conf import settings  # noqa
+from django.contrib.messages.storage import default_storage  # noqa
+from django.contrib.sessions.backends.signed_cookies import SessionStore  # noqa
+from django.template import defaultfilters as filters  # noqa
+from django.test import client  # noqa
+from django.test import utils as test_utils  # noqa
+from django.utils.translation import pgettext_lazy  # noqa
+from openstack_auth import user  # noqa
+
+from horizon import tables  # noqa
+from horizon.utils import filters as utils_filters  # noqa
+
+
+STATUS_CHOICES = (
+    ("active", True),
+    ("shutoff", True),
+    ("suspended", True),
+    ("paused", True),
+    ("error", False),
+    ("rescue", True),
+    ("shelved", True),
+    ("shelved_offloaded", True),
+)
+
+STATUS_DISPLAY_CHOICES = (
+    ("active", pgettext_lazy("Current status of an Instance", u"Active")),
+    ("shutoff", pgettext_lazy("Current status of an Instance", u"Shutoff")),
+    ("suspended", pgettext_lazy("Current status of an Instance",
+                                u"Suspended")),
+    ("paused", pgettext_lazy("Current status of an Instance", u"Paused")),
+    ("error", pgettext_lazy("Current status of an Instance", u"Error")),
+    ("resize", pgettext_lazy("Current status of an Instance",
+                             u"Resize/Migrate")),
+    ("verify_resize", pgettext_lazy("Current status of an Instance",
+                                    u"Confirm or Revert Resize/Migrate")),
+    ("build", pgettext_lazy("Current status of an Instance", u"Build")),
+    ("rescue", pgettext_lazy("Current status of an Instance", u"Rescue")),
+    ("shelved", pgettext_lazy("Current status of an Instance", u"Shelved")),
+    ("shelved_offloaded", pgettext_lazy("Current status of an Instance",
+                                        u"Shelved Offloaded")),
+)
+
+POWER_DISPLAY_CHOICES = (
+    ("NO STATE", pgettext_lazy("Power state of an Instance", u"No State")),
+    ("RUNNING", pgettext_lazy("Power state of an Instance", u"Running")),
+    ("PAUSED", pgettext_lazy("Power state of an Instance", u"Paused")),
+    ("SHUTDOWN", pgettext_lazy("Power state of an Instance", u"Shut Down")),
+    ("CRASHED", pgettext_lazy("Power state of an Instance", u"Crashed")),
+    ("SUSPENDED", pgettext_lazy("Power state of an Instance", u"Suspended")),
+)
+
+POWER_STATES = ("NO STATE", "RUNNING", "PAUSED", "SHUTDOWN", "CRASHED",
+                "SUSPENDED")
+
+
+class Server(object):
+    def __init__(self, index):
+        self.id = 'server-%d' % index
+        self.name = 'server-%d' % index
+        self.tenant_name = 'project-%d' % (index % 50)
+        self.host = 'compute-%d' % (index % 20)
+        self.image_name = 'image-%d' % (index % 10)
+        self.ip = '10.0.%d.%d' % (index // 250, index % 250)
+        self.size = random.randint(0, 100 * 1024 ** 3)
+        self.status = random.choice(STATUS_CHOICES)[0]
+        self.power_state = random.choice(POWER_STATES)
+        self.description = 'A server used by the benchmark, number %d' % index
+        self.created = (datetime.datetime(2016, 1, 1) +
+                        datetime.timedelta(hours=index)).isoformat()
+
+
+def get_link(server):
+    return '/admin/instances/%s/detail' % server.id
+
+
+class ServerTable(tables.DataTable):
+    tenant = tables.Column('tenant_name', verbose_name='Project')
+    host = tables.Column('host', verbose_name='Host')
+    name = tables.Column('name', link=get_link, verbose_name='Name',
+                         link_classes=('server-link',))
+    image = tables.Column('image_name', verbose_name='Image Name')
+    ip = tables.Column('ip', verbose_name='IP Address')
+    size = tables.Column('size', verbose_name='Size',
+                         filters=(filters.filesizeformat,))
+    status = tables.Column('status', verbose_name='Status', status=True,
+                           status_choices=STATUS_CHOICES,
+                           display_choices=STATUS_DISPLAY_CHOICES)
+    state = tables.Column('power_state', verbose_name='Power State',
+                          display_choices=POWER_DISPLAY_CHOICES)
+    description = tables.Column('description', verbose_name='Description',
+                                truncate=30)
+    created = tables.Column('created', verbose_name='Age',
+                            filters=(utils_filters.parse_isotime,
+                                     filters.timesince))
+
+    class Meta(object):
+        name = 'servers'
+        verbose_name = 'Servers'
+        status_columns = ('status',)
+
+
+def make_request():
+    request = client.RequestFactory().get('/admin/instances/')
+    request.user = user.User(id='1', token=None, user='benchmark',
+                             roles=[{'name': 'admin'}])
+    request.session = SessionStore()
+    request._messages = default_storage(request)
+    return request
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--rows', type=int, default=1000,
+                        help='Number of rows (default: 1000).')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs of every step (default: 5).')
+    args = parser.parse_args(argv)
+
+    random.seed(0)
+    servers = [Server(index) for index in range(args.rows)]
+    request = make_request()
+    cells = args.rows * len(ServerTable.base_columns)
+    print("%d rows, %d cells" % (args.rows, cells))
+    print("%-12s %10s %12s" % ("step", "best ms", "cells/s"))
+    loaders = (('django.template.loaders.cached.Loader',
+                settings.TEMPLATE_LOADERS),)
+    with test_utils.override_settings(TEMPLATE_LOADERS=loaders):
+        for name, func in (
+                ('rows', lambda: ServerTable(request, servers).get_rows()),
+                ('render', lambda: ServerTable(request, servers).render())):
+            best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            print("%-12s %10.1f %12d" % (name, best * 1000, cells / best))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
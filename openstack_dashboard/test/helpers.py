@@ -20,12 +20,15 @@ import collections
 import copy
 from functools import wraps  # noqa
 import os
+import threading
+import time
 import traceback
 import unittest
 
 import django
 from django.conf import settings
 from django.contrib.messages.storage import default_storage  # noqa
+from django.core.cache import cache
 from django.core.handlers import wsgi
 from django.core import urlresolvers
 from django.test.client import RequestFactory  # noqa
@@ -174,6 +177,11 @@ class TestCase(horizon_helpers.TestCase):
         self.patchers = {}
         self.add_panel_mocks()
 
+        # API data shared between requests through the cache or the process
+        # must not leak from one test into the next.
+        cache.clear()
+        api.neutron._uri_limits.clear()
+
         super(TestCase, self).setUp()
 
     def _setup_test_data(self):
@@ -658,3 +666,59 @@ def mock_factory(r):
     mocked = mock_obj_to_dict(r)
     mocked.configure_mock(**r)
     return mocked
+
+
+class StubHTTPServer(object):
+    """Serves canned responses from a local HTTP server.
+
+    Meant for code fetching URLs itself, e.g. Heat template files::
+
+        with StubHTTPServer({'/a.yaml': b'...'}) as server:
+            api.heat.get_template_files(template_url=server.url('/a.yaml'))
+            self.assertEqual(['/a.yaml'], server.requests)
+
+    A response may be a ``(delay, content)`` tuple to answer slowly. Paths
+    without a response get a 404.
+    """
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def url(self, path):
+        return 'http://127.0.0.1:%d%s' % (self.server.server_port, path)
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(moves.BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests.append(self.path)
+                response = stub.responses.get(self.path)
+                if response is None:
+                    self.send_error(404)
+                    return
+                if isinstance(response, tuple):
+                    delay, response = response
+                    time.sleep(delay)
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(moves.socketserver.ThreadingMixIn,
+                     moves.BaseHTTPServer.HTTPServer):
+            daemon_threads = True
+
+        self.server = Server(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
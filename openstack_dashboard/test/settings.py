@@ -228,8 +228,7 @@ POLICY_FILES = {
     'compute': 'nova_policy.json'
 }
 
-# The openstack_auth.user.Token object isn't JSON-serializable ATM
-SESSION_SERIALIZER = 'django.contrib.sessions.serializers.PickleSerializer'
+SESSION_SERIALIZER = 'openstack_dashboard.utils.sessions.CompactSerializer'
 
 REST_API_SETTING_1 = 'foo'
 REST_API_SETTING_2 = 'bar'
@@ -0,0 +1,129 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+import json
+import pickle
+import zlib
+
+from django.contrib.sessions import serializers
+from keystoneauth1 import access
+from openstack_auth import user as auth_user
+
+from openstack_dashboard.test import helpers as test
+from openstack_dashboard.utils import sessions
+
+
+CATALOG = [{'type': 'compute', 'name': 'nova', 'id': 'c1',
+            'endpoints': [{'interface': 'public', 'region': 'RegionOne',
+                           'url': 'http://nova.example.com:8774/v2.1'}]},
+           {'type': 'identity', 'name': 'keystone', 'id': 'i1',
+            'endpoints': [{'interface': 'public', 'region': 'RegionOne',
+                           'url': 'http://keystone.example.com:5000/v3'}]}]
+
+
+def _auth_ref(project_id='p1', domain_id=None):
+    token = {'methods': ['password'],
+             'expires_at': '2016-06-01T12:00:00.000000Z',
+             'user': {'id': 'u1', 'name': 'user',
+                      'domain': {'id': 'default', 'name': 'Default'}},
+             'roles': [{'id': 'r1', 'name': 'member'}],
+             'catalog': CATALOG}
+    if domain_id:
+        token['domain'] = {'id': domain_id, 'name': 'Domain'}
+    else:
+        token['project'] = {'id': project_id, 'name': 'project',
+                            'domain': {'id': 'default', 'name': 'Default'}}
+    return access.create(body={'token': token}, auth_token='token-id')
+
+
+class CompactSerializerTests(test.TestCase):
+
+    def setUp(self):
+        super(CompactSerializerTests, self).setUp()
+        self.serializer = sessions.CompactSerializer()
+        self.token = auth_user.Token(_auth_ref(), unscoped_token='unscoped')
+        self.domain_token = _auth_ref(domain_id='d1')
+        self.session = {'token': self.token,
+                        'domain_token': self.domain_token,
+                        'user_id': u'u1',
+                        'region_endpoint': 'http://keystone.example.com',
+                        'tuple': (1, 2),
+                        'when': datetime.datetime(2016, 6, 1, 12, 30),
+                        'other': set(['a'])}
+
+    def test_round_trip(self):
+        loaded = self.serializer.loads(self.serializer.dumps(self.session))
+        self.assertEqual(u'u1', loaded['user_id'])
+        self.assertEqual([1, 2], loaded['tuple'])
+        self.assertEqual(self.session['when'], loaded['when'])
+        self.assertEqual(set(['a']), loaded['other'])
+
+        token = loaded['token']
+        self.assertIsInstance(token, auth_user.Token)
+        self.assertEqual(self.token.id, token.id)
+        self.assertEqual(self.token.expires, token.expires)
+        self.assertEqual(self.token.project, token.project)
+        self.assertIs(token.project, token.tenant)
+        self.assertEqual('unscoped', token.unscoped_token)
+        self.assertEqual(CATALOG, token.serviceCatalog)
+
+        domain_token = loaded['domain_token']
+        self.assertEqual('token-id', domain_token.auth_token)
+        self.assertEqual('d1', domain_token.domain_id)
+        self.assertEqual(
+            'http://nova.example.com:8774/v2.1',
+            domain_token.service_catalog.url_for(service_type='compute'))
+
+    def test_catalog_stored_once(self):
+        data = self.serializer.dumps(self.session)
+        self.assertTrue(data.startswith(b'hzs1:'))
+        session, catalogs = zlib.decompress(data[5:]).split(b'\n')
+        self.assertEqual(1, len(json.loads(catalogs.decode('utf-8'))))
+        self.assertNotIn(b'nova.example.com', session)
+        self.assertLess(len(data),
+                        len(serializers.PickleSerializer().dumps(
+                            self.session)))
+
+    def test_catalog_loaded_lazily(self):
+        token = self.serializer.loads(self.serializer.dumps(
+            {'token': self.token}))['token']
+        self.assertNotIn('serviceCatalog', vars(token))
+        self.assertIsNone(token._catalogs._catalogs)
+        self.assertEqual(CATALOG, token.serviceCatalog)
+        self.assertIn('serviceCatalog', vars(token))
+
+        # Restored tokens can still be pickled.
+        token = pickle.loads(pickle.dumps(token))
+        self.assertEqual(CATALOG, token.serviceCatalog)
+
+    def test_loads_legacy_sessions(self):
+        session = {'user_id': u'u1', 'token': self.token}
+        loaded = self.serializer.loads(
+            serializers.PickleSerializer().dumps(session))
+        self.assertEqual(CATALOG, loaded['token'].serviceCatalog)
+        loaded = self.serializer.loads(
+            serializers.JSONSerializer().dumps({'user_id': u'u1'}))
+        self.assertEqual({'user_id': u'u1'}, loaded)
+
+    def test_loads_unknown_version(self):
+        self.assertRaises(ValueError, self.serializer.loads,
+                          b'hzs9:' + zlib.compress(b'{}\n[]'))
+
+    def test_size_report(self):
+        report = sessions.size_report(self.session)
+        self.assertEqual(sorted(self.session),
+                         sorted(row[0] for row in report))
+        self.assertEqual(['domain_token', 'token'],
+                         sorted(row[0] for row in report[:2]))
+        for key, pickle_size, compact_size in report[:2]:
+            self.assertLess(compact_size, pickle_size)
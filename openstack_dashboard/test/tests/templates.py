@@ -15,7 +15,12 @@
 
 from django import template
 from django.template import loader
+import mock
+from openstack_auth import utils
 
+from horizon.utils import theme_bundles
+
+from openstack_dashboard.templatetags import context_selection
 from openstack_dashboard.test import helpers as test
 
 
@@ -95,3 +100,51 @@ class TemplateRenderTest(test.TestCase):
             template.Context(context))
 
         self.assertTrue("OS_REGION_NAME=\"\"" in out)
+
+
+class StylesheetsTemplateTest(test.TestCase):
+    """Tests for the stylesheets of the themes."""
+
+    @mock.patch.object(theme_bundles, 'stylesheet_url',
+                       return_value='/static/dashboard/themes/0123.css')
+    def test_precompiled_stylesheet(self, stylesheet_url):
+        out = loader.render_to_string('_stylesheets.html',
+                                      request=self.factory.get('/'))
+        self.assertIn("href='/static/dashboard/themes/0123.css'", out)
+        self.assertNotIn('text/scss', out)
+        stylesheet_url.assert_called_once_with('default')
+
+
+class ProjectListTest(test.TestCase):
+    """Tests for the project list of the context selection menu."""
+
+    def setUp(self):
+        super(ProjectListTest, self).setUp()
+        self.request.user = utils.get_user(self.request)
+        self.request.user.project_name = self.tenant.name
+
+    def test_remember_project(self):
+        self.request.session[context_selection.RECENT_PROJECTS_KEY] = [
+            ['other', 'Other'], [self.tenant.id, self.tenant.name]]
+        recent = context_selection.remember_project(self.request)
+        self.assertEqual([[self.tenant.id, self.tenant.name],
+                          ['other', 'Other']], recent)
+        self.assertEqual(recent, self.request.session[
+            context_selection.RECENT_PROJECTS_KEY])
+
+    def test_remember_project_limit(self):
+        self.request.session[context_selection.RECENT_PROJECTS_KEY] = [
+            ['p%d' % i, 'P%d' % i]
+            for i in range(context_selection.RECENT_PROJECTS)]
+        recent = context_selection.remember_project(self.request)
+        self.assertEqual(context_selection.RECENT_PROJECTS, len(recent))
+        self.assertEqual(self.tenant.id, recent[0][0])
+        self.assertEqual(['p0', 'P0'], recent[1])
+        self.assertNotIn(['p4', 'P4'], recent)
+
+    def test_show_project_list(self):
+        context = context_selection.show_project_list(
+            {'request': self.request})
+        self.assertEqual([{'id': self.tenant.id, 'name': self.tenant.name}],
+                         context['projects'])
+        self.assertEqual(self.tenant.id, context['project_id'])
@@ -13,10 +13,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import array
 import datetime
 from django.test.utils import override_settings
 import uuid
 
+from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 from openstack_dashboard.utils import filters
 from openstack_dashboard.utils import identity
@@ -66,6 +68,42 @@ class UtilsMeteringTests(test.TestCase):
         self.assertRaises(
             ValueError, metering.calc_date_args, object, object, "other")
 
+    def test_meter_series(self):
+        aggregate = api.ceilometer.ResourceAggregate(identifier='project')
+        aggregate.set_meter('memory', self.statistics.list())
+        empty = api.ceilometer.ResourceAggregate(identifier='empty')
+        series = metering.meter_series(self.request, [aggregate, empty],
+                                       'project', 'memory', 'memory', 'max',
+                                       'MB')
+        self.assertEqual(1, len(series))
+        self.assertEqual({'unit': 'MB', 'name': 'project', 'meter': 'memory',
+                          'data': [{'x': '2012-12-21T11:00:55', 'y': 9.0}]},
+                         series[0].to_chart())
+
+    def test_normalize_units(self):
+        series = [metering.MeterSeries('a', 'disk', 'B', ['d1', 'd2'],
+                                       array.array('d', [512, 3 * 1024])),
+                  metering.MeterSeries('b', 'disk', 'B', ['d1'],
+                                       array.array('d', [1000]))]
+        metering.normalize_units(series)
+        self.assertEqual([('KB', [0.5, 3.0]), ('KB', [1.0])],
+                         [(item.unit, list(item.values)) for item in series])
+
+    def test_normalize_units_unsupported(self):
+        series = [metering.MeterSeries('a', 'cpu', '%', ['d1'],
+                                       array.array('d', [2000]))]
+        metering.normalize_units(series)
+        self.assertEqual(('%', [2000]),
+                         (series[0].unit, list(series[0].values)))
+
+    def test_normalize_series_by_unit(self):
+        series = [{'unit': 'min', 'name': 'a', 'meter': 'uptime',
+                   'data': [{'x': 'd1', 'y': 30}, {'x': 'd2', 'y': 600}]}]
+        self.assertEqual([{'unit': 'hr', 'name': 'a', 'meter': 'uptime',
+                           'data': [{'x': 'd1', 'y': 0.5},
+                                    {'x': 'd2', 'y': 10}]}],
+                         metering.normalize_series_by_unit(series))
+
 
 class IdentityTests(test.BaseAdminViewTests):
     @override_settings(OPENSTACK_KEYSTONE_ADMIN_ROLES=['foO', 'BAR', 'admin'])
@@ -11,6 +11,7 @@
 # under the License.
 
 from collections import defaultdict
+from collections import OrderedDict
 import itertools
 import logging
 
@@ -151,8 +152,9 @@ def _get_quota_data(request, method_name, disabled_quotas=None,
             disabled_quotas.extend(CINDER_QUOTA_FIELDS)
             msg = _("Unable to retrieve volume limit information.")
             exceptions.handle(request, msg)
+    disabled = set(disabled_quotas)
     for quota in itertools.chain(*quotasets):
-        if quota.name not in disabled_quotas:
+        if quota.name not in disabled:
             qs[quota.name] = quota.limit
     return qs
 
@@ -180,49 +182,35 @@ def get_tenant_quota_data(request, disabled_quotas=None, tenant_id=None):
     if 'network' and 'router' not in disabled_quotas:
         tenant_id = tenant_id or request.user.tenant_id
         neutron_quotas = neutron.tenant_quota_get(request, tenant_id)
+    # Collect the Neutron quotas and merge them in a single pass.
+    extra_quotas = OrderedDict()
     if 'floating_ips' in disabled_quotas:
         # Neutron with quota extension disabled
         if 'floatingip' in disabled_quotas:
-            qs.add(base.QuotaSet({'floating_ips': -1}))
+            extra_quotas['floating_ips'] = -1
         # Neutron with quota extension enabled
         else:
             # Rename floatingip to floating_ips since that's how it's
             # expected in some places (e.g. Security & Access' Floating IPs)
-            fips_quota = neutron_quotas.get('floatingip').limit
-            qs.add(base.QuotaSet({'floating_ips': fips_quota}))
+            extra_quotas['floating_ips'] = \
+                neutron_quotas.get('floatingip').limit
     if 'security_groups' in disabled_quotas:
         if 'security_group' in disabled_quotas:
-            qs.add(base.QuotaSet({'security_groups': -1}))
+            extra_quotas['security_groups'] = -1
         # Neutron with quota extension enabled
         else:
             # Rename security_group to security_groups since that's how it's
             # expected in some places (e.g. Security & Access' Security Groups)
-            sec_quota = neutron_quotas.get('security_group').limit
-            qs.add(base.QuotaSet({'security_groups': sec_quota}))
-    if 'network' in disabled_quotas:
-        for item in qs.items:
-            if item.name == 'networks':
-                qs.items.remove(item)
-                break
-    else:
-        net_quota = neutron_quotas.get('network').limit
-        qs.add(base.QuotaSet({'networks': net_quota}))
-    if 'subnet' in disabled_quotas:
-        for item in qs.items:
-            if item.name == 'subnets':
-                qs.items.remove(item)
-                break
-    else:
-        net_quota = neutron_quotas.get('subnet').limit
-        qs.add(base.QuotaSet({'subnets': net_quota}))
-    if 'router' in disabled_quotas:
-        for item in qs.items:
-            if item.name == 'routers':
-                qs.items.remove(item)
-                break
-    else:
-        router_quota = neutron_quotas.get('router').limit
-        qs.add(base.QuotaSet({'routers': router_quota}))
+            extra_quotas['security_groups'] = \
+                neutron_quotas.get('security_group').limit
+    for name, neutron_name in (('networks', 'network'),
+                               ('subnets', 'subnet'),
+                               ('routers', 'router')):
+        if neutron_name in disabled_quotas:
+            qs.remove(name)
+        else:
+            extra_quotas[name] = neutron_quotas.get(neutron_name).limit
+    qs.add(base.QuotaSet(extra_quotas))
 
     return qs
 
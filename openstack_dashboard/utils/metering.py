@@ -10,8 +10,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import array
 import datetime
 import logging
+import operator
 
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
@@ -106,12 +108,56 @@ def get_resource_name(request, resource_id, resource_name, meter_name):
     return resource.name if resource else resource_id
 
 
-def series_for_meter(request, aggregates, group_by, meter_id,
-                     meter_name, stats_name, unit, label=None):
-    """Construct datapoint series for a meter from resource aggregates."""
+class MeterSeries(object):
+    """The statistics of a meter for one resource, stored as columns.
+
+    ``dates`` holds the end of every statistic's period and ``values`` the
+    selected statistic, so unit conversion and serialization work on whole
+    columns instead of on one data point dictionary at a time.
+    """
+
+    def __init__(self, name, meter, unit, dates, values):
+        self.name = name
+        self.meter = meter
+        self.unit = unit
+        self.dates = dates
+        self.values = values
+
+    @classmethod
+    def from_statistics(cls, statistics, stats_name, name, meter, unit):
+        dates, values = statistics_columns(statistics, 'duration_end',
+                                           stats_name)
+        return cls(name, meter, unit, [date[:19] for date in dates],
+                   array.array('d', map(float, values)))
+
+    def rescale(self, factor, unit):
+        """Multiply all values by ``factor``, rounded to one decimal."""
+        self.values = array.array('d', [round(value * factor, 1)
+                                        for value in self.values])
+        self.unit = unit
+
+    def to_chart(self):
+        """Return the series in the format of the line chart."""
+        return {'unit': self.unit,
+                'name': self.name,
+                'meter': self.meter,
+                'data': [{'x': date, 'y': value}
+                         for date, value in zip(self.dates, self.values)]}
+
+
+def statistics_columns(statistics, *attrs):
+    """Return the values of ``attrs`` of all statistics, one list per attr."""
+    return [list(map(operator.attrgetter(attr), statistics))
+            for attr in attrs]
+
+
+def meter_series(request, aggregates, group_by, meter_id,
+                 meter_name, stats_name, unit, label=None):
+    """Return a :class:`MeterSeries` per resource aggregate with data."""
     series = []
     for resource in aggregates:
-        if resource.get_meter(meter_name):
+        statistics = resource.get_meter(meter_name)
+        if statistics:
             if label:
                 name = label
             else:
@@ -120,49 +166,55 @@ def series_for_meter(request, aggregates, group_by, meter_id,
                 resource_id = getattr(resource, resource_name)
                 name = get_resource_name(request, resource_id,
                                          resource_name, meter_name)
-            point = {'unit': unit,
-                     'name': name,
-                     'meter': meter_id,
-                     'data': []}
-            for statistic in resource.get_meter(meter_name):
-                date = statistic.duration_end[:19]
-                value = float(getattr(statistic, stats_name))
-                point['data'].append({'x': date, 'y': value})
-            series.append(point)
+            series.append(MeterSeries.from_statistics(
+                statistics, stats_name, name, meter_id, unit))
     return series
 
 
-def normalize_series_by_unit(series):
-    """Transform series' values into a more human readable form:
-    1) Determine the data point with the maximum value
-    2) Decide the unit appropriate for this value (normalize it)
-    3) Convert other values to this new unit, if necessary
+def normalize_units(series):
+    """Convert a list of :class:`MeterSeries` to a more readable unit.
+
+    The unit is chosen for the largest value of all series, and the values
+    of all series are converted to it with a single conversion factor.
     """
     if not series:
         return series
 
-    source_unit = target_unit = series[0]['unit']
-
+    source_unit = series[0].unit
     if not units.is_supported(source_unit):
         return series
 
-    # Find the data point with the largest value and normalize it to
-    # determine its unit - that will be the new unit
-    maximum = max([d['y'] for point in series for d in point['data']])
+    maximum = max(max(item.values) if item.values else 0
+                  for item in series)
     unit = units.normalize(maximum, source_unit)[1]
+    if units.is_larger(unit, source_unit):
+        factor = units.convert(1, source_unit, unit)[0]
+        for item in series:
+            if item.unit != unit:
+                item.rescale(factor, unit)
+    return series
 
-    # If unit needs to be changed, set the new unit for all data points
-    # and convert all values to that unit
-    if units.is_larger(unit, target_unit):
-        target_unit = unit
-        for i, point in enumerate(series[:]):
-            if point['unit'] != target_unit:
-                series[i]['unit'] = target_unit
-                for j, d in enumerate(point['data'][:]):
-                    series[i]['data'][j]['y'] = units.convert(
-                        d['y'], source_unit, target_unit, fmt=True)[0]
 
-    return series
+def series_for_meter(request, aggregates, group_by, meter_id,
+                     meter_name, stats_name, unit, label=None):
+    """Construct datapoint series for a meter from resource aggregates."""
+    return [item.to_chart()
+            for item in meter_series(request, aggregates, group_by,
+                                     meter_id, meter_name, stats_name,
+                                     unit, label)]
+
+
+def normalize_series_by_unit(series):
+    """Transform series' values into a more human readable form:
+    1) Determine the data point with the maximum value
+    2) Decide the unit appropriate for this value (normalize it)
+    3) Convert other values to this new unit, if necessary
+    """
+    columns = [MeterSeries(point['name'], point['meter'], point['unit'],
+                           [d['x'] for d in point['data']],
+                           array.array('d', [d['y'] for d in point['data']]))
+               for point in series]
+    return [item.to_chart() for item in normalize_units(columns)]
 
 
 def get_unit(meter, request):
@@ -191,18 +243,21 @@ class ProjectAggregatesQuery(object):
         self.request = request
         self.period = period
         self.additional_query = additional_query
-        tenants, more = api.keystone.tenant_list(request,
-                                                 domain=None,
-                                                 paginate=False)
-        self.queries = {}
-
-        for tenant in tenants:
-            tenant_query = [{
-                            "field": "project_id",
-                            "op": "eq",
-                            "value": tenant.id}]
-
-            self.queries[tenant.name] = tenant_query
+        self.queries = self._get_queries()
+
+    def _get_queries(self):
+        # Only the project names are needed, the cached project directory
+        # saves listing every project on each page load.
+        queries = {}
+        projects = api.keystone.project_directory(self.request)
+        for project in projects.values():
+            project_query = [{
+                             "field": "project_id",
+                             "op": "eq",
+                             "value": project.id}]
+
+            queries[project.name] = project_query
+        return queries
 
     def query(self, meter):
         unit = get_unit(meter, self.request)
@@ -220,8 +275,10 @@ class MeterQuery(ProjectAggregatesQuery):
         filterfunc = kwargs.pop('filterfunc', None)
         super(MeterQuery, self).__init__(*args, **kwargs)
         self.filterfunc = filterfunc
-        # Resetting the tenant based filter set in base class
-        self.queries = None
+
+    def _get_queries(self):
+        # No tenant based filter, the query is on resources.
+        return None
 
     def query(self, meter):
         def filter_by_meter_name(resource):
@@ -0,0 +1,212 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Compact session serializer.
+
+Most of a Horizon session is the Keystone token, and most of the token is
+its service catalog. :class:`CompactSerializer` stores the session as
+compressed JSON, with each distinct service catalog stored only once and
+parsed only when it is used. Values it has no JSON form for are pickled,
+like :class:`django.contrib.sessions.serializers.PickleSerializer` does.
+
+Sessions written by the Django pickle or JSON serializers can still be
+read, so switching ``SESSION_SERIALIZER`` does not log users out.
+"""
+
+import base64
+import datetime
+import json
+import zlib
+
+from django.contrib.sessions import serializers
+from django.utils import dateparse
+from keystoneauth1 import access
+from openstack_auth import user as auth_user
+import six
+from six.moves import cPickle as pickle
+
+
+MAGIC = b'hzs'
+VERSION = 1
+
+_TAG = '__hzs__'
+# Where the service catalog lives in the body of a Keystone token.
+_CATALOG_PATHS = (('token', 'catalog'), ('access', 'serviceCatalog'))
+
+
+class SessionToken(auth_user.Token):
+    """A :class:`openstack_auth.user.Token` restored from a session.
+
+    Its service catalog is only parsed when it is accessed.
+    """
+
+    def __getattr__(self, name):
+        catalogs = self.__dict__.get('_catalogs')
+        if name != 'serviceCatalog' or catalogs is None:
+            raise AttributeError(name)
+        self.serviceCatalog = catalogs.get(self.__dict__['_catalog_ref'])
+        return self.serviceCatalog
+
+    def __getstate__(self):
+        getattr(self, 'serviceCatalog', None)
+        state = dict(self.__dict__)
+        state.pop('_catalogs', None)
+        state.pop('_catalog_ref', None)
+        return state
+
+
+class _Catalogs(object):
+    """The service catalogs of a session, parsed on first use."""
+
+    def __init__(self, data):
+        self._data = data
+        self._catalogs = None
+
+    def get(self, index):
+        if self._catalogs is None:
+            data = self._data.decode('utf-8')
+            # Catalogs rarely hold anything but plain JSON.
+            hook = _decoder(self) if _TAG in data else None
+            self._catalogs = json.loads(data, object_hook=hook)
+        return self._catalogs[index]
+
+
+def _dumps(value, default):
+    return json.dumps(value, separators=(',', ':'), default=default)
+
+
+class _Encoder(object):
+
+    def __init__(self):
+        self.catalogs = []
+        self._catalog_refs = {}
+
+    def catalog(self, catalog):
+        data = _dumps(catalog, self.default)
+        if data not in self._catalog_refs:
+            self._catalog_refs[data] = len(self.catalogs)
+            self.catalogs.append(data)
+        return self._catalog_refs[data]
+
+    def default(self, value):
+        if isinstance(value, datetime.datetime):
+            return {_TAG: 'datetime', 'v': value.isoformat()}
+        if isinstance(value, auth_user.Token):
+            return self.encode_token(value)
+        if isinstance(value, access.AccessInfo):
+            return self.encode_access(value)
+        return {_TAG: 'pickle',
+                'v': base64.b64encode(pickle.dumps(
+                    value, pickle.HIGHEST_PROTOCOL)).decode('ascii')}
+
+    def encode_token(self, token):
+        attrs = dict((key, value) for key, value in six.iteritems(vars(token))
+                     if not key.startswith('_'))
+        catalog = attrs.pop('serviceCatalog', None)
+        if catalog is None:
+            catalog = getattr(token, 'serviceCatalog', None)
+        if attrs.get('tenant') is attrs.get('project'):
+            # Token.tenant is an alias of Token.project.
+            attrs.pop('tenant', None)
+        return {_TAG: 'token', 'v': attrs, 'c': self.catalog(catalog)}
+
+    def encode_access(self, auth_ref):
+        body = dict(auth_ref._data)
+        encoded = {_TAG: 'access', 'token': auth_ref.auth_token}
+        for root, key in _CATALOG_PATHS:
+            if key in body.get(root, {}):
+                body[root] = dict(body[root])
+                encoded['c'] = self.catalog(body[root].pop(key))
+                encoded['p'] = [root, key]
+                break
+        encoded['v'] = body
+        return encoded
+
+
+def _decoder(catalogs):
+    def decode(value):
+        tag = value.get(_TAG)
+        if tag is None:
+            return value
+        if tag == 'datetime':
+            return dateparse.parse_datetime(value['v'])
+        if tag == 'token':
+            token = SessionToken.__new__(SessionToken)
+            token.__dict__.update(value['v'])
+            token.__dict__.setdefault('tenant', token.__dict__.get('project'))
+            token._catalogs = catalogs
+            token._catalog_ref = value['c']
+            return token
+        if tag == 'access':
+            body = value['v']
+            if 'p' in value:
+                root, key = value['p']
+                body[root][key] = catalogs.get(value['c'])
+            return access.create(body=body, auth_token=value['token'])
+        if tag == 'pickle':
+            return pickle.loads(base64.b64decode(value['v']))
+        raise ValueError("Unknown session value type %r." % tag)
+    return decode
+
+
+class CompactSerializer(object):
+    """Serializes sessions as compressed, versioned JSON.
+
+    The payload is ``hzs<version>:`` followed by the zlib compressed
+    session and service catalogs, as two JSON documents separated by a
+    newline. Only the session document is parsed when loading; service
+    catalogs are parsed when a token's ``serviceCatalog`` is accessed.
+
+    As with Django's JSON serializer, tuples are restored as lists and
+    dictionary keys as strings.
+    """
+
+    def dumps(self, obj):
+        encoder = _Encoder()
+        session = _dumps(obj, encoder.default)
+        catalogs = u'[%s]' % u','.join(encoder.catalogs)
+        data = (session + u'\n' + catalogs).encode('utf-8')
+        return (MAGIC + str(VERSION).encode('ascii') + b':' +
+                zlib.compress(data))
+
+    def loads(self, data):
+        if not data.startswith(MAGIC):
+            return _legacy_loads(data)
+        header, _sep, data = data.partition(b':')
+        version = header[len(MAGIC):]
+        if version != str(VERSION).encode('ascii'):
+            raise ValueError("Unsupported session format %r." % header)
+        session, _sep, catalogs = zlib.decompress(data).partition(b'\n')
+        return json.loads(session.decode('utf-8'),
+                          object_hook=_decoder(_Catalogs(catalogs)))
+
+
+def _legacy_loads(data):
+    if data.startswith(b'{'):
+        return serializers.JSONSerializer().loads(data)
+    return serializers.PickleSerializer().loads(data)
+
+
+def size_report(session):
+    """Return the serialized size of every key of a session.
+
+    Returns a list of ``(key, pickle_size, compact_size)`` tuples, largest
+    first, where the sizes are the number of bytes the pickle serializer
+    and :class:`CompactSerializer` need for a session holding just that
+    key.
+    """
+    pickled = serializers.PickleSerializer()
+    compact = CompactSerializer()
+    report = [(key, len(pickled.dumps({key: value})),
+               len(compact.dumps({key: value})))
+              for key, value in six.iteritems(session)]
+    return sorted(report, key=lambda row: (-row[1], row[0]))
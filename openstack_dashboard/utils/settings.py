@@ -18,6 +18,7 @@ import pkgutil
 import six
 
 from horizon.utils import file_discovery as fd
+from horizon.utils import startup
 
 
 def import_submodules(module):
@@ -41,7 +42,9 @@ def import_dashboard_config(modules):
     """Imports configuration from all the modules and merges it."""
     config = collections.defaultdict(dict)
     for module in modules:
-        for key, submodule in six.iteritems(import_submodules(module)):
+        with startup.timed('import %s' % module.__name__):
+            submodules = import_submodules(module)
+        for key, submodule in six.iteritems(submodules):
             if hasattr(submodule, 'DASHBOARD'):
                 dashboard = submodule.DASHBOARD
                 config[dashboard].update(submodule.__dict__)
@@ -119,9 +122,10 @@ def update_dashboards(modules, horizon_config, installed_apps):
 
         if config.get('AUTO_DISCOVER_STATIC_FILES', False):
             for _app in _apps:
-                module = import_module(_app)
-                base_path = os.path.join(module.__path__[0], 'static/')
-                fd.populate_horizon_config(horizon_config, base_path)
+                with startup.timed('static files discovery of %s' % _app):
+                    module = import_module(_app)
+                    base_path = os.path.join(module.__path__[0], 'static/')
+                    fd.populate_horizon_config(horizon_config, base_path)
 
         add_exceptions = six.iteritems(config.get('ADD_EXCEPTIONS', {}))
         for category, exc_list in add_exceptions: